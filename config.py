@@ -18,6 +18,8 @@ from pydantic_settings import BaseSettings, CliPositionalArg, SettingsConfigDict
 
 from pose.camera import CameraConfig
 from pose.model import PoseModelConfig
+from script.output import OutputConfig
+from script.pipeline import PipelineConfig
 
 
 class Config(BaseSettings, cli_parse_args=True, cli_hide_none_type=True):
@@ -25,6 +27,8 @@ class Config(BaseSettings, cli_parse_args=True, cli_hide_none_type=True):
 
     camera: CameraConfig = CameraConfig()
     pose: PoseModelConfig = PoseModelConfig()
+    pipeline: PipelineConfig = PipelineConfig()
+    output: OutputConfig = OutputConfig()
 
     show_camera: bool = Field(
         True,
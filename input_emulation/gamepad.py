@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
 #
 # This file is part of PosePIE.
 #
@@ -14,12 +14,32 @@
 # not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
+import operator
 
 from typing import Any
 
 import vgamepad as vg
 
 
+GAMEPAD_BUTTONS: dict[str, Any] = {
+    "button_a": vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
+    "button_b": vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
+    "button_x": vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
+    "button_y": vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
+    "button_lb": vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
+    "button_rb": vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
+    "button_lsb": vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB,
+    "button_rsb": vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,
+    "button_start": vg.XUSB_BUTTON.XUSB_GAMEPAD_START,
+    "button_back": vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,
+    "button_guide": vg.XUSB_BUTTON.XUSB_GAMEPAD_GUIDE,
+    "dpad_up": vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
+    "dpad_down": vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
+    "dpad_left": vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
+    "dpad_right": vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
+}
+
+
 @dataclass
 class _Stick:
     x: float = 0.0
@@ -53,6 +73,14 @@ class Gamepad:
         self.dpad_left: bool = False
         self.dpad_right: bool = False
 
+        self.reports_sent = 0
+        """Number of updates that sent a report, because the state of the gamepad changed"""
+        self.reports_suppressed = 0
+        """Number of updates that did not send a report, because the state of the gamepad did not change"""
+
+        self._get_button_states = operator.attrgetter(*GAMEPAD_BUTTONS)
+        self._old_state: tuple[Any, ...] | None = None
+
     def _set_button(self, button: Any, state: bool) -> None:
         if state:
             self._vg.press_button(button)
@@ -60,25 +88,39 @@ class Gamepad:
             self._vg.release_button(button)
 
     def update(self) -> None:
-        self._vg.left_joystick_float(x_value_float=self.stick_left.x, y_value_float=self.stick_left.y)
-        self._vg.right_joystick_float(x_value_float=self.stick_right.x, y_value_float=self.stick_right.y)
-        self._vg.left_trigger_float(value_float=1.0 if self.button_lt else self.left_trigger)
-        self._vg.right_trigger_float(value_float=1.0 if self.button_rt else self.right_trigger)
-
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_A, self.button_a)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_B, self.button_b)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_X, self.button_x)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_Y, self.button_y)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER, self.button_lb)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER, self.button_rb)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB, self.button_lsb)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB, self.button_rsb)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_START, self.button_start)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK, self.button_back)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_GUIDE, self.button_guide)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP, self.dpad_up)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN, self.dpad_down)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT, self.dpad_left)
-        self._set_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT, self.dpad_right)
+        self.emit_state(self.get_state())
+
+    def get_state(self) -> tuple[Any, ...]:
+        """Returns the state of the sticks, triggers and buttons, which can be emitted later with `emit_state()`"""
+        left_trigger = 1.0 if self.button_lt else self.left_trigger
+        right_trigger = 1.0 if self.button_rt else self.right_trigger
+
+        return (
+            self.stick_left.x,
+            self.stick_left.y,
+            self.stick_right.x,
+            self.stick_right.y,
+            left_trigger,
+            right_trigger,
+            self._get_button_states(self),
+        )
+
+    def emit_state(self, state: tuple[Any, ...]) -> None:
+        # A report is only sent if the state changed since the last one
+        if state == self._old_state:
+            self.reports_suppressed += 1
+            return
+        self._old_state = state
+
+        stick_left_x, stick_left_y, stick_right_x, stick_right_y, left_trigger, right_trigger, button_states = state
+
+        self._vg.left_joystick_float(x_value_float=stick_left_x, y_value_float=stick_left_y)
+        self._vg.right_joystick_float(x_value_float=stick_right_x, y_value_float=stick_right_y)
+        self._vg.left_trigger_float(value_float=left_trigger)
+        self._vg.right_trigger_float(value_float=right_trigger)
+
+        for button, pressed in zip(GAMEPAD_BUTTONS.values(), button_states):
+            self._set_button(button, pressed)
 
         self._vg.update()
+        self.reports_sent += 1
@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
 #
 # This file is part of PosePIE.
 #
@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
+from typing import Any
+
 from input_emulation.gamepad import Gamepad
 from script.plugin import PluginBase
 
@@ -28,7 +30,13 @@ class GamepadPlugin(PluginBase):
         pass
 
     def post_update(self) -> None:
-        self._gamepad.update()
+        self.emit(self.snapshot())
+
+    def snapshot(self) -> tuple[Any, ...]:
+        return self._gamepad.get_state()
+
+    def emit(self, snapshot: tuple[Any, ...]) -> None:
+        self._gamepad.emit_state(snapshot)
 
     def destroy(self) -> None:
         pass
@@ -16,24 +16,130 @@
 from sys import platform
 
 if platform == "linux":
+    import operator
+
     import uinput
 
+    KEYBOARD_EVENTS: dict[str, tuple[int, int]] = {
+        "arrow_up": uinput.KEY_UP,
+        "arrow_down": uinput.KEY_DOWN,
+        "arrow_left": uinput.KEY_LEFT,
+        "arrow_right": uinput.KEY_RIGHT,
+        #
+        "enter": uinput.KEY_ENTER,
+        "backspace": uinput.KEY_BACKSPACE,
+        "esc": uinput.KEY_ESC,
+        "space": uinput.KEY_SPACE,
+        "ctrl_left": uinput.KEY_LEFTCTRL,
+        "ctrl_right": uinput.KEY_RIGHTCTRL,
+        "alt_left": uinput.KEY_LEFTALT,
+        "alt_right": uinput.KEY_RIGHTALT,
+        "shift_left": uinput.KEY_LEFTSHIFT,
+        "shift_right": uinput.KEY_RIGHTSHIFT,
+        "meta_left": uinput.KEY_LEFTMETA,
+        "meta_right": uinput.KEY_RIGHTMETA,
+        "menu": uinput.KEY_MENU,
+        "caps_lock": uinput.KEY_CAPSLOCK,
+        "tab": uinput.KEY_TAB,
+        #
+        "print_screen": uinput.KEY_PRINT,
+        "scroll_lock": uinput.KEY_SCROLLLOCK,
+        "pause": uinput.KEY_PAUSE,
+        "insert": uinput.KEY_INSERT,
+        "home": uinput.KEY_HOME,
+        "page_up": uinput.KEY_PAGEUP,
+        "delete": uinput.KEY_DELETE,
+        "end": uinput.KEY_END,
+        "page_down": uinput.KEY_PAGEDOWN,
+        #
+        "key_a": uinput.KEY_A,
+        "key_b": uinput.KEY_B,
+        "key_c": uinput.KEY_C,
+        "key_d": uinput.KEY_D,
+        "key_e": uinput.KEY_E,
+        "key_f": uinput.KEY_F,
+        "key_g": uinput.KEY_G,
+        "key_h": uinput.KEY_H,
+        "key_i": uinput.KEY_I,
+        "key_j": uinput.KEY_J,
+        "key_k": uinput.KEY_K,
+        "key_l": uinput.KEY_L,
+        "key_m": uinput.KEY_M,
+        "key_n": uinput.KEY_N,
+        "key_o": uinput.KEY_O,
+        "key_p": uinput.KEY_P,
+        "key_q": uinput.KEY_Q,
+        "key_r": uinput.KEY_R,
+        "key_s": uinput.KEY_S,
+        "key_t": uinput.KEY_T,
+        "key_u": uinput.KEY_U,
+        "key_v": uinput.KEY_V,
+        "key_w": uinput.KEY_W,
+        "key_x": uinput.KEY_X,
+        "key_y": uinput.KEY_Y,
+        "key_z": uinput.KEY_Z,
+        #
+        "num_0": uinput.KEY_0,
+        "num_1": uinput.KEY_1,
+        "num_2": uinput.KEY_2,
+        "num_3": uinput.KEY_3,
+        "num_4": uinput.KEY_4,
+        "num_5": uinput.KEY_5,
+        "num_6": uinput.KEY_6,
+        "num_7": uinput.KEY_7,
+        "num_8": uinput.KEY_8,
+        "num_9": uinput.KEY_9,
+        #
+        "backtick": uinput.KEY_GRAVE,
+        "minus": uinput.KEY_MINUS,
+        "equals": uinput.KEY_EQUAL,
+        "backslash": uinput.KEY_BACKSLASH,
+        "left_bracket": uinput.KEY_LEFTBRACE,
+        "right_bracket": uinput.KEY_RIGHTBRACE,
+        "semicolon": uinput.KEY_SEMICOLON,
+        "apostrophe": uinput.KEY_APOSTROPHE,
+        "comma": uinput.KEY_COMMA,
+        "dot": uinput.KEY_DOT,
+        "slash": uinput.KEY_SLASH,
+        #
+        "f1": uinput.KEY_F1,
+        "f2": uinput.KEY_F2,
+        "f3": uinput.KEY_F3,
+        "f4": uinput.KEY_F4,
+        "f5": uinput.KEY_F5,
+        "f6": uinput.KEY_F6,
+        "f7": uinput.KEY_F7,
+        "f8": uinput.KEY_F8,
+        "f9": uinput.KEY_F9,
+        "f10": uinput.KEY_F10,
+        "f11": uinput.KEY_F11,
+        "f12": uinput.KEY_F12,
+        #
+        "numpad_lock": uinput.KEY_NUMLOCK,
+        "numpad_0": uinput.KEY_KP0,
+        "numpad_1": uinput.KEY_KP1,
+        "numpad_2": uinput.KEY_KP2,
+        "numpad_3": uinput.KEY_KP3,
+        "numpad_4": uinput.KEY_KP4,
+        "numpad_5": uinput.KEY_KP5,
+        "numpad_6": uinput.KEY_KP6,
+        "numpad_7": uinput.KEY_KP7,
+        "numpad_8": uinput.KEY_KP8,
+        "numpad_9": uinput.KEY_KP9,
+        "numpad_decimal": uinput.KEY_KPDOT,
+        "numpad_divide": uinput.KEY_KPSLASH,
+        "numpad_multiply": uinput.KEY_KPASTERISK,
+        "numpad_subtract": uinput.KEY_KPMINUS,
+        "numpad_add": uinput.KEY_KPPLUS,
+        "numpad_enter": uinput.KEY_KPENTER,
+    }
+
     class Keyboard:
         def __init__(self) -> None:
-            events = []
-
             self.arrow_up: bool = False
             self.arrow_down: bool = False
             self.arrow_left: bool = False
             self.arrow_right: bool = False
-            events.extend(
-                [
-                    uinput.KEY_UP,
-                    uinput.KEY_DOWN,
-                    uinput.KEY_LEFT,
-                    uinput.KEY_RIGHT,
-                ]
-            )
 
             self.enter: bool = False
             self.backspace: bool = False
@@ -50,25 +156,6 @@ if platform == "linux":
             self.menu: bool = False
             self.caps_lock: bool = False
             self.tab: bool = False
-            events.extend(
-                [
-                    uinput.KEY_ENTER,
-                    uinput.KEY_BACKSPACE,
-                    uinput.KEY_ESC,
-                    uinput.KEY_SPACE,
-                    uinput.KEY_LEFTCTRL,
-                    uinput.KEY_RIGHTCTRL,
-                    uinput.KEY_LEFTALT,
-                    uinput.KEY_RIGHTALT,
-                    uinput.KEY_LEFTSHIFT,
-                    uinput.KEY_RIGHTSHIFT,
-                    uinput.KEY_LEFTMETA,
-                    uinput.KEY_RIGHTMETA,
-                    uinput.KEY_MENU,
-                    uinput.KEY_CAPSLOCK,
-                    uinput.KEY_TAB,
-                ]
-            )
 
             self.print_screen: bool = False
             self.scroll_lock: bool = False
@@ -79,19 +166,6 @@ if platform == "linux":
             self.delete: bool = False
             self.end: bool = False
             self.page_down: bool = False
-            events.extend(
-                [
-                    uinput.KEY_PRINT,
-                    uinput.KEY_SCROLLLOCK,
-                    uinput.KEY_PAUSE,
-                    uinput.KEY_INSERT,
-                    uinput.KEY_HOME,
-                    uinput.KEY_PAGEUP,
-                    uinput.KEY_DELETE,
-                    uinput.KEY_END,
-                    uinput.KEY_PAGEDOWN,
-                ]
-            )
 
             self.key_a: bool = False
             self.key_b: bool = False
@@ -119,36 +193,6 @@ if platform == "linux":
             self.key_x: bool = False
             self.key_y: bool = False
             self.key_z: bool = False
-            events.extend(
-                [
-                    uinput.KEY_A,
-                    uinput.KEY_B,
-                    uinput.KEY_C,
-                    uinput.KEY_D,
-                    uinput.KEY_E,
-                    uinput.KEY_F,
-                    uinput.KEY_G,
-                    uinput.KEY_H,
-                    uinput.KEY_I,
-                    uinput.KEY_J,
-                    uinput.KEY_K,
-                    uinput.KEY_L,
-                    uinput.KEY_M,
-                    uinput.KEY_N,
-                    uinput.KEY_O,
-                    uinput.KEY_P,
-                    uinput.KEY_Q,
-                    uinput.KEY_R,
-                    uinput.KEY_S,
-                    uinput.KEY_T,
-                    uinput.KEY_U,
-                    uinput.KEY_V,
-                    uinput.KEY_W,
-                    uinput.KEY_X,
-                    uinput.KEY_Y,
-                    uinput.KEY_Z,
-                ]
-            )
 
             self.num_0: bool = False
             self.num_1: bool = False
@@ -160,20 +204,6 @@ if platform == "linux":
             self.num_7: bool = False
             self.num_8: bool = False
             self.num_9: bool = False
-            events.extend(
-                [
-                    uinput.KEY_0,
-                    uinput.KEY_1,
-                    uinput.KEY_2,
-                    uinput.KEY_3,
-                    uinput.KEY_4,
-                    uinput.KEY_5,
-                    uinput.KEY_6,
-                    uinput.KEY_7,
-                    uinput.KEY_8,
-                    uinput.KEY_9,
-                ]
-            )
 
             self.backtick: bool = False
             self.minus: bool = False
@@ -186,21 +216,6 @@ if platform == "linux":
             self.comma: bool = False
             self.dot: bool = False
             self.slash: bool = False
-            events.extend(
-                [
-                    uinput.KEY_GRAVE,
-                    uinput.KEY_MINUS,
-                    uinput.KEY_EQUAL,
-                    uinput.KEY_BACKSLASH,
-                    uinput.KEY_LEFTBRACE,
-                    uinput.KEY_RIGHTBRACE,
-                    uinput.KEY_SEMICOLON,
-                    uinput.KEY_APOSTROPHE,
-                    uinput.KEY_COMMA,
-                    uinput.KEY_DOT,
-                    uinput.KEY_SLASH,
-                ]
-            )
 
             self.f1: bool = False
             self.f2: bool = False
@@ -214,22 +229,6 @@ if platform == "linux":
             self.f10: bool = False
             self.f11: bool = False
             self.f12: bool = False
-            events.extend(
-                [
-                    uinput.KEY_F1,
-                    uinput.KEY_F2,
-                    uinput.KEY_F3,
-                    uinput.KEY_F4,
-                    uinput.KEY_F5,
-                    uinput.KEY_F6,
-                    uinput.KEY_F7,
-                    uinput.KEY_F8,
-                    uinput.KEY_F9,
-                    uinput.KEY_F10,
-                    uinput.KEY_F11,
-                    uinput.KEY_F12,
-                ]
-            )
 
             self.numpad_lock: bool = False
             self.numpad_0: bool = False
@@ -248,147 +247,34 @@ if platform == "linux":
             self.numpad_subtract: bool = False
             self.numpad_add: bool = False
             self.numpad_enter: bool = False
-            events.extend(
-                [
-                    uinput.KEY_NUMLOCK,
-                    uinput.KEY_KP0,
-                    uinput.KEY_KP1,
-                    uinput.KEY_KP2,
-                    uinput.KEY_KP3,
-                    uinput.KEY_KP4,
-                    uinput.KEY_KP5,
-                    uinput.KEY_KP6,
-                    uinput.KEY_KP7,
-                    uinput.KEY_KP8,
-                    uinput.KEY_KP9,
-                    uinput.KEY_KPDOT,
-                    uinput.KEY_KPSLASH,
-                    uinput.KEY_KPASTERISK,
-                    uinput.KEY_KPMINUS,
-                    uinput.KEY_KPPLUS,
-                    uinput.KEY_KPENTER,
-                ]
-            )
-
-            self._device = uinput.Device(events)
+
+            self._get_key_states = operator.attrgetter(*KEYBOARD_EVENTS)
+            self._old_key_states: tuple[bool, ...] = self._get_key_states(self)
+
+            self._device = uinput.Device(list(KEYBOARD_EVENTS.values()))
 
         def reset(self) -> None:
             pass
 
         def update(self) -> None:
-            self._device.emit(uinput.KEY_UP, int(self.arrow_up), syn=False)
-            self._device.emit(uinput.KEY_DOWN, int(self.arrow_down), syn=False)
-            self._device.emit(uinput.KEY_LEFT, int(self.arrow_left), syn=False)
-            self._device.emit(uinput.KEY_RIGHT, int(self.arrow_right), syn=False)
-
-            self._device.emit(uinput.KEY_ENTER, int(self.enter), syn=False)
-            self._device.emit(uinput.KEY_BACKSPACE, int(self.backspace), syn=False)
-            self._device.emit(uinput.KEY_ESC, int(self.esc), syn=False)
-            self._device.emit(uinput.KEY_SPACE, int(self.space), syn=False)
-            self._device.emit(uinput.KEY_LEFTCTRL, int(self.ctrl_left), syn=False)
-            self._device.emit(uinput.KEY_RIGHTCTRL, int(self.ctrl_right), syn=False)
-            self._device.emit(uinput.KEY_LEFTALT, int(self.alt_left), syn=False)
-            self._device.emit(uinput.KEY_RIGHTALT, int(self.alt_right), syn=False)
-            self._device.emit(uinput.KEY_LEFTSHIFT, int(self.shift_left), syn=False)
-            self._device.emit(uinput.KEY_RIGHTSHIFT, int(self.shift_right), syn=False)
-            self._device.emit(uinput.KEY_LEFTMETA, int(self.meta_left), syn=False)
-            self._device.emit(uinput.KEY_RIGHTMETA, int(self.meta_right), syn=False)
-            self._device.emit(uinput.KEY_MENU, int(self.menu), syn=False)
-            self._device.emit(uinput.KEY_CAPSLOCK, int(self.caps_lock), syn=False)
-            self._device.emit(uinput.KEY_TAB, int(self.tab), syn=False)
-
-            self._device.emit(uinput.KEY_PRINT, int(self.print_screen), syn=False)
-            self._device.emit(uinput.KEY_SCROLLLOCK, int(self.scroll_lock), syn=False)
-            self._device.emit(uinput.KEY_PAUSE, int(self.pause), syn=False)
-            self._device.emit(uinput.KEY_INSERT, int(self.insert), syn=False)
-            self._device.emit(uinput.KEY_HOME, int(self.home), syn=False)
-            self._device.emit(uinput.KEY_PAGEUP, int(self.page_up), syn=False)
-            self._device.emit(uinput.KEY_DELETE, int(self.delete), syn=False)
-            self._device.emit(uinput.KEY_END, int(self.end), syn=False)
-            self._device.emit(uinput.KEY_PAGEDOWN, int(self.page_down), syn=False)
-
-            self._device.emit(uinput.KEY_A, int(self.key_a), syn=False)
-            self._device.emit(uinput.KEY_B, int(self.key_b), syn=False)
-            self._device.emit(uinput.KEY_C, int(self.key_c), syn=False)
-            self._device.emit(uinput.KEY_D, int(self.key_d), syn=False)
-            self._device.emit(uinput.KEY_E, int(self.key_e), syn=False)
-            self._device.emit(uinput.KEY_F, int(self.key_f), syn=False)
-            self._device.emit(uinput.KEY_G, int(self.key_g), syn=False)
-            self._device.emit(uinput.KEY_H, int(self.key_h), syn=False)
-            self._device.emit(uinput.KEY_I, int(self.key_i), syn=False)
-            self._device.emit(uinput.KEY_J, int(self.key_j), syn=False)
-            self._device.emit(uinput.KEY_K, int(self.key_k), syn=False)
-            self._device.emit(uinput.KEY_L, int(self.key_l), syn=False)
-            self._device.emit(uinput.KEY_M, int(self.key_m), syn=False)
-            self._device.emit(uinput.KEY_N, int(self.key_n), syn=False)
-            self._device.emit(uinput.KEY_O, int(self.key_o), syn=False)
-            self._device.emit(uinput.KEY_P, int(self.key_p), syn=False)
-            self._device.emit(uinput.KEY_Q, int(self.key_q), syn=False)
-            self._device.emit(uinput.KEY_R, int(self.key_r), syn=False)
-            self._device.emit(uinput.KEY_S, int(self.key_s), syn=False)
-            self._device.emit(uinput.KEY_T, int(self.key_t), syn=False)
-            self._device.emit(uinput.KEY_U, int(self.key_u), syn=False)
-            self._device.emit(uinput.KEY_V, int(self.key_v), syn=False)
-            self._device.emit(uinput.KEY_W, int(self.key_w), syn=False)
-            self._device.emit(uinput.KEY_X, int(self.key_x), syn=False)
-            self._device.emit(uinput.KEY_Y, int(self.key_y), syn=False)
-            self._device.emit(uinput.KEY_Z, int(self.key_z), syn=False)
-
-            self._device.emit(uinput.KEY_0, int(self.num_0), syn=False)
-            self._device.emit(uinput.KEY_1, int(self.num_1), syn=False)
-            self._device.emit(uinput.KEY_2, int(self.num_2), syn=False)
-            self._device.emit(uinput.KEY_3, int(self.num_3), syn=False)
-            self._device.emit(uinput.KEY_4, int(self.num_4), syn=False)
-            self._device.emit(uinput.KEY_5, int(self.num_5), syn=False)
-            self._device.emit(uinput.KEY_6, int(self.num_6), syn=False)
-            self._device.emit(uinput.KEY_7, int(self.num_7), syn=False)
-            self._device.emit(uinput.KEY_8, int(self.num_8), syn=False)
-            self._device.emit(uinput.KEY_9, int(self.num_9), syn=False)
-
-            self._device.emit(uinput.KEY_GRAVE, int(self.backtick), syn=False)
-            self._device.emit(uinput.KEY_MINUS, int(self.minus), syn=False)
-            self._device.emit(uinput.KEY_EQUAL, int(self.equals), syn=False)
-            self._device.emit(uinput.KEY_BACKSLASH, int(self.backslash), syn=False)
-            self._device.emit(uinput.KEY_LEFTBRACE, int(self.left_bracket), syn=False)
-            self._device.emit(uinput.KEY_RIGHTBRACE, int(self.right_bracket), syn=False)
-            self._device.emit(uinput.KEY_SEMICOLON, int(self.semicolon), syn=False)
-            self._device.emit(uinput.KEY_APOSTROPHE, int(self.apostrophe), syn=False)
-            self._device.emit(uinput.KEY_COMMA, int(self.comma), syn=False)
-            self._device.emit(uinput.KEY_DOT, int(self.dot), syn=False)
-            self._device.emit(uinput.KEY_SLASH, int(self.slash), syn=False)
-
-            self._device.emit(uinput.KEY_F1, int(self.f1), syn=False)
-            self._device.emit(uinput.KEY_F2, int(self.f2), syn=False)
-            self._device.emit(uinput.KEY_F3, int(self.f3), syn=False)
-            self._device.emit(uinput.KEY_F4, int(self.f4), syn=False)
-            self._device.emit(uinput.KEY_F5, int(self.f5), syn=False)
-            self._device.emit(uinput.KEY_F6, int(self.f6), syn=False)
-            self._device.emit(uinput.KEY_F7, int(self.f7), syn=False)
-            self._device.emit(uinput.KEY_F8, int(self.f8), syn=False)
-            self._device.emit(uinput.KEY_F9, int(self.f9), syn=False)
-            self._device.emit(uinput.KEY_F10, int(self.f10), syn=False)
-            self._device.emit(uinput.KEY_F11, int(self.f11), syn=False)
-            self._device.emit(uinput.KEY_F12, int(self.f12), syn=False)
-
-            self._device.emit(uinput.KEY_NUMLOCK, int(self.numpad_lock), syn=False)
-            self._device.emit(uinput.KEY_KP0, int(self.numpad_0), syn=False)
-            self._device.emit(uinput.KEY_KP1, int(self.numpad_1), syn=False)
-            self._device.emit(uinput.KEY_KP2, int(self.numpad_2), syn=False)
-            self._device.emit(uinput.KEY_KP3, int(self.numpad_3), syn=False)
-            self._device.emit(uinput.KEY_KP4, int(self.numpad_4), syn=False)
-            self._device.emit(uinput.KEY_KP5, int(self.numpad_5), syn=False)
-            self._device.emit(uinput.KEY_KP6, int(self.numpad_6), syn=False)
-            self._device.emit(uinput.KEY_KP7, int(self.numpad_7), syn=False)
-            self._device.emit(uinput.KEY_KP8, int(self.numpad_8), syn=False)
-            self._device.emit(uinput.KEY_KP9, int(self.numpad_9), syn=False)
-            self._device.emit(uinput.KEY_KPDOT, int(self.numpad_decimal), syn=False)
-            self._device.emit(uinput.KEY_KPSLASH, int(self.numpad_divide), syn=False)
-            self._device.emit(uinput.KEY_KPASTERISK, int(self.numpad_multiply), syn=False)
-            self._device.emit(uinput.KEY_KPMINUS, int(self.numpad_subtract), syn=False)
-            self._device.emit(uinput.KEY_KPPLUS, int(self.numpad_add), syn=False)
-            self._device.emit(uinput.KEY_KPENTER, int(self.numpad_enter), syn=False)
+            self.emit_state(self.get_state())
+
+        def get_state(self) -> tuple[bool, ...]:
+            """Returns the states of all keys, which can be emitted later with `emit_state()`"""
+            key_states: tuple[bool, ...] = self._get_key_states(self)
+            return key_states
+
+        def emit_state(self, key_states: tuple[bool, ...]) -> None:
+            # Only the keys that changed since the last emitted state are emitted, which usually are none
+            if key_states == self._old_key_states:
+                return
+
+            for event, pressed, old_pressed in zip(KEYBOARD_EVENTS.values(), key_states, self._old_key_states):
+                if pressed != old_pressed:
+                    self._device.emit(event, int(pressed), syn=False)
 
             self._device.syn()
+            self._old_key_states = key_states
 
 elif platform == "win32":
     from typing import Generator
@@ -624,8 +510,7 @@ elif platform == "win32":
             self.numpad_add: bool = False
             self.numpad_enter: bool = False
 
-            self._old_key_states: dict[str, bool] = {}
-            self.reset()
+            self._old_key_states: dict[str, bool] = dict(self._get_keys())
 
         def _get_keys(self) -> Generator[tuple[str, bool], None, None]:
             for name, obj in self.__dict__.items():
@@ -635,14 +520,23 @@ elif platform == "win32":
                 yield name, obj
 
         def reset(self) -> None:
-            for key, pressed in self._get_keys():
-                self._old_key_states[key] = pressed
+            pass
 
         def update(self) -> None:
-            for key, pressed in self._get_keys():
+            self.emit_state(self.get_state())
+
+        def get_state(self) -> dict[str, bool]:
+            """Returns the states of all keys, which can be emitted later with `emit_state()`"""
+            return dict(self._get_keys())
+
+        def emit_state(self, key_states: dict[str, bool]) -> None:
+            # Only the keys that changed since the last emitted state are emitted
+            for key, pressed in key_states.items():
                 if pressed != self._old_key_states[key]:
                     win32api.keybd_event(KEYBOARD_SCANCODES[key], 0, 0 if pressed else win32con.KEYEVENTF_KEYUP, 0)
 
+            self._old_key_states = key_states
+
 else:
 
     class Keyboard:  # type: ignore[no-redef]
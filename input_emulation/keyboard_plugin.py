@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
 #
 # This file is part of PosePIE.
 #
@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
+from typing import Any
+
 from input_emulation.keyboard import Keyboard
 from script.plugin import PluginBase
 
@@ -28,7 +30,13 @@ class KeyboardPlugin(PluginBase):
         self._keyboard.reset()
 
     def post_update(self) -> None:
-        self._keyboard.update()
+        self.emit(self.snapshot())
+
+    def snapshot(self) -> Any:
+        return self._keyboard.get_state()
+
+    def emit(self, snapshot: Any) -> None:
+        self._keyboard.emit_state(snapshot)
 
     def destroy(self) -> None:
         pass
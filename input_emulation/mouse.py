@@ -54,22 +54,34 @@ if platform == "linux":
 
             self._device = uinput.Device(events)
 
+        @property
+        def absolute(self) -> bool:
+            """Whether the mouse is in absolute mode"""
+            return self._absolute
+
         def update(self) -> None:
+            movement = self.move_absolute if self._absolute else self.move_relative
+            self.emit(movement.x, movement.y, self.button_left, self.button_right)
+
+        def emit(self, x: float, y: float, button_left: bool, button_right: bool) -> None:
+            """Emits a movement and the states of the buttons without using the attributes
+
+            :param x: normalized position in absolute mode or movement in pixels in relative mode
+            :param y: normalized position in absolute mode or movement in pixels in relative mode
+            """
             if self._absolute:
-                self._device.emit(uinput.ABS_X, int(np.clip(int(self.move_absolute.x * ABS_MAX), 0, ABS_MAX)), syn=False)
-                self._device.emit(uinput.ABS_Y, int(np.clip(int(self.move_absolute.y * ABS_MAX), 0, ABS_MAX)), syn=False)
+                self._device.emit(uinput.ABS_X, int(np.clip(int(x * ABS_MAX), 0, ABS_MAX)), syn=False)
+                self._device.emit(uinput.ABS_Y, int(np.clip(int(y * ABS_MAX), 0, ABS_MAX)), syn=False)
             else:
-                self._device.emit(uinput.REL_X, int(self.move_relative.x), syn=False)
-                self._device.emit(uinput.REL_Y, int(self.move_relative.y), syn=False)
+                self._device.emit(uinput.REL_X, int(x), syn=False)
+                self._device.emit(uinput.REL_Y, int(y), syn=False)
 
-            self._device.emit(uinput.BTN_LEFT, int(self.button_left), syn=False)
-            self._device.emit(uinput.BTN_RIGHT, int(self.button_right), syn=False)
+            self._device.emit(uinput.BTN_LEFT, int(button_left), syn=False)
+            self._device.emit(uinput.BTN_RIGHT, int(button_right), syn=False)
 
             self._device.syn()
 
 elif platform == "win32":
-    import copy
-
     import win32api
     import win32con
 
@@ -81,7 +93,7 @@ elif platform == "win32":
 
             if self._absolute:
                 self.move_absolute = _Movement()
-                self._move_absolute_old = copy.copy(self.move_absolute)
+                self._move_absolute_old = (self.move_absolute.x, self.move_absolute.y)
             else:
                 self.move_relative = _Movement()
 
@@ -90,30 +102,44 @@ elif platform == "win32":
             self.button_right: bool = False
             self._button_right_old = self.button_right
 
+        @property
+        def absolute(self) -> bool:
+            """Whether the mouse is in absolute mode"""
+            return self._absolute
+
         def update(self) -> None:
+            movement = self.move_absolute if self._absolute else self.move_relative
+            self.emit(movement.x, movement.y, self.button_left, self.button_right)
+
+        def emit(self, x: float, y: float, button_left: bool, button_right: bool) -> None:
+            """Emits a movement and the states of the buttons without using the attributes
+
+            :param x: normalized position in absolute mode or movement in pixels in relative mode
+            :param y: normalized position in absolute mode or movement in pixels in relative mode
+            """
             flags: int = 0
 
-            if self.button_left != self._button_left_old:
-                flags |= win32con.MOUSEEVENTF_LEFTDOWN if self.button_left else win32con.MOUSEEVENTF_LEFTUP
-                self._button_left_old = self.button_left
-            if self.button_right != self._button_right_old:
-                flags |= win32con.MOUSEEVENTF_RIGHTDOWN if self.button_left else win32con.MOUSEEVENTF_RIGHTUP
-                self._button_right_old = self.button_right
+            if button_left != self._button_left_old:
+                flags |= win32con.MOUSEEVENTF_LEFTDOWN if button_left else win32con.MOUSEEVENTF_LEFTUP
+                self._button_left_old = button_left
+            if button_right != self._button_right_old:
+                flags |= win32con.MOUSEEVENTF_RIGHTDOWN if button_right else win32con.MOUSEEVENTF_RIGHTUP
+                self._button_right_old = button_right
 
             if self._absolute:
-                if self.move_absolute != self._move_absolute_old:
+                if (x, y) != self._move_absolute_old:
                     win32api.mouse_event(
                         win32con.MOUSEEVENTF_MOVE | win32con.MOUSEEVENTF_ABSOLUTE | flags,
-                        int(np.clip(int(self.move_absolute.x * ABS_MAX), 0, ABS_MAX)),
-                        int(np.clip(int(self.move_absolute.y * ABS_MAX), 0, ABS_MAX)),
+                        int(np.clip(int(x * ABS_MAX), 0, ABS_MAX)),
+                        int(np.clip(int(y * ABS_MAX), 0, ABS_MAX)),
                     )
 
-                self._move_absolute_old = copy.copy(self.move_absolute)
+                self._move_absolute_old = (x, y)
             else:
                 win32api.mouse_event(
                     win32con.MOUSEEVENTF_MOVE | flags,
-                    int(self.move_relative.x),
-                    int(self.move_relative.y),
+                    int(x),
+                    int(y),
                 )
 
 else:
@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import math
+
+MAX_INTERPOLATION_INTERVAL = 0.1
+
+
+class MouseInterpolator:
+    """Interpolates the mouse movement between the updates of the script, so the mouse can be moved at a higher rate
+
+    In absolute mode, the position moves linearly to the latest target within the time between the last two updates,
+    which delays it by up to one update.
+    In relative mode, the latest movement is spread over the same time and the fractions of pixels are accumulated,
+    so no movement is lost.
+    The interpolation takes at most `max_interval` seconds, so the mouse does not lag behind after a pause of the updates.
+
+    >>> interpolator = MouseInterpolator(absolute=True, max_interval=1.0)
+    >>> interpolator.set_target(0.0, 0.0, 0.0)
+    >>> interpolator.set_target(1.0, 0.5, 1.0)
+    >>> interpolator.sample(1.5)
+    (0.5, 0.25)
+    >>> interpolator.sample(3.0)
+    (1.0, 0.5)
+
+    >>> interpolator = MouseInterpolator(absolute=False, max_interval=1.0)
+    >>> interpolator.set_target(0.0, 0.0, 0.0)
+    >>> interpolator.set_target(4.0, 2.0, 1.0)
+    >>> [interpolator.sample(1.0 + 0.25 * i) for i in range(1, 5)]
+    [(1.0, 0.0), (1.0, 1.0), (1.0, 0.0), (1.0, 1.0)]
+    """
+
+    def __init__(self, absolute: bool, max_interval: float = MAX_INTERPOLATION_INTERVAL) -> None:
+        self._absolute = absolute
+        self._max_interval = max_interval
+
+        self._start = (0.0, 0.0)
+        self._target = (0.0, 0.0)
+        self._timestamp: float | None = None
+        self._interval = 0.0
+
+        self._progress = 1.0
+        self._remainder = (0.0, 0.0)
+
+    def _get_progress(self, timestamp: float) -> float:
+        if self._timestamp is None or self._interval <= 0.0:
+            return 1.0
+
+        return min(max((timestamp - self._timestamp) / self._interval, 0.0), 1.0)
+
+    def _interpolate(self, progress: float) -> tuple[float, float]:
+        return (
+            self._start[0] + (self._target[0] - self._start[0]) * progress,
+            self._start[1] + (self._target[1] - self._start[1]) * progress,
+        )
+
+    def set_target(self, x: float, y: float, timestamp: float) -> None:
+        """Sets the position in absolute mode or the movement in relative mode of an update of the script at the timestamp"""
+        if self._absolute:
+            # The position moves on from where it currently is, so it does not jump if the updates are irregular
+            self._start = self._interpolate(self._get_progress(timestamp)) if self._timestamp is not None else (x, y)
+        else:
+            # Movement that has not been sampled yet is carried over
+            self._remainder = (
+                self._remainder[0] + self._target[0] * (1.0 - self._progress),
+                self._remainder[1] + self._target[1] * (1.0 - self._progress),
+            )
+            self._progress = 0.0
+
+        self._interval = 0.0 if self._timestamp is None else min(timestamp - self._timestamp, self._max_interval)
+        self._target = (x, y)
+        self._timestamp = timestamp
+
+    def sample(self, timestamp: float) -> tuple[float, float]:
+        """Returns the position in absolute mode or the movement in whole pixels since the last sample in relative mode"""
+        progress = self._get_progress(timestamp)
+        if self._absolute:
+            return self._interpolate(progress)
+
+        step = progress - self._progress
+        self._progress = progress
+        x = self._remainder[0] + self._target[0] * step
+        y = self._remainder[1] + self._target[1] * step
+        movement = (float(math.trunc(x)), float(math.trunc(y)))
+        self._remainder = (x - movement[0], y - movement[1])
+
+        return movement
@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
 #
 # This file is part of PosePIE.
 #
@@ -13,22 +13,79 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
+import threading
+import time
+
 from input_emulation.mouse import Mouse
+from input_emulation.mouse_interpolation import MouseInterpolator
 from script.plugin import PluginBase
 
 
 class MousePlugin(PluginBase):
-    def __init__(self, mouse: Mouse):
+    """Emits the inputs of a mouse after each update of the script or at a higher rate on a separate thread
+
+    With an output rate, the movement is interpolated between the updates, so the mouse moves smoothly at a low frame rate.
+    """
+
+    def __init__(self, mouse: Mouse, output_rate: float | None = None):
+        assert output_rate is None or output_rate > 0.0
+
         self._mouse = mouse
+        self._absolute = mouse.absolute
+        self._output_rate = output_rate
+
+        self._interpolator = MouseInterpolator(mouse.absolute)
+        self._button_left = False
+        self._button_right = False
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
 
     def create(self) -> None:
-        pass
+        if self._output_rate is not None:
+            self._thread = threading.Thread(target=self._output, args=(1.0 / self._output_rate,), daemon=True)
+            self._thread.start()
 
     def pre_update(self) -> None:
         pass
 
     def post_update(self) -> None:
-        self._mouse.update()
+        self.emit(self.snapshot())
+
+    def snapshot(self) -> tuple[float, float, bool, bool]:
+        movement = self._mouse.move_absolute if self._absolute else self._mouse.move_relative
+        return (movement.x, movement.y, self._mouse.button_left, self._mouse.button_right)
+
+    def emit(self, snapshot: tuple[float, float, bool, bool]) -> None:
+        if self._thread is None:
+            self._mouse.emit(*snapshot)
+            return
+
+        x, y, button_left, button_right = snapshot
+        with self._lock:
+            self._interpolator.set_target(x, y, time.perf_counter())
+            self._button_left = button_left
+            self._button_right = button_right
 
     def destroy(self) -> None:
-        pass
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def _output(self, period: float) -> None:
+        last_output: tuple[float, float, bool, bool] | None = None
+
+        # Outputs are scheduled relative to the first one, so the rate does not drift
+        next_timestamp = time.perf_counter()
+        while not self._stopped.wait(max(next_timestamp - time.perf_counter(), 0.0)):
+            next_timestamp += period
+
+            with self._lock:
+                x, y = self._interpolator.sample(time.perf_counter())
+                output = (x, y, self._button_left, self._button_right)
+
+            # In relative mode, only movements are emitted, while the same position or buttons are not emitted again
+            if output != last_output or (not self._absolute and (x != 0.0 or y != 0.0)):
+                self._mouse.emit(*output)
+                last_output = output
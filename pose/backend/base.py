@@ -0,0 +1,131 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+
+from typing import Any
+
+import numpy as np
+
+from cv2.typing import MatLike
+import numpy.typing as npt
+
+
+@dataclass
+class PoseDetections:
+    """Persons detected in a single frame
+
+    All coordinates are given in pixels of the frame.
+    Detections of backends that do not track persons have no track IDs.
+    """
+
+    bboxes: npt.NDArray[np.float32]
+    """bounding boxes (N, 4) as x1, y1, x2, y2"""
+    scores: npt.NDArray[np.float32]
+    """bounding box confidences (N,)"""
+    keypoints: npt.NDArray[np.float32]
+    """keypoints (N, 17, 2) as x, y"""
+    keypoints_scores: npt.NDArray[np.float32]
+    """keypoint confidences (N, 17)"""
+    track_ids: npt.NDArray[np.int64] | None = None
+    """track IDs (N,)"""
+    speed: dict[str, float] = field(default_factory=dict)
+    """processing times in milliseconds (preprocess, inference, postprocess)"""
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    @classmethod
+    def empty(cls, speed: dict[str, float] | None = None) -> "PoseDetections":
+        return cls(
+            bboxes=np.empty((0, 4), dtype=np.float32),
+            scores=np.empty((0,), dtype=np.float32),
+            keypoints=np.empty((0, 17, 2), dtype=np.float32),
+            keypoints_scores=np.empty((0, 17), dtype=np.float32),
+            track_ids=np.empty((0,), dtype=np.int64),
+            speed=speed if speed is not None else {},
+        )
+
+
+class PoseTracker(ABC):
+    @abstractmethod
+    def update(self, detections: PoseDetections, frame: MatLike) -> PoseDetections:
+        """Assigns the detections of the next frame to tracks
+
+        Only detections that are assigned to a track are returned.
+        """
+        raise NotImplementedError
+
+
+class PoseBackend(ABC):
+    """Detects and tracks persons in frames
+
+    The tracker is passed in from outside, so multiple backends can share the same tracks.
+
+    Frames can be submitted for inference before the results of the previous frames are collected, which allows backends with
+    asynchronous inference to process multiple frames at the same time.
+    Backends without asynchronous inference process submitted frames immediately.
+    """
+
+    def __init__(self, tracker: PoseTracker) -> None:
+        self.max_pending_frames = 1
+        """Maximum number of frames that can be submitted before the result of the oldest one has to be collected"""
+
+        self._tracker = tracker
+        self._pending: deque[PoseDetections] = deque()
+
+    @abstractmethod
+    def predict(self, frame: MatLike) -> PoseDetections:
+        """Detects the persons in a frame without tracking them"""
+        raise NotImplementedError
+
+    def track(self, frame: MatLike) -> PoseDetections:
+        """Detects and tracks the persons in a frame
+
+        Only detections that are assigned to a track are returned.
+        """
+        return self._tracker.update(self.predict(frame), frame)
+
+    def submit(self, frame: MatLike) -> None:
+        """Starts detecting and tracking the persons in a frame
+
+        The frame must not be modified until its result is collected.
+        """
+        self._pending.append(self.track(frame))
+
+    def collect(self) -> PoseDetections:
+        """Returns the detections of the oldest submitted frame and waits for them if necessary"""
+        return self._pending.popleft()
+
+    def close(self) -> None:
+        """Releases the resources of the backend, after which no more frames can be submitted"""
+
+
+def export_model(model_path: Path, model: str, file_format: str, file_suffix: str, **kwargs: Any) -> Path:
+    """Exports an Ultralytics model once and returns the path of the cached export
+
+    The exported model is stored next to the PyTorch model in the models folder and reused at the next start.
+    """
+    export_path = model_path / f"{model}{file_suffix}"
+    if not os.path.exists(export_path):
+        from ultralytics import YOLO  # pylint: disable=import-outside-toplevel
+
+        YOLO(model_path / f"{model}.pt").export(format=file_format, batch=1, **kwargs)
+
+    return export_path
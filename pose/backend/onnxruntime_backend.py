@@ -0,0 +1,92 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+import time
+
+import numpy as np
+import onnxruntime as ort
+
+from cv2.typing import MatLike
+import numpy.typing as npt
+
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker, export_model
+from pose.backend.processing import decode_predictions, letterbox
+
+
+INT8_SUFFIX = "_int8.onnx"
+
+
+def export_onnx_model(model_path: Path, model: str, image_size: int) -> Path:
+    """Exports a model to ONNX once and returns the path of the cached export"""
+    return export_model(model_path, model, "onnx", ".onnx", imgsz=image_size, simplify=True)
+
+
+class OnnxRuntimeBackend(PoseBackend):
+    """Runs an exported ONNX model with ONNX Runtime on the CPU
+
+    Pre- and postprocessing are done with NumPy, so PyTorch is not used for processing frames.
+    """
+
+    def __init__(
+        self,
+        tracker: PoseTracker,
+        model_path: Path,
+        model: str,
+        image_size: int,
+        min_bbox_conf: float,
+        int8: bool = False,
+        num_threads: int | None = None,
+    ) -> None:
+        super().__init__(tracker)
+
+        self._image_size = image_size
+        self._min_bbox_conf = min_bbox_conf
+
+        if int8:
+            onnx_path = model_path / f"{model}{INT8_SUFFIX}"
+            if not onnx_path.exists():
+                raise FileNotFoundError(f"INT8 model {onnx_path} does not exist, it has to be created with quantize.py first")
+        else:
+            onnx_path = export_onnx_model(model_path, model, image_size)
+
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads is not None:
+            session_options.intra_op_num_threads = num_threads
+        self._session = ort.InferenceSession(str(onnx_path), session_options, providers=["CPUExecutionProvider"])
+        self._input_name = self._session.get_inputs()[0].name
+
+    def _infer(self, tensor: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+        outputs = self._session.run(None, {self._input_name: tensor})
+
+        return np.asarray(outputs[0], dtype=np.float32)
+
+    def predict(self, frame: MatLike) -> PoseDetections:
+        start = time.perf_counter()
+        tensor, scale, padding = letterbox(frame, self._image_size)
+        preprocessed = time.perf_counter()
+        predictions = self._infer(tensor)
+        inferred = time.perf_counter()
+        detections = decode_predictions(predictions, frame.shape, scale, padding, self._min_bbox_conf)
+        postprocessed = time.perf_counter()
+
+        detections.speed = {
+            "preprocess": (preprocessed - start) * 1000,
+            "inference": (inferred - preprocessed) * 1000,
+            "postprocess": (postprocessed - inferred) * 1000,
+        }
+
+        return detections
@@ -0,0 +1,127 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+import threading
+import time
+
+from typing import Optional
+
+import numpy as np
+import openvino as ov
+
+from cv2.typing import MatLike
+import numpy.typing as npt
+
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker, export_model
+from pose.backend.processing import decode_predictions, letterbox
+
+
+@dataclass
+class _InferJob:
+    frame: MatLike
+    scale: float
+    padding: tuple[int, int]
+    submitted: float
+    preprocessed: float
+    inferred: float = 0.0
+    predictions: Optional[npt.NDArray[np.float32]] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class OpenVinoBackend(PoseBackend):
+    """Runs an exported OpenVINO model on the CPU with asynchronous infer requests
+
+    Up to `num_requests` frames can be submitted at the same time, so the next frame is inferred while the result of the
+    current one is processed.
+    """
+
+    def __init__(
+        self,
+        tracker: PoseTracker,
+        model_path: Path,
+        model: str,
+        image_size: int,
+        min_bbox_conf: float,
+        num_requests: int = 2,
+    ) -> None:
+        super().__init__(tracker)
+        assert num_requests >= 1
+
+        self._image_size = image_size
+        self._min_bbox_conf = min_bbox_conf
+        self.max_pending_frames = num_requests
+
+        ir_path = export_model(model_path, model, "openvino", "_openvino_model", imgsz=image_size)
+
+        core = ov.Core()
+        compiled_model = core.compile_model(
+            ir_path / f"{model}.xml",
+            "CPU",
+            {"PERFORMANCE_HINT": "THROUGHPUT", "PERFORMANCE_HINT_NUM_REQUESTS": str(num_requests)},
+        )
+        self._infer_queue = ov.AsyncInferQueue(compiled_model, num_requests)
+        self._infer_queue.set_callback(self._on_inferred)
+
+        self._jobs: deque[_InferJob] = deque()
+
+    @staticmethod
+    def _on_inferred(request: ov.InferRequest, job: _InferJob) -> None:
+        try:
+            job.inferred = time.perf_counter()
+            # The output tensor is reused by the next inference of the request
+            job.predictions = np.array(request.get_output_tensor(0).data, dtype=np.float32)
+        finally:
+            job.done.set()
+
+    def submit(self, frame: MatLike) -> None:
+        assert len(self._jobs) < self.max_pending_frames, "result of the oldest frame has to be collected first"
+
+        submitted = time.perf_counter()
+        tensor, scale, padding = letterbox(frame, self._image_size)
+        job = _InferJob(frame, scale, padding, submitted, time.perf_counter())
+
+        self._infer_queue.start_async({0: tensor}, job)
+        self._jobs.append(job)
+
+    def collect(self) -> PoseDetections:
+        job = self._jobs[0]
+        return self._tracker.update(self._collect_predictions(), job.frame)
+
+    def _collect_predictions(self) -> PoseDetections:
+        job = self._jobs.popleft()
+        job.done.wait()
+        if job.predictions is None:
+            raise RuntimeError("OpenVINO inference failed")
+
+        # Time waiting for the result is not counted, as it overlaps with processing the previous frame
+        collected = time.perf_counter()
+
+        detections = decode_predictions(job.predictions, job.frame.shape, job.scale, job.padding, self._min_bbox_conf)
+        detections.speed = {
+            "preprocess": (job.preprocessed - job.submitted) * 1000,
+            "inference": (job.inferred - job.preprocessed) * 1000,
+            "postprocess": (time.perf_counter() - max(collected, job.inferred)) * 1000,
+        }
+
+        return detections
+
+    def predict(self, frame: MatLike) -> PoseDetections:
+        assert not self._jobs, "results of submitted frames have to be collected first"
+
+        self.submit(frame)
+        return self._collect_predictions()
@@ -0,0 +1,183 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from collections import deque
+from dataclasses import dataclass
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+import os
+import pickle
+import traceback
+
+from typing import Callable
+
+import cv2
+import numpy as np
+import torch
+
+from cv2.typing import MatLike
+
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker
+
+BackendFactory = Callable[[int], PoseBackend]
+"""Picklable function that creates the backend of a worker process, which uses at most the given number of threads"""
+
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+
+
+@dataclass
+class _Job:
+    sequence_number: int
+    shared_memory_name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass
+class _PendingFrame:
+    sequence_number: int
+    frame: MatLike
+
+
+def _run_worker(connection: Connection, pickled_factory: bytes, num_threads: int) -> None:
+    """Main loop of a worker process, which infers the frames it receives until it receives None"""
+    # The inference libraries are already imported when the main module is imported again in the spawned process,
+    # so their thread pools are limited at runtime instead of through environment variables
+    torch.set_num_threads(num_threads)
+    cv2.setNumThreads(num_threads)
+
+    backend: PoseBackend = pickle.loads(pickled_factory)(num_threads)
+    shared_memory: SharedMemory | None = None
+
+    try:
+        while (job := connection.recv()) is not None:
+            try:
+                if shared_memory is None or shared_memory.name != job.shared_memory_name:
+                    if shared_memory is not None:
+                        shared_memory.close()
+                    shared_memory = SharedMemory(job.shared_memory_name)
+
+                frame: MatLike = np.ndarray(job.shape, dtype=job.dtype, buffer=shared_memory.buf)
+                connection.send((job.sequence_number, backend.predict(frame)))
+            except Exception:  # pylint: disable=broad-exception-caught
+                connection.send((job.sequence_number, traceback.format_exc()))
+    finally:
+        if shared_memory is not None:
+            shared_memory.close()
+
+
+class ProcessPoolBackend(PoseBackend):
+    """Infers frames in parallel on worker processes, which each hold their own model
+
+    Frames are copied to a shared memory block of the worker and sent to the workers round-robin, so up to one frame per worker
+    can be submitted at the same time.
+    The results are collected in the order of the sequence numbers of the frames and tracked in the main process, so the tracks
+    stay consistent.
+    The threads of each worker are limited to its share of the CPU cores.
+    """
+
+    def __init__(self, tracker: PoseTracker, factory: BackendFactory, num_workers: int) -> None:
+        super().__init__(tracker)
+        assert num_workers >= 1
+
+        self.max_pending_frames = num_workers
+
+        num_threads = max(1, (os.cpu_count() or 1) // num_workers)
+        pickled_factory = pickle.dumps(factory)
+
+        # Forking a process with initialized inference libraries is not safe
+        context = mp.get_context("spawn")
+        self._connections: list[Connection] = []
+        self._workers: list[mp.process.BaseProcess] = []
+        for _ in range(num_workers):
+            connection, worker_connection = context.Pipe()
+            worker = context.Process(target=_run_worker, args=(worker_connection, pickled_factory, num_threads), daemon=True)
+            worker.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._workers.append(worker)
+
+        self._shared_memories: list[SharedMemory | None] = [None] * num_workers
+        self._jobs: deque[_PendingFrame] = deque()
+        self._next_sequence_number = 0
+
+    def submit(self, frame: MatLike) -> None:
+        assert len(self._jobs) < self.max_pending_frames, "result of the oldest frame has to be collected first"
+
+        sequence_number = self._next_sequence_number
+        self._next_sequence_number += 1
+
+        worker = sequence_number % len(self._workers)
+        shared_memory = self._shared_memories[worker]
+        if shared_memory is None or shared_memory.size < frame.nbytes:
+            # The worker keeps its mapping of the old block until it receives the next job
+            if shared_memory is not None:
+                shared_memory.close()
+                shared_memory.unlink()
+            shared_memory = SharedMemory(create=True, size=frame.nbytes)
+            self._shared_memories[worker] = shared_memory
+
+        np.copyto(np.ndarray(frame.shape, dtype=frame.dtype, buffer=shared_memory.buf), frame)
+        self._connections[worker].send(_Job(sequence_number, shared_memory.name, frame.shape, frame.dtype.str))
+        self._jobs.append(_PendingFrame(sequence_number, frame))
+
+    def collect(self) -> PoseDetections:
+        job = self._jobs[0]
+        return self._tracker.update(self._collect_predictions(), job.frame)
+
+    def _collect_predictions(self) -> PoseDetections:
+        job = self._jobs.popleft()
+
+        # Each worker has at most one frame, so the next result of the worker of the oldest frame belongs to it
+        result: PoseDetections | str
+        try:
+            sequence_number, result = self._connections[job.sequence_number % len(self._workers)].recv()
+        except (EOFError, OSError) as e:
+            raise RuntimeError("inference worker terminated") from e
+        assert sequence_number == job.sequence_number
+
+        if isinstance(result, str):
+            raise RuntimeError(f"inference worker failed:\n{result}")
+
+        return result
+
+    def predict(self, frame: MatLike) -> PoseDetections:
+        assert not self._jobs, "results of submitted frames have to be collected first"
+
+        self.submit(frame)
+        return self._collect_predictions()
+
+    def close(self) -> None:
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+
+        for worker in self._workers:
+            worker.join(WORKER_SHUTDOWN_TIMEOUT)
+            if worker.is_alive():
+                worker.terminate()
+        for connection in self._connections:
+            connection.close()
+
+        for shared_memory in self._shared_memories:
+            if shared_memory is not None:
+                shared_memory.close()
+                shared_memory.unlink()
+
+        self._shared_memories = [None] * len(self._workers)
+        self._jobs.clear()
@@ -0,0 +1,187 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import cv2
+import numpy as np
+
+from cv2.typing import MatLike
+import numpy.typing as npt
+
+from pose.backend.base import PoseDetections
+
+NMS_IOU_THRESHOLD = 0.7
+MAX_DETECTIONS = 300
+LETTERBOX_COLOR = (114, 114, 114)
+
+# Per-keypoint standard deviations of the COCO keypoint annotations
+COCO_KEYPOINT_SIGMAS = np.array(
+    [0.026, 0.025, 0.025, 0.035, 0.035, 0.079, 0.079, 0.072, 0.072, 0.062, 0.062, 0.107, 0.107, 0.087, 0.087, 0.089, 0.089]
+)
+
+
+def letterbox(frame: MatLike, image_size: int) -> tuple[npt.NDArray[np.float32], float, tuple[int, int]]:
+    """Resizes and pads a BGR frame to a square RGB input tensor (1, 3, S, S) like the Ultralytics preprocessing
+
+    :return: input tensor, scale factor and padding (left, top) in pixels
+
+    >>> tensor, scale, padding = letterbox(np.zeros((360, 640, 3), dtype=np.uint8), 640)
+    >>> tensor.shape, scale, padding
+    ((1, 3, 640, 640), 1.0, (0, 140))
+    """
+    height, width = frame.shape[:2]
+    scale = min(image_size / height, image_size / width)
+
+    resized_width = int(round(width * scale))
+    resized_height = int(round(height * scale))
+    if (resized_width, resized_height) != (width, height):
+        frame = cv2.resize(frame, (resized_width, resized_height), interpolation=cv2.INTER_LINEAR)
+
+    padding_x = (image_size - resized_width) / 2
+    padding_y = (image_size - resized_height) / 2
+    left, right = int(round(padding_x - 0.1)), int(round(padding_x + 0.1))
+    top, bottom = int(round(padding_y - 0.1)), int(round(padding_y + 0.1))
+    frame = cv2.copyMakeBorder(frame, top, bottom, left, right, cv2.BORDER_CONSTANT, value=LETTERBOX_COLOR)
+
+    tensor = cv2.dnn.blobFromImage(frame, scalefactor=1 / 255, swapRB=True)
+
+    return np.asarray(tensor, dtype=np.float32), scale, (left, top)
+
+
+def box_iou(bbox: npt.NDArray[np.float32], bboxes: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+    """Computes the IoU between one bounding box (4,) and many bounding boxes (N, 4) given as x1, y1, x2, y2
+
+    >>> bboxes = np.array([[0.0, 0.0, 2.0, 2.0], [1.0, 0.0, 3.0, 2.0], [2.0, 2.0, 3.0, 3.0]])
+    >>> box_iou(np.array([0.0, 0.0, 2.0, 2.0]), bboxes).round(2).tolist()
+    [1.0, 0.33, 0.0]
+    """
+    width = np.clip(np.minimum(bbox[2], bboxes[:, 2]) - np.maximum(bbox[0], bboxes[:, 0]), 0.0, None)
+    height = np.clip(np.minimum(bbox[3], bboxes[:, 3]) - np.maximum(bbox[1], bboxes[:, 1]), 0.0, None)
+    intersection = width * height
+
+    area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
+    areas = (bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1])
+
+    iou: npt.NDArray[np.float32] = intersection / np.maximum(area + areas - intersection, np.finfo(np.float32).eps)
+
+    return iou
+
+
+def pairwise_box_iou(bboxes1: npt.NDArray[np.float32], bboxes2: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+    """Computes the IoU between all pairs of bounding boxes (N, 4) and (M, 4) given as x1, y1, x2, y2
+
+    >>> bboxes = np.array([[0.0, 0.0, 2.0, 2.0], [1.0, 0.0, 3.0, 2.0]])
+    >>> pairwise_box_iou(bboxes, bboxes[::-1]).round(2).tolist()
+    [[0.33, 1.0], [1.0, 0.33]]
+    """
+    top_left = np.maximum(bboxes1[:, None, :2], bboxes2[None, :, :2])
+    bottom_right = np.minimum(bboxes1[:, None, 2:], bboxes2[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0.0, None), axis=2)
+
+    areas1 = np.prod(bboxes1[:, 2:] - bboxes1[:, :2], axis=1)
+    areas2 = np.prod(bboxes2[:, 2:] - bboxes2[:, :2], axis=1)
+
+    iou: npt.NDArray[np.float32] = intersection / np.maximum(areas1[:, None] + areas2[None, :] - intersection, np.finfo(np.float32).eps)
+
+    return iou
+
+
+def pairwise_keypoint_similarity(
+    keypoints1: npt.NDArray[np.float32],
+    visible1: npt.NDArray[np.bool_],
+    areas1: npt.NDArray[np.float32],
+    keypoints2: npt.NDArray[np.float32],
+) -> npt.NDArray[np.float32]:
+    """Computes the object keypoint similarity (OKS) between all pairs of keypoints (N, 17, 2) and (M, 17, 2)
+
+    The first keypoints are the reference with their visibility (N, 17) and bounding box areas (N,).
+    Pairs whose reference has no visible keypoints have a similarity of 0.
+
+    >>> keypoints, visible = np.zeros((1, 17, 2)), np.ones((1, 17), dtype=bool)
+    >>> pairwise_keypoint_similarity(keypoints, visible, np.array([100.0]), np.stack([keypoints[0], keypoints[0] + 1])).round(2).tolist()
+    [[1.0, 0.5]]
+    """
+    squared_distances = np.sum((keypoints1[:, None] - keypoints2[None, :]) ** 2, axis=3)
+    variances = (2 * COCO_KEYPOINT_SIGMAS) ** 2
+    scales = 2 * np.maximum(areas1, np.finfo(np.float32).eps)[:, None, None] * variances
+    similarities = np.exp(-squared_distances / scales) * visible1[:, None, :]
+
+    oks: npt.NDArray[np.float32] = similarities.sum(axis=2) / np.maximum(visible1.sum(axis=1), 1)[:, None]
+
+    return oks
+
+
+def non_max_suppression(
+    bboxes: npt.NDArray[np.float32],
+    scores: npt.NDArray[np.float32],
+    iou_threshold: float = NMS_IOU_THRESHOLD,
+) -> npt.NDArray[np.int64]:
+    """Returns the indices of the bounding boxes that are kept by greedy non-maximum suppression, sorted by score
+
+    >>> bboxes = np.array([[0.0, 0.0, 2.0, 2.0], [0.1, 0.0, 2.1, 2.0], [4.0, 4.0, 5.0, 5.0]])
+    >>> non_max_suppression(bboxes, np.array([0.8, 0.9, 0.7])).tolist()
+    [1, 2]
+    """
+    order = np.argsort(-scores, kind="stable")
+
+    keep: list[int] = []
+    while len(order) > 0:
+        index = int(order[0])
+        keep.append(index)
+
+        order = order[1:]
+        order = order[box_iou(bboxes[index], bboxes[order]) <= iou_threshold]
+
+    return np.array(keep, dtype=np.int64)
+
+
+def decode_predictions(
+    predictions: npt.NDArray[np.float32],
+    frame_shape: tuple[int, ...],
+    scale: float,
+    padding: tuple[int, int],
+    min_bbox_conf: float,
+) -> PoseDetections:
+    """Decodes the raw output (1, 56, N) of an exported YOLO pose model to detections in frame coordinates
+
+    Each prediction consists of the bounding box center, width and height, the bounding box confidence and 17 keypoints
+    with x, y and confidence.
+    Coordinates outside the frame are clipped to the edges like the Ultralytics postprocessing.
+    """
+    predictions = predictions[0].T
+    predictions = predictions[predictions[:, 4] > min_bbox_conf]
+
+    center = predictions[:, 0:2]
+    size = predictions[:, 2:4]
+    bboxes = np.concatenate([center - size / 2, center + size / 2], axis=1)
+    scores = predictions[:, 4]
+
+    keep = non_max_suppression(bboxes, scores)[:MAX_DETECTIONS]
+    bboxes = bboxes[keep]
+    scores = scores[keep]
+    keypoints = predictions[keep, 5:].reshape(-1, 17, 3)
+
+    offset = np.array(padding, dtype=np.float32)
+    frame_size = np.array([frame_shape[1], frame_shape[0]], dtype=np.float32)
+
+    bboxes = ((bboxes.reshape(-1, 2, 2) - offset) / scale).clip(0.0, frame_size).reshape(-1, 4)
+    keypoints_xy = ((keypoints[..., :2] - offset) / scale).clip(0.0, frame_size)
+    keypoints_scores = keypoints[..., 2]
+
+    return PoseDetections(
+        bboxes=np.ascontiguousarray(bboxes, dtype=np.float32),
+        scores=np.ascontiguousarray(scores, dtype=np.float32),
+        keypoints=np.ascontiguousarray(keypoints_xy, dtype=np.float32),
+        keypoints_scores=np.ascontiguousarray(keypoints_scores, dtype=np.float32),
+    )
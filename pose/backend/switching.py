@@ -0,0 +1,110 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from collections import deque
+import time
+
+import numpy as np
+
+from cv2.typing import MatLike
+
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker
+
+LATENCY_EXPIRY_WINDOWS = 10
+
+
+class ModelSwitchingBackend(PoseBackend):
+    """Switches between preloaded models of different sizes at runtime to keep the latency per frame under a target
+
+    The models are ordered from the fastest to the most accurate one.
+    All backends share the same tracker, so the tracks continue across switches.
+
+    If the 95th percentile of the latency over the last frames exceeds the target, the next faster model is used.
+    If it is below `upscale_ratio` times the target, the next more accurate model is used, unless it exceeded the target
+    within the last `LATENCY_EXPIRY_WINDOWS` windows of frames, so it is tried again once a load spike is over.
+    After a switch, the latencies of a full window are collected before switching again, so the model does not oscillate.
+    """
+
+    def __init__(
+        self,
+        tracker: PoseTracker,
+        models: list[str],
+        backends: list[PoseBackend],
+        initial_model: str,
+        latency_target: float,
+        window_size: int,
+        upscale_ratio: float,
+    ) -> None:
+        super().__init__(tracker)
+        assert len(models) == len(backends) >= 1
+        assert window_size >= 1
+        assert 0.0 < upscale_ratio < 1.0
+
+        self._models = models
+        self._backends = backends
+        self._index = models.index(initial_model)
+
+        self._latency_target = latency_target
+        self._upscale_ratio = upscale_ratio
+
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._num_frames = 0
+        self._model_latencies: list[tuple[float, int] | None] = [None] * len(models)
+        """last p95 latency of each model in milliseconds with the number of the frame it was measured at"""
+
+    @property
+    def model(self) -> str:
+        """Name of the currently used model"""
+        return self._models[self._index]
+
+    def predict(self, frame: MatLike) -> PoseDetections:
+        return self._backends[self._index].predict(frame)
+
+    def track(self, frame: MatLike) -> PoseDetections:
+        start = time.perf_counter()
+        detections = super().track(frame)
+        self._record_latency((time.perf_counter() - start) * 1000)
+
+        return detections
+
+    def close(self) -> None:
+        for backend in self._backends:
+            backend.close()
+
+    def _record_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+        self._num_frames += 1
+        if len(self._latencies) < (self._latencies.maxlen or 0):
+            return
+
+        p95 = float(np.percentile(self._latencies, 95))
+        self._model_latencies[self._index] = (p95, self._num_frames)
+
+        if p95 > self._latency_target and self._index > 0:
+            self._switch(self._index - 1, p95)
+        elif p95 < self._upscale_ratio * self._latency_target and self._index < len(self._backends) - 1:
+            next_latency = self._model_latencies[self._index + 1]
+            if (
+                next_latency is None
+                or next_latency[0] <= self._latency_target
+                or self._num_frames - next_latency[1] >= LATENCY_EXPIRY_WINDOWS * len(self._latencies)
+            ):
+                self._switch(self._index + 1, p95)
+
+    def _switch(self, index: int, p95: float) -> None:
+        print(f"Switching pose model from {self.model} to {self._models[index]} (p95 latency: {p95:.1f}ms)")
+
+        self._index = index
+        self._latencies.clear()
@@ -0,0 +1,88 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+from typing import Optional
+
+import torch
+from ultralytics import YOLO
+
+from cv2.typing import MatLike
+
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker, export_model
+
+
+class UltralyticsBackend(PoseBackend):
+    """Runs the Ultralytics pipeline with PyTorch or a TensorRT engine"""
+
+    def __init__(
+        self,
+        tracker: PoseTracker,
+        model_path: Path,
+        model: str,
+        image_size: int,
+        min_bbox_conf: float,
+        device: Optional[str] = None,
+        tensorrt: bool = False,
+    ) -> None:
+        super().__init__(tracker)
+
+        self._image_size = image_size
+        self._min_bbox_conf = min_bbox_conf
+        self._device = device
+
+        if tensorrt:
+            self._model = YOLO(export_model(model_path, model, "engine", ".engine", simplify=True, half=True))
+        else:
+            self._model = YOLO(model_path / f"{model}.pt")
+
+    def predict(self, frame: MatLike) -> PoseDetections:
+        results = self._model.predict(
+            frame,
+            imgsz=self._image_size,
+            conf=self._min_bbox_conf,
+            device=self._device,
+            verbose=False,
+        )
+        result = results[0]
+
+        if result.boxes.conf is None or result.keypoints is None or result.keypoints.conf is None:
+            return PoseDetections.empty(result.speed)
+
+        # The results are copied from the device at once, as each copy waits for the device
+        num_detections = len(result.boxes.conf)
+        packed = (
+            torch.cat(
+                [
+                    result.boxes.xyxy,
+                    result.boxes.conf[:, None],
+                    result.keypoints.xy.reshape(num_detections, -1),
+                    result.keypoints.conf,
+                ],
+                dim=1,
+            )
+            .float()
+            .cpu()
+            .numpy()
+        )
+
+        return PoseDetections(
+            bboxes=packed[:, :4],
+            scores=packed[:, 4],
+            keypoints=packed[:, 5:39].reshape(num_detections, 17, 2),
+            keypoints_scores=packed[:, 39:],
+            speed=result.speed,
+        )
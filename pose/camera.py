@@ -13,15 +13,22 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
+from abc import ABC, abstractmethod
+from pathlib import Path
 import sys
+import threading
+import time
 
-from typing import Optional
+from typing import Callable, Literal, Optional
 
 import cv2
+import numpy as np
 from pydantic import BaseModel, Field
 
 from cv2.typing import MatLike
 
+from utils.clock import Clock, SystemClock, VirtualClock
+
 
 class CameraConfig(BaseModel):
     device: int = Field(
@@ -48,36 +55,416 @@ class CameraConfig(BaseModel):
     fps: Optional[int] = Field(
         default=None,
         ge=0,
-        description="capture frames per second",
+        description="capture frames per second (playback frames per second of files in fixed mode)",
+    )
+    file: Optional[str] = Field(
+        default=None,
+        description="path to video file or folder of images that is played back instead of capturing from the camera",
+    )
+    playback: Literal["realtime", "fast", "fixed"] = Field(
+        default="realtime",
+        description="playback speed of files (realtime: frame rate of file, fast: as fast as possible, fixed: frame rate set by fps)",
+    )
+    threaded: bool = Field(
+        default=False,
+        description="capture frames on a separate thread and only return the latest one",
+    )
+    frame_pool_size: int = Field(
+        default=4,
+        ge=1,
+        description="number of preallocated frame buffers that are reused for capturing",
     )
 
 
-class Camera:
-    def __init__(self, config: CameraConfig):
-        self._config = config
+class Frame:
+    """Captured frame that is leased from a `FramePool`
+
+    The image buffer is returned to the pool and reused for capturing once all holders of the frame called `release()`.
+    Additional holders that want to keep the frame beyond the current iteration have to call `retain()` first.
+    Frames can be used as context manager, which releases the frame on exit.
+    """
+
+    def __init__(self, image: MatLike, timestamp: float = 0.0, pool: "FramePool | None" = None, index: int = 0) -> None:
+        self.image = image
+        self.timestamp = timestamp
+        """Capture timestamp in seconds provided by the clock of the frame source"""
+
+        self._pool = pool
+        self._index = index
+
+    def retain(self) -> "Frame":
+        if self._pool is not None:
+            self._pool._retain(self._index)
+
+        return self
+
+    def release(self) -> None:
+        if self._pool is not None:
+            self._pool._release(self._index)
+
+    def __enter__(self) -> "Frame":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+
+class FramePool:
+    """Fixed ring of preallocated image buffers
+
+    Frames are decoded directly into free buffers to avoid allocating a new array for every captured frame.
+    If all buffers are leased, a temporary buffer is allocated, which is counted in `overflows`.
+
+    >>> pool = FramePool(2, (2, 2, 3))
+    >>> frame = pool.lease(lambda image: (True, image))
+    >>> frame.release()
+    >>> pool.lease(lambda image: (True, image)).image is frame.image
+    False
+    >>> pool.lease(lambda image: (True, image)).image is frame.image
+    True
+    """
+
+    def __init__(self, size: int, shape: tuple[int, ...] | None = None) -> None:
+        assert size >= 1
+
+        self._buffers: list[MatLike | None] = [np.empty(shape, dtype=np.uint8) if shape is not None else None for _ in range(size)]
+        self._ref_counts = [0] * size
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+        self.overflows = 0
+
+    def lease(self, decode: Callable[[MatLike | None], tuple[bool, MatLike]], timestamp: float = 0.0) -> Frame | None:
+        """Decodes a frame into the next free buffer
+
+        :param decode: function that decodes a frame into the given buffer (e.g. `cv2.VideoCapture.read`)
+        :param timestamp: capture timestamp of the frame
+        :return: leased frame or None if decoding failed
+        """
+        with self._lock:
+            index = self._find_free_index()
+            if index is not None:
+                self._ref_counts[index] = 1
+                self._next_index = (index + 1) % len(self._buffers)
+            else:
+                self.overflows += 1
+
+        if index is None:
+            success, image = decode(None)
+
+            return Frame(image, timestamp) if success else None
+
+        success, image = decode(self._buffers[index])
+        if not success:
+            self._release(index)
+            return None
+
+        # The decoder allocates a new image if the buffer does not match the frame, which is then reused for the following frames
+        self._buffers[index] = image
+
+        return Frame(image, timestamp, self, index)
+
+    def _find_free_index(self) -> int | None:
+        for offset in range(len(self._buffers)):
+            index = (self._next_index + offset) % len(self._buffers)
+            if self._ref_counts[index] == 0:
+                return index
+
+        return None
+
+    def _retain(self, index: int) -> None:
+        with self._lock:
+            assert self._ref_counts[index] > 0
+            self._ref_counts[index] += 1
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            assert self._ref_counts[index] > 0
+            self._ref_counts[index] -= 1
+
+
+IMAGE_EXTENSIONS = {".bmp", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp"}
+DEFAULT_IMAGE_SEQUENCE_FPS = 30.0
+
+
+class FrameSource(ABC):
+    """Source of frames with the interface of `cv2.VideoCapture`
+
+    The `clock` of the source provides the capture timestamps of the frames.
+    """
+
+    format_fourcc: str
+    width: int
+    height: int
+    fps: float
+    clock: Clock
+
+    @abstractmethod
+    def is_opened(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def grab(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def retrieve(self, image: MatLike | None = None) -> tuple[bool, MatLike]:
+        raise NotImplementedError
+
+    def read(self, image: MatLike | None = None) -> tuple[bool, MatLike]:
+        if not self.grab():
+            return False, np.empty(0, dtype=np.uint8)
+
+        return self.retrieve(image)
+
+    @abstractmethod
+    def release(self) -> None:
+        raise NotImplementedError
+
+
+class DeviceSource(FrameSource):
+    """Captures frames from a camera device"""
+
+    def __init__(self, config: CameraConfig) -> None:
+        self._cap = cv2.VideoCapture(config.device)
+        if config.format_fourcc is not None:
+            self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*config.format_fourcc.upper()))
+        if config.width is not None:
+            self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.width)
+        if config.height is not None:
+            self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.height)
+        if config.fps is not None:
+            self._cap.set(cv2.CAP_PROP_FPS, config.fps)
+
+        self.format_fourcc = int(self._cap.get(cv2.CAP_PROP_FOURCC)).to_bytes(4, byteorder=sys.byteorder).decode()
+        self.width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.fps = self._cap.get(cv2.CAP_PROP_FPS)
+        self.clock = SystemClock()
+
+    def is_opened(self) -> bool:
+        return self._cap.isOpened()
+
+    def grab(self) -> bool:
+        return self._cap.grab()
+
+    def retrieve(self, image: MatLike | None = None) -> tuple[bool, MatLike]:
+        return self._cap.retrieve(image)
+
+    def read(self, image: MatLike | None = None) -> tuple[bool, MatLike]:
+        return self._cap.read(image)
+
+    def release(self) -> None:
+        self._cap.release()
+
+
+class _FileSource(FrameSource):
+    """Base class for playing back files with a configurable speed
+
+    Frames are timestamped by a virtual clock according to their position in the file and not the time they are played back.
+    """
+
+    def __init__(self, config: CameraConfig, file_fps: float) -> None:
+        if config.playback == "fixed" and config.fps:
+            self.fps = float(config.fps)
+        else:
+            self.fps = file_fps
+
+        self._virtual_clock = VirtualClock()
+        self.clock = self._virtual_clock
+
+        self._frame_duration = 1.0 / self.fps if self.fps > 0.0 else 0.0
+        self._paced = config.playback != "fast"
+        self._frame_index = 0
+        self._start_timestamp: float | None = None
 
-        self._cap = cv2.VideoCapture(self._config.device)
-        if self._config.format_fourcc is not None:
-            self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*self._config.format_fourcc.upper()))
-        if self._config.width is not None:
-            self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self._config.width)
-        if self._config.height is not None:
-            self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self._config.height)
-        if self._config.fps is not None:
-            self._cap.set(cv2.CAP_PROP_FPS, self._config.fps)
+    def _wait_for_next_frame(self) -> None:
+        self._virtual_clock.set(self._frame_index * self._frame_duration)
+
+        if self._paced:
+            # Frames are scheduled relative to the first frame, so the playback does not drift.
+            # If the consumer is too slow, the following frames are returned immediately until the schedule is met again.
+            timestamp = time.perf_counter()
+            if self._start_timestamp is None:
+                self._start_timestamp = timestamp
+
+            delay = self._start_timestamp + self.clock.now() - timestamp
+            if delay > 0.0:
+                time.sleep(delay)
+
+        self._frame_index += 1
+
+
+class VideoFileSource(_FileSource):
+    """Plays back a video file"""
+
+    def __init__(self, config: CameraConfig, path: Path) -> None:
+        self._cap = cv2.VideoCapture(str(path))
+
+        super().__init__(config, self._cap.get(cv2.CAP_PROP_FPS))
 
         self.format_fourcc = int(self._cap.get(cv2.CAP_PROP_FOURCC)).to_bytes(4, byteorder=sys.byteorder).decode()
         self.width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        self.fps = int(self._cap.get(cv2.CAP_PROP_FPS))
 
     def is_opened(self) -> bool:
         return self._cap.isOpened()
 
-    def read(self) -> MatLike | None:
-        success, frame = self._cap.read()
+    def grab(self) -> bool:
+        success = self._cap.grab()
+        if success:
+            self._wait_for_next_frame()
+
+        return success
 
-        return frame if success else None
+    def retrieve(self, image: MatLike | None = None) -> tuple[bool, MatLike]:
+        return self._cap.retrieve(image)
 
     def release(self) -> None:
         self._cap.release()
+
+
+class ImageSequenceSource(_FileSource):
+    """Plays back a folder of images in the order of their file names"""
+
+    def __init__(self, config: CameraConfig, path: Path) -> None:
+        super().__init__(config, float(config.fps) if config.fps else DEFAULT_IMAGE_SEQUENCE_FPS)
+
+        self._files = sorted(file for file in path.iterdir() if file.suffix.lower() in IMAGE_EXTENSIONS)
+        self._index = -1
+
+        first_image = cv2.imread(str(self._files[0])) if len(self._files) > 0 else None
+        self.format_fourcc = self._files[0].suffix[1:5].upper().ljust(4) if len(self._files) > 0 else "    "
+        self.width = first_image.shape[1] if first_image is not None else 0
+        self.height = first_image.shape[0] if first_image is not None else 0
+
+    def is_opened(self) -> bool:
+        return self._index < len(self._files)
+
+    def grab(self) -> bool:
+        self._index += 1
+        if self._index >= len(self._files):
+            return False
+
+        self._wait_for_next_frame()
+
+        return True
+
+    def retrieve(self, image: MatLike | None = None) -> tuple[bool, MatLike]:
+        if not 0 <= self._index < len(self._files):
+            return False, np.empty(0, dtype=np.uint8)
+
+        decoded_image = cv2.imread(str(self._files[self._index]))
+        if decoded_image is None:
+            return False, np.empty(0, dtype=np.uint8)
+
+        if image is not None and image.shape == decoded_image.shape and image.dtype == decoded_image.dtype:
+            np.copyto(image, decoded_image)
+            return True, image
+
+        return True, decoded_image
+
+    def release(self) -> None:
+        self._index = len(self._files)
+
+
+def open_frame_source(config: CameraConfig) -> FrameSource:
+    if config.file is None:
+        return DeviceSource(config)
+
+    path = Path(config.file)
+    if path.is_dir():
+        return ImageSequenceSource(config, path)
+
+    return VideoFileSource(config, path)
+
+
+class Camera:
+    def __init__(self, config: CameraConfig):
+        self._config = config
+
+        self._source = open_frame_source(self._config)
+
+        self.format_fourcc = self._source.format_fourcc
+        self.width = self._source.width
+        self.height = self._source.height
+        self.fps = round(self._source.fps)
+        self.clock = self._source.clock
+        """Clock that provides the capture timestamps of the frames"""
+
+        self._pool = FramePool(self._config.frame_pool_size, (self.height, self.width, 3) if self.width and self.height else None)
+
+        self.dropped_frames = 0
+        """Number of frames that were captured, but skipped because a newer frame was available (threaded mode only)"""
+
+        self._condition = threading.Condition()
+        self._frame: Frame | None = None
+        self._frame_requested = False
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+        if self._config.threaded:
+            self._running = True
+            self._thread = threading.Thread(target=self._capture, daemon=True)
+            self._thread.start()
+
+    def _capture(self) -> None:
+        # Frames are grabbed continuously to keep the driver buffer empty, but only decoded if a frame has been requested.
+        # This way, the consumer always gets the latest frame and frames that are dropped anyway do not cost any decoding time.
+        while self._running:
+            if not self._source.grab():
+                break
+
+            timestamp = self._source.clock.now()
+
+            with self._condition:
+                if not self._frame_requested:
+                    self.dropped_frames += 1
+                    continue
+
+            frame = self._pool.lease(self._source.retrieve, timestamp)
+            if frame is None:
+                break
+
+            with self._condition:
+                self._frame = frame
+                self._frame_requested = False
+                self._condition.notify_all()
+
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+    def is_opened(self) -> bool:
+        return self._source.is_opened()
+
+    def read(self) -> Frame | None:
+        """Reads the next frame
+
+        The returned frame has to be released after use, so its buffer can be reused.
+        """
+        if self._thread is None:
+            frame = self._pool.lease(self._source.read)
+            if frame is not None:
+                frame.timestamp = self._source.clock.now()
+
+            return frame
+
+        with self._condition:
+            self._frame_requested = True
+            self._condition.wait_for(lambda: not self._frame_requested or not self._running)
+
+            latest_frame = self._frame
+            self._frame = None
+            self._frame_requested = False
+
+        return latest_frame
+
+    def release(self) -> None:
+        if self._thread is not None:
+            with self._condition:
+                self._running = False
+            self._thread.join()
+            self._thread = None
+
+        self._source.release()
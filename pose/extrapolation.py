@@ -0,0 +1,128 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from collections import deque
+
+from typing import Literal
+
+import numpy as np
+
+import numpy.typing as npt
+
+MotionModel = Literal["velocity", "acceleration"]
+
+LATENCY_SMOOTHING = 0.1
+
+
+class InferenceScheduler:
+    """Decides for each frame whether it is inferred, so that inference takes at most a given fraction of the time
+
+    The inference latency is smoothed over the last inferences.
+    Frames are inferred until the first latency is known.
+
+    >>> scheduler = InferenceScheduler(0.5)
+    >>> scheduler.is_due(0.0)
+    True
+    >>> scheduler.record_latency(0.02)
+    >>> [scheduler.is_due(timestamp) for timestamp in [0.01, 0.03, 0.04, 0.05, 0.08]]
+    [False, False, True, False, True]
+    """
+
+    def __init__(self, budget: float) -> None:
+        assert 0.0 < budget <= 1.0
+
+        self._budget = budget
+        self._latency: float | None = None
+        self._last_timestamp: float | None = None
+
+    def is_due(self, timestamp: float) -> bool:
+        """Returns whether the frame captured at the timestamp should be inferred, which is then counted as inferred"""
+        if self._latency is not None and self._last_timestamp is not None:
+            if timestamp - self._last_timestamp < self._latency / self._budget:
+                return False
+
+        self._last_timestamp = timestamp
+
+        return True
+
+    def record_latency(self, latency: float) -> None:
+        """Records the latency of an inference in seconds"""
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += LATENCY_SMOOTHING * (latency - self._latency)
+
+
+class KeypointExtrapolator:
+    """Extrapolates the keypoints of a person from the last inferences with a constant velocity or acceleration model
+
+    Each keypoint is extrapolated separately from the inferences in which it was visible.
+    The confidences of extrapolated keypoints are reduced, and keypoints are not extrapolated further than `max_time`.
+
+    >>> extrapolator = KeypointExtrapolator(0.5, "velocity", 0.9, 1.0)
+    >>> extrapolator.update(np.zeros((17, 2)), np.ones((17,)), 0.0)
+    >>> extrapolator.update(np.ones((17, 2)), np.ones((17,)), 0.1)
+    >>> keypoints, keypoints_scores = extrapolator.predict(0.15)
+    >>> keypoints[0].tolist(), float(keypoints_scores[0])
+    ([1.5, 1.5], 0.9)
+    """
+
+    def __init__(self, min_keypoint_conf: float, model: MotionModel, conf_factor: float, max_time: float) -> None:
+        self._min_keypoint_conf = min_keypoint_conf
+        self._num_observations = 3 if model == "acceleration" else 2
+        self._conf_factor = conf_factor
+        self._max_time = max_time
+
+        self._keypoints: deque[npt.NDArray[np.float64]] = deque(maxlen=self._num_observations)
+        self._keypoints_scores: deque[npt.NDArray[np.float64]] = deque(maxlen=self._num_observations)
+        self._timestamps: deque[float] = deque(maxlen=self._num_observations)
+
+    def reset(self) -> None:
+        self._keypoints.clear()
+        self._keypoints_scores.clear()
+        self._timestamps.clear()
+
+    def update(self, keypoints: npt.NDArray[np.float64], keypoints_scores: npt.NDArray[np.float64], timestamp: float) -> None:
+        """Adds the inferred keypoints (17, 2) and their confidences (17,) of a frame"""
+        self._keypoints.append(keypoints)
+        self._keypoints_scores.append(keypoints_scores)
+        self._timestamps.append(timestamp)
+
+    def predict(self, timestamp: float) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Extrapolates the keypoints (17, 2) and their confidences (17,) to the timestamp"""
+        if not self._timestamps:
+            return np.zeros((17, 2)), np.zeros((17,))
+
+        keypoints = self._keypoints[-1]
+        time_diff = timestamp - self._timestamps[-1]
+        if time_diff > self._max_time:
+            return keypoints, np.zeros((17,))
+
+        # Newton's divided differences of the last observations, which give the velocity and half the acceleration
+        visible = self._keypoints_scores[-1] >= self._min_keypoint_conf
+        prediction = keypoints.copy()
+        product = 1.0
+        differences = list(self._keypoints)
+        for order in range(1, len(self._timestamps)):
+            visible &= self._keypoints_scores[-order - 1] >= self._min_keypoint_conf
+            differences = [
+                (differences[i + 1] - differences[i])
+                / max(self._timestamps[i + order] - self._timestamps[i], float(np.finfo(np.float64).eps))
+                for i in range(len(differences) - 1)
+            ]
+            product *= timestamp - self._timestamps[-order]
+            prediction += np.where(visible[:, None], differences[-1] * product, 0.0)
+
+        return prediction, self._keypoints_scores[-1] * self._conf_factor
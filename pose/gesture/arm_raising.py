@@ -15,8 +15,12 @@
 
 from dataclasses import dataclass
 
-from pose.gesture.base import GestureBase
-from pose.keypoints import Keypoints
+import numpy as np
+
+import numpy.typing as npt
+
+from pose.gesture.base import GestureBase, GestureBatchBase
+from pose.keypoints import KeypointIndex, Keypoints
 from utils.side import Side
 
 
@@ -25,21 +29,56 @@ class ArmRaisingResult:
     detected: bool
 
 
+@dataclass
+class ArmRaisingBatchResult:
+    detected: npt.NDArray[np.bool_]
+
+
 class ArmRaising(GestureBase[ArmRaisingResult]):
     """Detects if the arm is raised."""
 
+    def __init__(self, min_keypoint_conf: float, side: Side):
+        self._batch = ArmRaisingBatch(min_keypoint_conf, side)
+
+    def parse_keypoints(self, keypoints: Keypoints) -> ArmRaisingResult:
+        result = self._batch.parse_keypoints(keypoints.xy[np.newaxis], keypoints.conf[np.newaxis])
+
+        return ArmRaisingResult(bool(result.detected[0]))
+
+
+class ArmRaisingBatch(GestureBatchBase[ArmRaisingBatchResult]):
+    """Detects for many persons at once if the arm is raised."""
+
     def __init__(self, min_keypoint_conf: float, side: Side):
         self._min_keypoint_conf = min_keypoint_conf
         self._side = side
 
-    def parse_keypoints(self, keypoints: Keypoints) -> ArmRaisingResult:
-        if self._side is Side.LEFT:
-            eye = keypoints.left_eye
-            wrist = keypoints.left_wrist
-        else:
-            eye = keypoints.right_eye
-            wrist = keypoints.right_wrist
+    def parse_keypoints(self, keypoints: npt.NDArray[np.float64], keypoints_scores: npt.NDArray[np.float64]) -> ArmRaisingBatchResult:
+        return ArmRaisingBatchResult(detect_arm_raising(keypoints, keypoints_scores, self._min_keypoint_conf, self._side))
+
+
+def detect_arm_raising(
+    keypoints: npt.NDArray[np.float64],
+    keypoints_scores: npt.NDArray[np.float64],
+    min_keypoint_conf: float,
+    side: Side,
+) -> npt.NDArray[np.bool_]:
+    """Detects for many persons (N, 17, 2) at once if the arm is raised, like `ArmRaising`
+
+    >>> keypoints = np.zeros((2, 17, 2))
+    >>> keypoints[0, KeypointIndex.RIGHT_EYE, 1] = 0.2
+    >>> detect_arm_raising(keypoints, np.ones((2, 17)), 0.8, Side.RIGHT).tolist()
+    [True, False]
+    """
+    if side is Side.LEFT:
+        eye, wrist = KeypointIndex.LEFT_EYE, KeypointIndex.LEFT_WRIST
+    else:
+        eye, wrist = KeypointIndex.RIGHT_EYE, KeypointIndex.RIGHT_WRIST
 
-        detected = wrist.conf > self._min_keypoint_conf and eye.conf > self._min_keypoint_conf and wrist.y < eye.y
+    detected: npt.NDArray[np.bool_] = (
+        (keypoints_scores[:, wrist] > min_keypoint_conf)
+        & (keypoints_scores[:, eye] > min_keypoint_conf)
+        & (keypoints[:, wrist, 1] < keypoints[:, eye, 1])
+    )
 
-        return ArmRaisingResult(detected)
+    return detected
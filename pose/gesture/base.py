@@ -16,6 +16,10 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+import numpy as np
+
+import numpy.typing as npt
+
 from pose.keypoints import Keypoints
 
 T = TypeVar("T")
@@ -25,3 +29,11 @@ class GestureBase(ABC, Generic[T]):
     @abstractmethod
     def parse_keypoints(self, keypoints: Keypoints) -> T:
         raise NotImplementedError
+
+
+class GestureBatchBase(ABC, Generic[T]):
+    """Gesture that is evaluated for many persons at once on their keypoints (N, 17, 2) and keypoint scores (N, 17)"""
+
+    @abstractmethod
+    def parse_keypoints(self, keypoints: npt.NDArray[np.float64], keypoints_scores: npt.NDArray[np.float64]) -> T:
+        raise NotImplementedError
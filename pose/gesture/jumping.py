@@ -14,13 +14,15 @@
 # not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
+import time
 
 import numpy as np
 
-from pose.gesture.base import GestureBase
-from pose.keypoints import Keypoints
-from utils.filter import Derivative, Ewma
-from utils.vector import Vector2
+import numpy.typing as npt
+
+from pose.gesture.base import GestureBase, GestureBatchBase
+from pose.keypoints import KeypointIndex, Keypoints
+from utils.filter import FilterBank
 
 HIP_CENTER_EWMA_TIME_CONSTANT = 0.1
 DEFAULT_SENSITIVITY = 0.4
@@ -31,33 +33,65 @@ class JumpingResult:
     detected: bool
 
 
+@dataclass
+class JumpingBatchResult:
+    detected: npt.NDArray[np.bool_]
+
+
 class Jumping(GestureBase[JumpingResult]):
     """Detects jumping."""
 
     def __init__(self, min_keypoint_conf: float) -> None:
+        self._batch = JumpingBatch(min_keypoint_conf, 1)
+
+    def set_sensitivity(self, sensitivity: float) -> None:
+        self._batch.set_sensitivity(0, sensitivity)
+
+    def set_shoulder_width(self, shoulder_width: float) -> None:
+        self._batch.set_shoulder_width(np.array([shoulder_width]))
+
+    def parse_keypoints(self, keypoints: Keypoints, timestamp: float | None = None) -> JumpingResult:
+        result = self._batch.parse_keypoints(keypoints.xy[np.newaxis], keypoints.conf[np.newaxis], timestamp)
+
+        return JumpingResult(bool(result.detected[0]))
+
+
+class JumpingBatch(GestureBatchBase[JumpingBatchResult]):
+    """Detects jumping of many persons at once."""
+
+    def __init__(self, min_keypoint_conf: float, num_persons: int) -> None:
         self._min_keypoint_conf = min_keypoint_conf
 
-        self._shoulder_width: float = 0.0
-        self._hip_center_diff = Derivative()
-        self._hip_center_ewma = Ewma(HIP_CENTER_EWMA_TIME_CONSTANT)
+        self._shoulder_width = np.zeros(num_persons)
+        self._hip_center_diff_ewma = FilterBank((num_persons, 2), HIP_CENTER_EWMA_TIME_CONSTANT, derivative=True)
 
-        self._sensitivity: float = DEFAULT_SENSITIVITY
+        self._sensitivity = np.full(num_persons, DEFAULT_SENSITIVITY)
 
-    def set_sensitivity(self, sensitivity: float) -> None:
-        self._sensitivity = sensitivity
+    def set_sensitivity(self, person_id: int, sensitivity: float) -> None:
+        self._sensitivity[person_id] = sensitivity
 
-    def set_shoulder_width(self, shoulder_width: float) -> None:
+    def set_shoulder_width(self, shoulder_width: npt.NDArray[np.float64]) -> None:
         self._shoulder_width = shoulder_width
 
-    def parse_keypoints(self, keypoints: Keypoints) -> JumpingResult:
-        if keypoints.left_hip.conf > self._min_keypoint_conf and keypoints.right_hip.conf > self._min_keypoint_conf:
-            hip_center = (keypoints.left_hip.xy + keypoints.right_hip.xy) / 2
-            hip_center_diff = self._hip_center_ewma(self._hip_center_diff(hip_center))
-        else:
-            self._hip_center_diff.reset()
-            self._hip_center_ewma.reset()
-            hip_center_diff = np.array([0.0, 0.0])
+    def parse_keypoints(
+        self,
+        keypoints: npt.NDArray[np.float64],
+        keypoints_scores: npt.NDArray[np.float64],
+        timestamp: float | None = None,
+    ) -> JumpingBatchResult:
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        visible = (keypoints_scores[:, KeypointIndex.LEFT_HIP] > self._min_keypoint_conf) & (
+            keypoints_scores[:, KeypointIndex.RIGHT_HIP] > self._min_keypoint_conf
+        )
+
+        hip_center = (keypoints[:, KeypointIndex.LEFT_HIP] + keypoints[:, KeypointIndex.RIGHT_HIP]) / 2
+        hip_center_diff = self._hip_center_diff_ewma(hip_center, timestamp, visible)
+
+        self._hip_center_diff_ewma.reset(~visible)
+        hip_center_diff[~visible] = 0.0
 
-        detected = Vector2(hip_center_diff).y < -self._shoulder_width / self._sensitivity
+        detected = hip_center_diff[:, 1] < -self._shoulder_width / self._sensitivity
 
-        return JumpingResult(detected)
+        return JumpingBatchResult(detected)
@@ -17,9 +17,10 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from pose.gesture.base import GestureBase
-from pose.keypoints import Keypoints
-from utils.vector import Vector2
+import numpy.typing as npt
+
+from pose.gesture.base import GestureBase, GestureBatchBase
+from pose.keypoints import KeypointIndex, Keypoints
 
 
 @dataclass
@@ -28,27 +29,43 @@ class LeaningResult:
     angle: float
 
 
+@dataclass
+class LeaningBatchResult:
+    detected: npt.NDArray[np.bool_]
+    angle: npt.NDArray[np.float64]
+
+
 class Leaning(GestureBase[LeaningResult]):
     """Calculates the angle of the spine to the vertical axis."""
 
     def __init__(self, min_keypoint_conf: float) -> None:
-        self._min_keypoint_conf = min_keypoint_conf
+        self._batch = LeaningBatch(min_keypoint_conf)
 
     def parse_keypoints(self, keypoints: Keypoints) -> LeaningResult:
-        if (
-            keypoints.left_shoulder.conf > self._min_keypoint_conf
-            and keypoints.right_shoulder.conf > self._min_keypoint_conf
-            and keypoints.left_hip.conf > self._min_keypoint_conf
-            and keypoints.right_hip.conf > self._min_keypoint_conf
-        ):
-            shoulder_mid_xy = (keypoints.left_shoulder.xy + keypoints.right_shoulder.xy) / 2
-            hip_mid_xy = (keypoints.left_hip.xy + keypoints.right_hip.xy) / 2
-            spine_vector = Vector2(hip_mid_xy - shoulder_mid_xy)
-
-            detected = True
-            angle = np.degrees(np.arctan2(spine_vector.x, spine_vector.y))
-        else:
-            detected = False
-            angle = 0.0
-
-        return LeaningResult(detected, angle)
+        result = self._batch.parse_keypoints(keypoints.xy[np.newaxis], keypoints.conf[np.newaxis])
+
+        return LeaningResult(bool(result.detected[0]), float(result.angle[0]))
+
+
+class LeaningBatch(GestureBatchBase[LeaningBatchResult]):
+    """Calculates the angle of the spine to the vertical axis for many persons at once."""
+
+    def __init__(self, min_keypoint_conf: float) -> None:
+        self._min_keypoint_conf = min_keypoint_conf
+
+    def parse_keypoints(self, keypoints: npt.NDArray[np.float64], keypoints_scores: npt.NDArray[np.float64]) -> LeaningBatchResult:
+        detected = np.all(
+            keypoints_scores[
+                :, [KeypointIndex.LEFT_SHOULDER, KeypointIndex.RIGHT_SHOULDER, KeypointIndex.LEFT_HIP, KeypointIndex.RIGHT_HIP]
+            ]
+            > self._min_keypoint_conf,
+            axis=1,
+        )
+
+        shoulder_mid_xy = (keypoints[:, KeypointIndex.LEFT_SHOULDER] + keypoints[:, KeypointIndex.RIGHT_SHOULDER]) / 2
+        hip_mid_xy = (keypoints[:, KeypointIndex.LEFT_HIP] + keypoints[:, KeypointIndex.RIGHT_HIP]) / 2
+        spine_vector = hip_mid_xy - shoulder_mid_xy
+
+        angle = np.where(detected, np.degrees(np.arctan2(spine_vector[:, 0], spine_vector[:, 1])), 0.0)
+
+        return LeaningBatchResult(detected, angle)
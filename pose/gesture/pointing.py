@@ -20,9 +20,9 @@ import numpy as np
 
 import numpy.typing as npt
 
-from pose.gesture.base import GestureBase
-from pose.keypoints import Keypoints
-from utils.filter import Derivative, Ewma
+from pose.gesture.base import GestureBase, GestureBatchBase
+from pose.keypoints import KeypointIndex, Keypoints
+from utils.filter import FilterBank
 from utils.side import Side
 
 DEFAULT_ASPECT_RATIO = 16 / 9
@@ -41,72 +41,102 @@ class PointingResult:
     selecting: bool
 
 
+@dataclass
+class PointingBatchResult:
+    detected: npt.NDArray[np.bool_]
+    xy: npt.NDArray[np.float64]
+    selecting: npt.NDArray[np.bool_]
+
+
 class Pointing(GestureBase[PointingResult]):
     """Calculates the relative hand position and triggers time based selection events to replace a mouse."""
 
     def __init__(self, min_keypoint_conf: float, side: Side, timestamp: float | None = None):
-        self._min_keypoint_conf = min_keypoint_conf
-        self._side = side
-
-        if timestamp is None:
-            timestamp = time.perf_counter()
-
-        self._aspect_ratio = DEFAULT_ASPECT_RATIO
-        self._shoulder_width: float = 0.0
-        self._reference_shoulder_xy = np.array([0.0, 0.0])
-        self._reference_shoulder_xy_ewma = Ewma(REFERENCE_SHOULDER_XY_EWMA_TIME_CONSTANT)
-        self._xy = np.array([0.0, 0.0])
-        self._xy_ewma = Ewma(XY_EWMA_TIME_CONSTANT)
-        self._xy_diff = Derivative()
-        self._selecting_timestamp = timestamp
+        self._batch = PointingBatch(min_keypoint_conf, side, 1, timestamp)
 
     def set_aspect_ratio(self, aspect_radio: tuple[float, float]) -> None:
-        self._aspect_ratio = aspect_radio[0] / aspect_radio[1]
+        self._batch.set_aspect_ratio(0, aspect_radio)
 
     def set_shoulder_width(self, shoulder_width: float) -> None:
-        self._shoulder_width = shoulder_width
+        self._batch.set_shoulder_width(np.array([shoulder_width]))
 
     def parse_keypoints(self, keypoints: Keypoints, timestamp: float | None = None) -> PointingResult:
+        result = self._batch.parse_keypoints(keypoints.xy[np.newaxis], keypoints.conf[np.newaxis], timestamp)
+
+        return PointingResult(bool(result.detected[0]), result.xy[0], bool(result.selecting[0]))
+
+
+class PointingBatch(GestureBatchBase[PointingBatchResult]):
+    """Calculates the relative hand positions and triggers time based selection events of many persons at once."""
+
+    def __init__(self, min_keypoint_conf: float, side: Side, num_persons: int, timestamp: float | None = None):
+        self._min_keypoint_conf = min_keypoint_conf
+        if side is Side.LEFT:
+            self._reference_shoulder = KeypointIndex.LEFT_SHOULDER
+            self._wrist = KeypointIndex.LEFT_WRIST
+        else:
+            self._reference_shoulder = KeypointIndex.RIGHT_SHOULDER
+            self._wrist = KeypointIndex.RIGHT_WRIST
+
+        self._xy_scale = np.tile(_get_xy_scale(DEFAULT_ASPECT_RATIO), (num_persons, 1))
+        self._shoulder_width = np.zeros(num_persons)
+        self._reference_shoulder_xy_ewma = FilterBank((num_persons, 2), REFERENCE_SHOULDER_XY_EWMA_TIME_CONSTANT)
+        self._xy_ewma = FilterBank((num_persons, 2), XY_EWMA_TIME_CONSTANT)
+        self._xy_diff = FilterBank((num_persons, 2), derivative=True)
+        self._num_persons = num_persons
+        self._selecting_timestamp = None if timestamp is None else np.full(num_persons, timestamp)
+
+    def set_aspect_ratio(self, person_id: int, aspect_radio: tuple[float, float]) -> None:
+        self._xy_scale[person_id] = _get_xy_scale(aspect_radio[0] / aspect_radio[1])
+
+    def set_shoulder_width(self, shoulder_width: npt.NDArray[np.float64]) -> None:
+        self._shoulder_width = shoulder_width
+
+    def parse_keypoints(
+        self,
+        keypoints: npt.NDArray[np.float64],
+        keypoints_scores: npt.NDArray[np.float64],
+        timestamp: float | None = None,
+    ) -> PointingBatchResult:
         if timestamp is None:
             timestamp = time.perf_counter()
 
-        if self._side is Side.LEFT:
-            reference_shoulder = keypoints.left_shoulder
-            wrist = keypoints.left_wrist
-        else:
-            reference_shoulder = keypoints.right_shoulder
-            wrist = keypoints.right_wrist
-
-        if reference_shoulder.conf > self._min_keypoint_conf:
-            self._reference_shoulder_xy = self._reference_shoulder_xy_ewma(reference_shoulder.xy, timestamp)
-
-        detected = False
-        selecting = False
-        if reference_shoulder.conf > self._min_keypoint_conf and wrist.conf > self._min_keypoint_conf and self._shoulder_width > 0.0:
-            xy = (wrist.xy - self._reference_shoulder_xy) / self._shoulder_width
-            if self._aspect_ratio > 1.0:
-                xy[1] *= self._aspect_ratio
-            elif self._aspect_ratio < 1.0:
-                xy[0] /= self._aspect_ratio
-
-            if (np.abs(xy) < DETECTION_AREA_FACTOR).all():
-                xy = np.clip(xy, -1.0, 1.0)
-                self._xy = self._xy_ewma(xy, timestamp)
-
-                detected = True
-
-                movement = self._xy_diff(self._xy, timestamp)
-                if (np.abs(movement) > SELECTING_MOVEMENT_THRESHOLD).any():
-                    self._selecting_timestamp = timestamp
-
-                if timestamp - self._selecting_timestamp >= SELECTING_DELAY:
-                    selecting = True
-                    self._selecting_timestamp += SELECTING_REPETITION_INTERVAL
-            else:
-                self._xy_ewma.reset()
-                self._selecting_timestamp = timestamp
-        else:
-            self._xy_ewma.reset()
-            self._selecting_timestamp = timestamp
+        if self._selecting_timestamp is None:
+            self._selecting_timestamp = np.full(self._num_persons, timestamp)
+
+        reference_shoulder_visible = keypoints_scores[:, self._reference_shoulder] > self._min_keypoint_conf
+        wrist_visible = keypoints_scores[:, self._wrist] > self._min_keypoint_conf
+
+        reference_shoulder_xy = self._reference_shoulder_xy_ewma(
+            keypoints[:, self._reference_shoulder], timestamp, reference_shoulder_visible
+        )
+
+        visible = reference_shoulder_visible & wrist_visible & (self._shoulder_width > 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xy = (keypoints[:, self._wrist] - reference_shoulder_xy) / self._shoulder_width[:, np.newaxis] * self._xy_scale
+
+        detected = visible & np.all(np.abs(xy) < DETECTION_AREA_FACTOR, axis=1)
+
+        xy = self._xy_ewma(np.clip(xy, -1.0, 1.0), timestamp, detected)
+
+        movement = self._xy_diff(xy, timestamp, detected)
+        self._selecting_timestamp[detected & np.any(np.abs(movement) > SELECTING_MOVEMENT_THRESHOLD, axis=1)] = timestamp
+
+        selecting = detected & (timestamp - self._selecting_timestamp >= SELECTING_DELAY)
+        self._selecting_timestamp[selecting] += SELECTING_REPETITION_INTERVAL
+
+        self._xy_ewma.reset(~detected)
+        self._selecting_timestamp[~detected] = timestamp
+
+        return PointingBatchResult(detected, xy, selecting)
+
 
-        return PointingResult(detected, self._xy, selecting)
+def _get_xy_scale(aspect_ratio: float) -> npt.NDArray[np.float64]:
+    """Returns the factors that stretch the shorter axis of the hand position to the aspect ratio of the screen"""
+    if aspect_ratio > 1.0:
+        return np.array([1.0, aspect_ratio])
+    elif aspect_ratio < 1.0:
+        return np.array([1.0 / aspect_ratio, 1.0])
+    else:
+        return np.array([1.0, 1.0])
@@ -14,12 +14,15 @@
 # not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
+import time
 
 import numpy as np
 
-from pose.gesture.base import GestureBase
-from pose.keypoints import Keypoints
-from utils.filter import Ewma
+import numpy.typing as npt
+
+from pose.gesture.base import GestureBase, GestureBatchBase
+from pose.keypoints import KeypointIndex, Keypoints
+from utils.filter import FilterBank
 
 SHOULDER_WIDTH_EWMA_TIME_CONSTANT = 0.5
 
@@ -30,22 +33,46 @@ class ShoulderWidthResult:
     width: float
 
 
+@dataclass
+class ShoulderWidthBatchResult:
+    detected: npt.NDArray[np.bool_]
+    width: npt.NDArray[np.float64]
+
+
 class ShoulderWidth(GestureBase[ShoulderWidthResult]):
     """Calculates the shoulder width."""
 
     def __init__(self, min_keypoint_conf: float) -> None:
+        self._batch = ShoulderWidthBatch(min_keypoint_conf, 1)
+
+    def parse_keypoints(self, keypoints: Keypoints, timestamp: float | None = None) -> ShoulderWidthResult:
+        result = self._batch.parse_keypoints(keypoints.xy[np.newaxis], keypoints.conf[np.newaxis], timestamp)
+
+        return ShoulderWidthResult(bool(result.detected[0]), float(result.width[0]))
+
+
+class ShoulderWidthBatch(GestureBatchBase[ShoulderWidthBatchResult]):
+    """Calculates the shoulder width of many persons at once."""
+
+    def __init__(self, min_keypoint_conf: float, num_persons: int) -> None:
         self._min_keypoint_conf = min_keypoint_conf
 
-        self._shoulder_width: float = 0.0
-        self._shoulder_width_ewma = Ewma(SHOULDER_WIDTH_EWMA_TIME_CONSTANT)
+        self._shoulder_width_ewma = FilterBank((num_persons,), SHOULDER_WIDTH_EWMA_TIME_CONSTANT)
+
+    def parse_keypoints(
+        self,
+        keypoints: npt.NDArray[np.float64],
+        keypoints_scores: npt.NDArray[np.float64],
+        timestamp: float | None = None,
+    ) -> ShoulderWidthBatchResult:
+        if timestamp is None:
+            timestamp = time.perf_counter()
 
-    def parse_keypoints(self, keypoints: Keypoints) -> ShoulderWidthResult:
-        if keypoints.left_shoulder.conf > self._min_keypoint_conf and keypoints.right_shoulder.conf > self._min_keypoint_conf:
-            shoulder_width = float(np.linalg.norm(keypoints.left_shoulder.xy - keypoints.right_shoulder.xy))
-            self._shoulder_width = self._shoulder_width_ewma(shoulder_width)
+        detected = (keypoints_scores[:, KeypointIndex.LEFT_SHOULDER] > self._min_keypoint_conf) & (
+            keypoints_scores[:, KeypointIndex.RIGHT_SHOULDER] > self._min_keypoint_conf
+        )
 
-            detected = True
-        else:
-            detected = False
+        shoulder_width = np.linalg.norm(keypoints[:, KeypointIndex.LEFT_SHOULDER] - keypoints[:, KeypointIndex.RIGHT_SHOULDER], axis=1)
+        width = self._shoulder_width_ewma(shoulder_width, timestamp, detected)
 
-        return ShoulderWidthResult(detected, self._shoulder_width)
+        return ShoulderWidthBatchResult(detected, width)
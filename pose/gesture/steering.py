@@ -17,9 +17,10 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from pose.gesture.base import GestureBase
-from pose.keypoints import Keypoints
-from utils.vector import Vector2
+import numpy.typing as npt
+
+from pose.gesture.base import GestureBase, GestureBatchBase
+from pose.keypoints import KeypointIndex, Keypoints
 
 DETECTION_FACTOR = 1.5
 
@@ -30,25 +31,46 @@ class SteeringResult:
     angle: float
 
 
+@dataclass
+class SteeringBatchResult:
+    detected: npt.NDArray[np.bool_]
+    angle: npt.NDArray[np.float64]
+
+
 class Steering(GestureBase[SteeringResult]):
     """Detects a steering gesture and calculates the steering angle."""
 
     def __init__(self, min_keypoint_conf: float) -> None:
+        self._batch = SteeringBatch(min_keypoint_conf, 1)
+
+    def set_shoulder_width(self, shoulder_width: float) -> None:
+        self._batch.set_shoulder_width(np.array([shoulder_width]))
+
+    def parse_keypoints(self, keypoints: Keypoints) -> SteeringResult:
+        result = self._batch.parse_keypoints(keypoints.xy[np.newaxis], keypoints.conf[np.newaxis])
+
+        return SteeringResult(bool(result.detected[0]), float(result.angle[0]))
+
+
+class SteeringBatch(GestureBatchBase[SteeringBatchResult]):
+    """Detects a steering gesture and calculates the steering angle for many persons at once."""
+
+    def __init__(self, min_keypoint_conf: float, num_persons: int) -> None:
         self._min_keypoint_conf = min_keypoint_conf
 
-        self._shoulder_width: float = 0.0
+        self._shoulder_width = np.zeros(num_persons)
 
-    def set_shoulder_width(self, shoulder_width: float) -> None:
+    def set_shoulder_width(self, shoulder_width: npt.NDArray[np.float64]) -> None:
         self._shoulder_width = shoulder_width
 
-    def parse_keypoints(self, keypoints: Keypoints) -> SteeringResult:
-        if keypoints.left_wrist.conf > self._min_keypoint_conf and keypoints.right_wrist.conf > self._min_keypoint_conf:
-            steering_vector = Vector2(keypoints.left_wrist.xy - keypoints.right_wrist.xy)
+    def parse_keypoints(self, keypoints: npt.NDArray[np.float64], keypoints_scores: npt.NDArray[np.float64]) -> SteeringBatchResult:
+        visible = (keypoints_scores[:, KeypointIndex.LEFT_WRIST] > self._min_keypoint_conf) & (
+            keypoints_scores[:, KeypointIndex.RIGHT_WRIST] > self._min_keypoint_conf
+        )
+
+        steering_vector = keypoints[:, KeypointIndex.LEFT_WRIST] - keypoints[:, KeypointIndex.RIGHT_WRIST]
 
-            detected = float(np.linalg.norm(steering_vector.xy)) < self._shoulder_width * DETECTION_FACTOR
-            angle = float(-np.degrees(np.atan2(steering_vector.y, steering_vector.x)))
-        else:
-            detected = False
-            angle = 0.0
+        detected = visible & (np.linalg.norm(steering_vector, axis=1) < self._shoulder_width * DETECTION_FACTOR)
+        angle = np.where(visible, -np.degrees(np.arctan2(steering_vector[:, 1], steering_vector[:, 0])), 0.0)
 
-        return SteeringResult(detected, angle)
+        return SteeringBatchResult(detected, angle)
@@ -14,14 +14,16 @@
 # not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
+import time
 
 import numpy as np
 
-from pose.gesture.base import GestureBase
-from pose.keypoints import Keypoints
-from utils.filter import Derivative, Ewma
+import numpy.typing as npt
+
+from pose.gesture.base import GestureBase, GestureBatchBase
+from pose.keypoints import KeypointIndex, Keypoints
+from utils.filter import FilterBank
 from utils.side import Side
-from utils.vector import Vector2
 
 POSITION_EWMA_TIME_CONSTANT = 0.1
 DEFAULT_SENSITIVITY = 0.16
@@ -36,58 +38,85 @@ class SwipingResult:
     down: bool
 
 
+@dataclass
+class SwipingBatchResult:
+    left: npt.NDArray[np.bool_]
+    right: npt.NDArray[np.bool_]
+    up: npt.NDArray[np.bool_]
+    down: npt.NDArray[np.bool_]
+
+
 class Swiping(GestureBase[SwipingResult]):
     """Detects a swiping gesture."""
 
     def __init__(self, min_keypoint_conf: float, side: Side):
+        self._batch = SwipingBatch(min_keypoint_conf, side, 1)
+
+    def set_sensitivity(self, sensitivity: float) -> None:
+        self._batch.set_sensitivity(0, sensitivity)
+
+    def set_shoulder_width(self, shoulder_width: float) -> None:
+        self._batch.set_shoulder_width(np.array([shoulder_width]))
+
+    def parse_keypoints(self, keypoints: Keypoints, timestamp: float | None = None) -> SwipingResult:
+        result = self._batch.parse_keypoints(keypoints.xy[np.newaxis], keypoints.conf[np.newaxis], timestamp)
+
+        return SwipingResult(bool(result.left[0]), bool(result.right[0]), bool(result.up[0]), bool(result.down[0]))
+
+
+class SwipingBatch(GestureBatchBase[SwipingBatchResult]):
+    """Detects a swiping gesture of many persons at once."""
+
+    def __init__(self, min_keypoint_conf: float, side: Side, num_persons: int):
         self._min_keypoint_conf = min_keypoint_conf
-        self._side = side
+        self._wrist = KeypointIndex.LEFT_WRIST if side is Side.LEFT else KeypointIndex.RIGHT_WRIST
 
-        self._shoulder_width: float = 0.0
-        self._position_diff = Derivative()
-        self._position_ewma = Ewma(POSITION_EWMA_TIME_CONSTANT)
-        self._left: bool = False
-        self._right: bool = False
-        self._up: bool = False
-        self._down: bool = False
+        self._shoulder_width = np.zeros(num_persons)
+        self._position_diff_ewma = FilterBank((num_persons, 2), POSITION_EWMA_TIME_CONSTANT, derivative=True)
+        # Left, right, up and down
+        self._directions = np.zeros((num_persons, 4), dtype=np.bool_)
 
-        self._sensitivity = DEFAULT_SENSITIVITY
+        self._sensitivity = np.full(num_persons, DEFAULT_SENSITIVITY)
 
-    def set_sensitivity(self, sensitivity: float) -> None:
-        self._sensitivity = sensitivity
+    def set_sensitivity(self, person_id: int, sensitivity: float) -> None:
+        self._sensitivity[person_id] = sensitivity
 
-    def set_shoulder_width(self, shoulder_width: float) -> None:
+    def set_shoulder_width(self, shoulder_width: npt.NDArray[np.float64]) -> None:
         self._shoulder_width = shoulder_width
 
-    def parse_keypoints(self, keypoints: Keypoints) -> SwipingResult:
-        if self._side is Side.LEFT:
-            wrist = keypoints.left_wrist
-        else:
-            wrist = keypoints.right_wrist
+    def parse_keypoints(
+        self,
+        keypoints: npt.NDArray[np.float64],
+        keypoints_scores: npt.NDArray[np.float64],
+        timestamp: float | None = None,
+    ) -> SwipingBatchResult:
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        visible = keypoints_scores[:, self._wrist] > self._min_keypoint_conf
+
+        position_diff = self._position_diff_ewma(keypoints[:, self._wrist], timestamp, visible)
 
-        if wrist.conf > self._min_keypoint_conf:
-            position_diff = self._position_ewma(self._position_diff(wrist.xy))
-        else:
-            self._position_diff.reset()
-            self._position_ewma.reset()
-            position_diff = np.array([0.0, 0.0])
+        self._position_diff_ewma.reset(~visible)
+        position_diff[~visible] = 0.0
 
         swipe_threshold_in = self._shoulder_width / self._sensitivity
         swipe_threshold_out = swipe_threshold_in * SWIPE_THRESHOLD_OUT_FACTOR
 
-        position_diff_vector = Vector2(position_diff)
-        norm = np.linalg.norm(position_diff_vector.xy)
-        angle = np.degrees(np.arctan2(-position_diff_vector.y, -position_diff_vector.x))
-
-        if norm > swipe_threshold_in:
-            self._left = bool(angle < -135 or angle > 135)
-            self._right = bool(-45 < angle < 45)
-            self._up = bool(45 < angle < 135)
-            self._down = bool(-135 < angle < -45)
-        elif norm < swipe_threshold_out:
-            self._left = False
-            self._right = False
-            self._up = False
-            self._down = False
-
-        return SwipingResult(self._left, self._right, self._up, self._down)
+        norm = np.linalg.norm(position_diff, axis=1)
+
+        swiping = norm > swipe_threshold_in
+        if swiping.any():
+            angle = np.degrees(np.arctan2(-position_diff[swiping, 1], -position_diff[swiping, 0]))
+            self._directions[swiping] = np.stack(
+                [
+                    (angle < -135) | (angle > 135),
+                    (-45 < angle) & (angle < 45),
+                    (45 < angle) & (angle < 135),
+                    (-135 < angle) & (angle < -45),
+                ],
+                axis=1,
+            )
+        self._directions[~swiping & (norm < swipe_threshold_out)] = False
+
+        return SwipingBatchResult(*self._directions.T.copy())
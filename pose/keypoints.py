@@ -13,12 +13,40 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
+from enum import IntEnum
+
 import numpy as np
 
 import numpy.typing as npt
 
 
+class KeypointIndex(IntEnum):
+    """Indices of the COCO keypoints in the keypoint arrays"""
+
+    NOSE = 0
+    LEFT_EYE = 1
+    RIGHT_EYE = 2
+    LEFT_EAR = 3
+    RIGHT_EAR = 4
+    LEFT_SHOULDER = 5
+    RIGHT_SHOULDER = 6
+    LEFT_ELBOW = 7
+    RIGHT_ELBOW = 8
+    LEFT_WRIST = 9
+    RIGHT_WRIST = 10
+    LEFT_HIP = 11
+    RIGHT_HIP = 12
+    LEFT_KNEE = 13
+    RIGHT_KNEE = 14
+    LEFT_ANKLE = 15
+    RIGHT_ANKLE = 16
+
+
 class Keypoint:
+    """Single keypoint, which is a view into the arrays of its `Keypoints`"""
+
+    __slots__ = ("xy", "_conf")
+
     def __init__(
         self,
         xy: npt.NDArray[np.float64],
@@ -47,81 +75,97 @@ class Keypoint:
 
 
 class Keypoints:
+    """Keypoints of a person
+
+    The named keypoints are created once as views into the arrays, so accessing them does not allocate.
+    Therefore, the arrays have to be updated in place instead of being replaced.
+    """
+
+    __slots__ = ("xy", "conf", "_keypoints")
+
     def __init__(
         self,
-        xy: npt.NDArray[np.float64] = np.empty((17, 2)),
-        conf: npt.NDArray[np.float64] = np.empty((17,)),
+        xy: npt.NDArray[np.float64] | None = None,
+        conf: npt.NDArray[np.float64] | None = None,
     ) -> None:
+        if xy is None:
+            xy = np.zeros((17, 2))
+        if conf is None:
+            conf = np.zeros((17,))
+
         assert xy.shape == (17, 2)
         assert conf.shape == (17,)
 
         self.xy = xy
         self.conf = conf
 
+        # Indexing with an ellipsis returns a 0-d view instead of a copy of the element
+        self._keypoints = tuple(Keypoint(xy[i], conf[i, ...]) for i in range(17))
+
     @property
     def nose(self) -> Keypoint:
-        return Keypoint(self.xy[0], self.conf[0])
+        return self._keypoints[0]
 
     @property
     def left_eye(self) -> Keypoint:
-        return Keypoint(self.xy[1], self.conf[1])
+        return self._keypoints[1]
 
     @property
     def right_eye(self) -> Keypoint:
-        return Keypoint(self.xy[2], self.conf[2])
+        return self._keypoints[2]
 
     @property
     def left_ear(self) -> Keypoint:
-        return Keypoint(self.xy[3], self.conf[3])
+        return self._keypoints[3]
 
     @property
     def right_ear(self) -> Keypoint:
-        return Keypoint(self.xy[4], self.conf[4])
+        return self._keypoints[4]
 
     @property
     def left_shoulder(self) -> Keypoint:
-        return Keypoint(self.xy[5], self.conf[5])
+        return self._keypoints[5]
 
     @property
     def right_shoulder(self) -> Keypoint:
-        return Keypoint(self.xy[6], self.conf[6])
+        return self._keypoints[6]
 
     @property
     def left_elbow(self) -> Keypoint:
-        return Keypoint(self.xy[7], self.conf[7])
+        return self._keypoints[7]
 
     @property
     def right_elbow(self) -> Keypoint:
-        return Keypoint(self.xy[8], self.conf[8])
+        return self._keypoints[8]
 
     @property
     def left_wrist(self) -> Keypoint:
-        return Keypoint(self.xy[9], self.conf[9])
+        return self._keypoints[9]
 
     @property
     def right_wrist(self) -> Keypoint:
-        return Keypoint(self.xy[10], self.conf[10])
+        return self._keypoints[10]
 
     @property
     def left_hip(self) -> Keypoint:
-        return Keypoint(self.xy[11], self.conf[11])
+        return self._keypoints[11]
 
     @property
     def right_hip(self) -> Keypoint:
-        return Keypoint(self.xy[12], self.conf[12])
+        return self._keypoints[12]
 
     @property
     def left_knee(self) -> Keypoint:
-        return Keypoint(self.xy[13], self.conf[13])
+        return self._keypoints[13]
 
     @property
     def right_knee(self) -> Keypoint:
-        return Keypoint(self.xy[14], self.conf[14])
+        return self._keypoints[14]
 
     @property
     def left_ankle(self) -> Keypoint:
-        return Keypoint(self.xy[15], self.conf[15])
+        return self._keypoints[15]
 
     @property
     def right_ankle(self) -> Keypoint:
-        return Keypoint(self.xy[16], self.conf[16])
+        return self._keypoints[16]
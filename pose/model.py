@@ -14,20 +14,37 @@
 # not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
-import os
+from functools import partial
 from pathlib import Path
+import time
 
-from typing import Any, Optional
+from typing import Iterable, Literal, Optional, Self
 
 import numpy as np
-from pydantic import BaseModel, Field
-from ultralytics import YOLO
+from pydantic import BaseModel, Field, model_validator
 
 from cv2.typing import MatLike
 import numpy.typing as npt
 
-from pose.person import Person
-from pose.tracking import Tracking
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker
+from pose.backend.process_pool import ProcessPoolBackend
+from pose.backend.switching import ModelSwitchingBackend
+from pose.backend.ultralytics_backend import UltralyticsBackend
+from pose.extrapolation import InferenceScheduler, KeypointExtrapolator
+from pose.person import Gesture, PersonBatch
+from pose.prediction import KeypointPredictor
+from pose.smoothing import KeypointSmoother
+from pose.tracker import LightweightTracker, UltralyticsTracker
+from pose.tracking import JoinGesture, Tracking
+
+
+def get_image_size(model: str) -> int:
+    """Returns the input image size of an Ultralytics pose model
+
+    >>> get_image_size("yolov8l-pose"), get_image_size("yolov8l-pose-p6")
+    (640, 1280)
+    """
+    return 1280 if "-p6" in model else 640
 
 
 class PoseModelConfig(BaseModel):
@@ -43,6 +60,23 @@ class PoseModelConfig(BaseModel):
         default=False,
         description="use TensorRT for inference",
     )
+    onnxruntime: bool = Field(
+        default=False,
+        description="use ONNX Runtime for inference on the CPU",
+    )
+    int8: bool = Field(
+        default=False,
+        description="use the INT8 model created by quantize.py (requires onnxruntime)",
+    )
+    openvino: bool = Field(
+        default=False,
+        description="use OpenVINO for inference on the CPU",
+    )
+    inference_requests: int = Field(
+        default=2,
+        ge=1,
+        description="number of frames that are inferred at the same time with OpenVINO",
+    )
     device: Optional[str] = Field(
         default=None,
         description="device to use for inference (e.g. cpu, cuda, cuda:0)",
@@ -64,6 +98,117 @@ class PoseModelConfig(BaseModel):
         ge=0.0,
         description="time in seconds until invisible person is unassined",
     )
+    join_gesture: JoinGesture = Field(
+        default="right_arm_raising",
+        description="gesture an unassigned person has to perform to join",
+    )
+    tracker: Literal["botsort", "bytetrack", "lightweight"] = Field(
+        default="botsort",
+        description="tracker for persons (botsort and bytetrack from Ultralytics or a lightweight tracker for few persons)",
+    )
+    switch_models: list[str] = Field(
+        default=[],
+        description="models to switch between at runtime to keep the latency under the target, from fastest to most accurate "
+        "(e.g. yolov8n-pose, yolov8s-pose, yolov8m-pose, yolov8l-pose)",
+    )
+    latency_target: float = Field(
+        default=50.0,
+        gt=0.0,
+        description="target for the 95th percentile of the pose estimation latency per frame in milliseconds when switching models",
+    )
+    latency_window: int = Field(
+        default=60,
+        ge=1,
+        description="number of frames over which the latency is measured before switching models",
+    )
+    upscale_latency_ratio: float = Field(
+        default=0.5,
+        gt=0.0,
+        lt=1.0,
+        description="fraction of the latency target below which a more accurate model is used when switching models",
+    )
+    inference_workers: int = Field(
+        default=1,
+        ge=1,
+        description="number of worker processes that infer frames in parallel, each with its own model",
+    )
+    adaptive_inference: bool = Field(
+        default=False,
+        description="infer only as many frames as the inference budget allows and extrapolate the keypoints in between",
+    )
+    inference_budget: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description="maximum fraction of time spent on inference with adaptive inference",
+    )
+    extrapolation: Literal["velocity", "acceleration"] = Field(
+        default="velocity",
+        description="motion model for extrapolating keypoints (velocity: constant velocity, acceleration: constant acceleration)",
+    )
+    extrapolation_conf_factor: float = Field(
+        default=0.9,
+        ge=0.0,
+        le=1.0,
+        description="factor by which the confidences of extrapolated keypoints are reduced",
+    )
+    max_extrapolation_time: float = Field(
+        default=0.1,
+        ge=0.0,
+        description="time in seconds after the last inference until keypoints are no longer extrapolated",
+    )
+    smoothing: bool = Field(
+        default=False,
+        description="smooth the keypoints of the players with an adaptive One Euro filter to remove jitter",
+    )
+    smoothing_min_cutoff: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="cutoff frequency in Hz for smoothing keypoints that do not move (lower removes more jitter)",
+    )
+    smoothing_beta: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="increase of the smoothing cutoff frequency with the keypoint speed (higher reduces the lag of fast movements)",
+    )
+    latency_compensation: bool = Field(
+        default=False,
+        description="predict the keypoints of the players to the time their inputs are emitted with a Kalman filter",
+    )
+    latency_compensation_max_time: float = Field(
+        default=0.15,
+        ge=0.0,
+        description="maximum time in seconds the keypoints are predicted ahead for latency compensation",
+    )
+    latency_compensation_process_noise: float = Field(
+        default=10.0,
+        gt=0.0,
+        description="process noise of the latency compensation (higher follows changes of the movement faster, lower predicts smoother)",
+    )
+    latency_compensation_measurement_noise: float = Field(
+        default=0.005,
+        gt=0.0,
+        description="standard deviation of the keypoint jitter in image widths for latency compensation",
+    )
+
+    @model_validator(mode="after")
+    def check_backend(self) -> Self:
+        if sum([self.tensorrt, self.onnxruntime, self.openvino]) > 1:
+            raise ValueError("only one of tensorrt, onnxruntime and openvino can be used")
+        if self.int8 and not self.onnxruntime:
+            raise ValueError("int8 requires onnxruntime")
+        if self.switch_models and self.model not in self.switch_models:
+            raise ValueError("model has to be one of switch_models")
+        if self.switch_models and self.openvino:
+            raise ValueError("switch_models cannot be used with openvino")
+        if self.inference_workers > 1 and (self.switch_models or self.openvino):
+            raise ValueError("inference_workers cannot be used with switch_models or openvino")
+
+        return self
+
+    @property
+    def image_size(self) -> int:
+        return get_image_size(self.model)
 
 
 @dataclass
@@ -81,115 +226,344 @@ class PoseStats:
 
 @dataclass
 class PoseFrameResult:
-    result: Any
+    """Result of a frame for plotting, which only consists of arrays and plain values
+
+    It does not hold any references to the frame or to tensors of the backend, so it can be kept or sent to other processes.
+    """
+
+    detections: PoseDetections
     stats: PoseStats
 
 
 def correct_aspect_ratio(
-    frame_shape: tuple[int, int],
+    frame_shape: tuple[int, ...],
     bboxes: npt.NDArray[np.float64],
     keypoints: npt.NDArray[np.float64],
 ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Scales the shorter axis of the normalized bounding boxes and keypoints in place, so both axes have the same scale"""
+    _correct_aspect_ratio(frame_shape, bboxes.reshape(-1, 2, 2))
+    _correct_aspect_ratio(frame_shape, keypoints)
+
+    return bboxes, keypoints
+
+
+def _correct_aspect_ratio(frame_shape: tuple[int, ...], coordinates: npt.NDArray[np.float64]) -> None:
     if frame_shape[1] > frame_shape[0]:
         aspect_ratio = frame_shape[0] / frame_shape[1]
-        shift = (1 - aspect_ratio) / 2
-        bboxes[:, 1] = (bboxes[:, 1] * aspect_ratio) + shift
-        bboxes[:, 3] = (bboxes[:, 3] * aspect_ratio) + shift
-        keypoints[:, :, 1] = (keypoints[:, :, 1] * aspect_ratio) + shift
+        axis_coordinates = coordinates[..., 1]
     else:
         aspect_ratio = frame_shape[1] / frame_shape[0]
-        shift = (1 - aspect_ratio) / 2
-        bboxes[:, 0] = (bboxes[:, 0] * aspect_ratio) + shift
-        bboxes[:, 2] = (bboxes[:, 2] * aspect_ratio) + shift
-        keypoints[:, :, 0] = (keypoints[:, :, 0] * aspect_ratio) + shift
+        axis_coordinates = coordinates[..., 0]
 
-    return bboxes, keypoints
+    axis_coordinates *= aspect_ratio
+    axis_coordinates += (1 - aspect_ratio) / 2
 
 
 def filter_keypoints_at_edge(
     keypoints: npt.NDArray[np.float64],
     keypoints_scores: npt.NDArray[np.float64],
 ) -> npt.NDArray[np.float64]:
-    keypoints_x_at_edge = keypoints[..., 0] % 1.0 == 0.0
-    keypoints_y_at_edge = keypoints[..., 1] % 1.0 == 0.0
-    keypoints_at_edge = keypoints_x_at_edge | keypoints_y_at_edge
+    """Sets the scores of normalized keypoints at the edge of the frame to zero in place, as they are usually outside of it"""
+    keypoints_at_edge = keypoints % 1.0 == 0.0
 
-    keypoints_scores[keypoints_at_edge] = 0.0
+    keypoints_scores[keypoints_at_edge[..., 0] | keypoints_at_edge[..., 1]] = 0.0
 
     return keypoints_scores
 
 
+def normalize_detections(
+    detections: PoseDetections,
+    frame_shape: tuple[int, ...],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Returns the bounding boxes (N, 4), keypoints (N, 17, 2) and keypoint scores (N, 17) of the detections for the gestures
+
+    The coordinates are normalized to the longer side of the frame and centered on the shorter side.
+    The bounding boxes and keypoints are copied into a single array, so they are normalized together in place.
+    """
+    coordinates = np.empty((len(detections), 19, 2))
+    coordinates[:, :2] = detections.bboxes.reshape(-1, 2, 2)
+    coordinates[:, 2:] = detections.keypoints
+    coordinates /= (frame_shape[1], frame_shape[0])
+
+    keypoints = coordinates[:, 2:]
+    keypoints_scores = filter_keypoints_at_edge(keypoints, detections.keypoints_scores.astype(np.float64))
+    _correct_aspect_ratio(frame_shape, coordinates)
+
+    return coordinates[:, :2].reshape(-1, 4), keypoints, keypoints_scores
+
+
+def create_model_backend(config: PoseModelConfig, tracker: PoseTracker, model: str, num_threads: int | None = None) -> PoseBackend:
+    """Creates the backend that runs a single model with the inference library selected in the config
+
+    :param num_threads: maximum number of threads of ONNX Runtime (uses all cores if None)
+    """
+    model_path = Path(config.model_path)
+    image_size = get_image_size(model)
+
+    if config.onnxruntime:
+        # ONNX Runtime is an optional dependency
+        from pose.backend.onnxruntime_backend import OnnxRuntimeBackend  # pylint: disable=import-outside-toplevel
+
+        return OnnxRuntimeBackend(tracker, model_path, model, image_size, config.min_bbox_conf, config.int8, num_threads)
+
+    if config.openvino:
+        # OpenVINO is an optional dependency
+        from pose.backend.openvino_backend import OpenVinoBackend  # pylint: disable=import-outside-toplevel
+
+        return OpenVinoBackend(tracker, model_path, model, image_size, config.min_bbox_conf, config.inference_requests)
+
+    return UltralyticsBackend(
+        tracker,
+        model_path,
+        model,
+        image_size,
+        config.min_bbox_conf,
+        config.device,
+        config.tensorrt,
+    )
+
+
+def create_worker_backend(config: PoseModelConfig, model: str, num_threads: int) -> PoseBackend:
+    """Creates the backend of an inference worker process, which only detects the persons, so its tracker is never used"""
+    return create_model_backend(config, LightweightTracker(config.min_keypoint_conf), model, num_threads)
+
+
 class PoseModel:
     def __init__(
         self,
         config: PoseModelConfig,
         max_num_persons: int = 4,
+        gestures: Iterable[Gesture] = (),
     ) -> None:
         self._config = config
         assert max_num_persons >= 1
 
-        if self._config.tensorrt:
-            if not os.path.exists(Path(self._config.model_path) / f"{self._config.model}.engine"):
-                model_tmp = YOLO(Path(self._config.model_path) / f"{self._config.model}.pt")
-                model_tmp.export(format="engine", simplify=True, half=True, batch=1)
+        self._backend = self._create_backend()
 
-            self._model = YOLO(Path(self._config.model_path) / f"{self._config.model}.engine")
+        self._tracking = Tracking(
+            max_num_persons,
+            self._config.min_keypoint_conf,
+            self._config.tracking_timeout,
+            self._config.join_gesture,
+        )
+
+        self._persons = PersonBatch(max_num_persons, self._config.min_keypoint_conf, gestures)
+        self.person = self._persons.person
+
+        self._scheduler = InferenceScheduler(self._config.inference_budget) if self._config.adaptive_inference else None
+        self._extrapolators = [
+            KeypointExtrapolator(
+                self._config.min_keypoint_conf,
+                self._config.extrapolation,
+                self._config.extrapolation_conf_factor,
+                self._config.max_extrapolation_time,
+            )
+            for _ in range(max_num_persons)
+        ]
+        self._smoother = (
+            KeypointSmoother(
+                max_num_persons, self._config.min_keypoint_conf, self._config.smoothing_min_cutoff, self._config.smoothing_beta
+            )
+            if self._config.smoothing
+            else None
+        )
+        self._predictor = (
+            KeypointPredictor(
+                max_num_persons,
+                self._config.min_keypoint_conf,
+                self._config.latency_compensation_process_noise,
+                self._config.latency_compensation_measurement_noise,
+                self._config.latency_compensation_max_time,
+            )
+            if self._config.latency_compensation
+            else None
+        )
+        self._person_track_ids: list[int | None] = [None] * max_num_persons
+        self._last_result: PoseFrameResult | None = None
+
+    def _create_backend(self) -> PoseBackend:
+        tracker: PoseTracker
+        if self._config.tracker == "lightweight":
+            tracker = LightweightTracker(self._config.min_keypoint_conf)
         else:
-            self._model = YOLO(Path(self._config.model_path) / f"{self._config.model}.pt")
+            tracker = UltralyticsTracker(f"{self._config.tracker}.yaml")
+
+        if self._config.inference_workers > 1:
+            return ProcessPoolBackend(
+                tracker, partial(create_worker_backend, self._config, self._config.model), self._config.inference_workers
+            )
+
+        if not self._config.switch_models:
+            return create_model_backend(self._config, tracker, self._config.model)
+
+        return ModelSwitchingBackend(
+            tracker,
+            self._config.switch_models,
+            [create_model_backend(self._config, tracker, model) for model in self._config.switch_models],
+            self._config.model,
+            self._config.latency_target,
+            self._config.latency_window,
+            self._config.upscale_latency_ratio,
+        )
 
-        self._tracking = Tracking(max_num_persons, self._config.min_keypoint_conf, self._config.tracking_timeout)
+    @property
+    def max_pending_frames(self) -> int:
+        """Maximum number of frames that can be submitted before the detections of the oldest one have to be collected"""
+        return self._backend.max_pending_frames
 
-        self.person = [Person(self._config.min_keypoint_conf) for _ in range(max_num_persons)]
+    def is_inference_due(self, timestamp: float) -> bool:
+        """Returns whether a frame captured at the timestamp should be inferred
 
-    def process_frame(self, frame: MatLike) -> PoseFrameResult:
-        results = self._model.track(
-            frame,
-            persist=True,
-            imgsz=1280 if "-p6" in self._config.model else 640,
-            conf=self._config.min_bbox_conf,
-            device=self._config.device,
-            verbose=False,
-        )
-        stats = self._parse_results(results[0], frame.shape)
+        With adaptive inference, frames that are not inferred have to be processed with `extrapolate()` instead.
+        Without adaptive inference, all frames are inferred.
+        """
+        if self._scheduler is None:
+            return True
 
-        return PoseFrameResult(results[0], stats)
+        return self._scheduler.is_due(timestamp)
 
-    def _parse_results(self, result: Any, frame_shape: tuple[int, int]) -> PoseStats:
-        if result.boxes.conf is not None and result.boxes.id is not None and result.keypoints.conf is not None:
-            bboxes = result.boxes.xyxyn.cpu().numpy()
-            track_ids = result.boxes.id.int().cpu().tolist()
-            keypoints = result.keypoints.xyn.cpu().numpy()
-            keypoints_scores = result.keypoints.conf.cpu().numpy()
+    def submit_frame(self, frame: MatLike) -> None:
+        """Starts detecting and tracking the persons in a frame
 
-            keypoints_scores = filter_keypoints_at_edge(keypoints, keypoints_scores)
-            bboxes, keypoints = correct_aspect_ratio(frame_shape, bboxes, keypoints)
-        else:
-            bboxes = np.empty((0, 4))
-            track_ids = []
-            keypoints = np.empty((0, 17, 2))
-            keypoints_scores = np.empty((0, 17, 1))
+        The frame must not be modified until its detections are collected with `collect_detections()`.
+        """
+        self._backend.submit(frame)
+
+    def collect_detections(self) -> PoseDetections:
+        """Returns the detections of the oldest submitted frame and waits for them if necessary"""
+        detections = self._backend.collect()
+
+        if self._scheduler is not None:
+            self._scheduler.record_latency(sum(detections.speed.values()) / 1000)
+
+        return detections
+
+    def record_output_latency(self, latency: float) -> None:
+        """Records the latency in seconds from the capture of a frame until the inputs of the script were emitted for it
+
+        The latency is used to predict the keypoints to the time the inputs are emitted with latency compensation.
+        """
+        if self._predictor is not None:
+            self._predictor.record_latency(latency)
 
-        self._tracking.retire_tracks(track_ids)
+    def process_detections(
+        self, detections: PoseDetections, frame_shape: tuple[int, ...], timestamp: float | None = None
+    ) -> PoseFrameResult:
+        """Updates the tracking and the persons with the detections of a frame
+
+        :param timestamp: capture timestamp of the frame, which is used for all time-based calculations (defaults to now)
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        stats = self._parse_results(detections, frame_shape, timestamp)
+        self._last_result = PoseFrameResult(detections, stats)
+
+        return self._last_result
+
+    def extrapolate(self, timestamp: float) -> PoseFrameResult:
+        """Updates the persons with keypoints that are extrapolated from the last inferred frames
+
+        The tracking is not updated and the result contains the detections of the last inferred frame.
+        If no frame was inferred yet, the result is empty.
+        """
+        if self._last_result is None:
+            self._last_result = PoseFrameResult(
+                PoseDetections.empty(), PoseStats([], [PosePlayerStats(None, False, None) for _ in range(len(self.person))])
+            )
+
+        keypoints = np.zeros(self._persons.keypoints.shape)
+        keypoints_scores = np.zeros(self._persons.keypoints_scores.shape)
+        for person_id, extrapolator in enumerate(self._extrapolators):
+            keypoints[person_id], keypoints_scores[person_id] = extrapolator.predict(timestamp)
+
+        if self._predictor is not None:
+            keypoints = self._predictor.predict(keypoints, timestamp)
+
+        self._persons.parse_keypoints(keypoints, keypoints_scores, timestamp)
+
+        return self._last_result
+
+    def process_frame(self, frame: MatLike, timestamp: float | None = None) -> PoseFrameResult:
+        """Estimates the poses in a frame and updates the tracking and the persons
+
+        :param timestamp: capture timestamp of the frame, which is used for all time-based calculations (defaults to now)
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        if not self.is_inference_due(timestamp):
+            return self.extrapolate(timestamp)
+
+        self.submit_frame(frame)
+        return self.process_detections(self.collect_detections(), frame.shape, timestamp)
+
+    def close(self) -> None:
+        """Releases the resources of the inference backend, e.g. stops its worker processes"""
+        self._backend.close()
+
+    def _parse_results(self, detections: PoseDetections, frame_shape: tuple[int, ...], timestamp: float) -> PoseStats:
+        assert detections.track_ids is not None
+
+        track_ids: list[int] = detections.track_ids.tolist()
+        _, keypoints, keypoints_scores = normalize_detections(detections, frame_shape)
+
+        self._tracking.retire_tracks(track_ids, timestamp)
 
         unassigned_track_ids = self._tracking.assign_tracks(track_ids, keypoints, keypoints_scores)
 
+        person_track_ids: list[int | None] = []
+        person_keypoints = np.zeros(self._persons.keypoints.shape)
+        person_keypoints_scores = np.zeros(self._persons.keypoints_scores.shape)
         player_stats: list[PosePlayerStats] = []
-        for person_id, person in enumerate(self.person):
+        for person_id in range(len(self.person)):
             try:
                 track_id = self._tracking.person_to_track[person_id]
             except KeyError:
-                person.parse_keypoints(np.zeros((17, 2)), np.zeros((17,)))
+                person_track_ids.append(None)
                 player_stats.append(PosePlayerStats(track_id=None, visible=False, timeout=None))
                 continue
 
+            person_track_ids.append(track_id)
+
             try:
                 idx = track_ids.index(track_id)
             except ValueError:
-                person.parse_keypoints(np.zeros((17, 2)), np.zeros((17,)))
-                player_stats.append(PosePlayerStats(track_id, visible=False, timeout=self._tracking.get_track_timeout(track_id)))
+                player_stats.append(PosePlayerStats(track_id, visible=False, timeout=self._tracking.get_track_timeout(track_id, timestamp)))
                 continue
 
-            person.parse_keypoints(keypoints[idx], keypoints_scores[idx])
+            person_keypoints[person_id] = keypoints[idx]
+            person_keypoints_scores[person_id] = keypoints_scores[idx]
             player_stats.append(PosePlayerStats(track_id, visible=True, timeout=None))
 
+        self._update_persons(person_track_ids, person_keypoints, person_keypoints_scores, timestamp)
+
         return PoseStats(unassigned_track_ids, player_stats)
+
+    def _update_persons(
+        self,
+        track_ids: list[int | None],
+        keypoints: npt.NDArray[np.float64],
+        keypoints_scores: npt.NDArray[np.float64],
+        timestamp: float,
+    ) -> None:
+        # Keypoints of different tracks must not be used together for smoothing, prediction and extrapolation
+        track_changed = np.array([track_id != old_track_id for track_id, old_track_id in zip(track_ids, self._person_track_ids)])
+        self._person_track_ids = track_ids
+
+        if self._smoother is not None:
+            self._smoother.reset(track_changed)
+            keypoints = self._smoother(keypoints, keypoints_scores, timestamp)
+
+        if self._predictor is not None:
+            self._predictor.reset(track_changed)
+            self._predictor.update(keypoints, keypoints_scores, timestamp)
+            self._persons.parse_keypoints(self._predictor.predict(keypoints, timestamp), keypoints_scores, timestamp)
+        else:
+            self._persons.parse_keypoints(keypoints, keypoints_scores, timestamp)
+
+        for person_id, extrapolator in enumerate(self._extrapolators):
+            if track_changed[person_id]:
+                extrapolator.reset()
+
+            extrapolator.update(keypoints[person_id], keypoints_scores[person_id], timestamp)
@@ -13,136 +13,307 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, Callable, TypeVar, cast
+import time
+from typing import Any, Callable, Iterable, Literal, TypeVar, cast, get_args
 import numpy as np
 
 import numpy.typing as npt
 
-from pose.gesture.arm_raising import ArmRaising, ArmRaisingResult
-from pose.gesture.jumping import Jumping, JumpingResult
-from pose.gesture.leaning import Leaning, LeaningResult
-from pose.gesture.pointing import Pointing, PointingResult
-from pose.gesture.shoulder_width import ShoulderWidth, ShoulderWidthResult
-from pose.gesture.steering import Steering, SteeringResult
-from pose.gesture.swiping import Swiping, SwipingResult
+from pose.gesture.arm_raising import ArmRaisingBatch, ArmRaisingBatchResult, ArmRaisingResult
+from pose.gesture.jumping import JumpingBatch, JumpingBatchResult, JumpingResult
+from pose.gesture.leaning import LeaningBatch, LeaningBatchResult, LeaningResult
+from pose.gesture.pointing import PointingBatch, PointingBatchResult, PointingResult
+from pose.gesture.shoulder_width import ShoulderWidthBatch, ShoulderWidthBatchResult, ShoulderWidthResult
+from pose.gesture.steering import SteeringBatch, SteeringBatchResult, SteeringResult
+from pose.gesture.swiping import SwipingBatch, SwipingBatchResult, SwipingResult
 from pose.keypoints import Keypoints
 from utils.side import Side
 
 T = TypeVar("T")
 
+Gesture = Literal[
+    "left_arm_raising",
+    "right_arm_raising",
+    "jumping",
+    "leaning",
+    "left_hand_pointing",
+    "right_hand_pointing",
+    "shoulder_width",
+    "steering",
+    "left_hand_swiping",
+    "right_hand_swiping",
+]
 
-class Person:
-    def __init__(self, min_keypoint_conf: float) -> None:
-        self.keypoints = Keypoints()
+GESTURE_DEPENDENCIES: dict[Gesture, tuple[Gesture, ...]] = {
+    "jumping": ("shoulder_width",),
+    "left_hand_pointing": ("shoulder_width",),
+    "right_hand_pointing": ("shoulder_width",),
+    "steering": ("shoulder_width",),
+    "left_hand_swiping": ("shoulder_width",),
+    "right_hand_swiping": ("shoulder_width",),
+}
+
+
+def plan_gestures(gestures: Iterable[Gesture]) -> list[Gesture]:
+    """Returns the gestures and their dependencies in the order they have to be evaluated
+
+    >>> plan_gestures(["steering", "right_arm_raising", "jumping"])
+    ['shoulder_width', 'steering', 'right_arm_raising', 'jumping']
+    """
+    plan: list[Gesture] = []
+
+    def add(gesture: Gesture) -> None:
+        if gesture not in get_args(Gesture):
+            raise ValueError(f"Unknown gesture {gesture}")
+        if gesture in plan:
+            return
+
+        for dependency in GESTURE_DEPENDENCIES.get(gesture, ()):
+            add(dependency)
+        plan.append(gesture)
+
+    for gesture in gestures:
+        add(gesture)
+
+    return plan
+
+
+class PersonBatch:
+    """Keypoints and gestures of all persons
+
+    The keypoints of all persons are stored in single arrays, so each gesture is evaluated for all persons at once.
+    The planned gestures are evaluated in the order of their dependencies for every frame, so their filters see every frame.
+    Other gestures are evaluated on their first access and added to the plan, so they are evaluated for every following frame.
+    The results are cached until the next frame.
+
+    :param gestures: gestures that are evaluated for every frame
+    """
+
+    def __init__(self, num_persons: int, min_keypoint_conf: float, gestures: Iterable[Gesture] = ()) -> None:
+        self._plan = plan_gestures(gestures)
+
+        self.keypoints = np.zeros((num_persons, 17, 2))
+        self.keypoints_scores = np.zeros((num_persons, 17))
+        self.timestamp: float = 0.0
 
         self.cache: dict[Callable[..., Any], Any] = {}
 
-        self._left_arm_raising = ArmRaising(min_keypoint_conf, Side.LEFT)
-        self._right_arm_raising = ArmRaising(min_keypoint_conf, Side.RIGHT)
-        self._jumping = Jumping(min_keypoint_conf)
-        self._leaning = Leaning(min_keypoint_conf)
-        self._left_hand_pointing = Pointing(min_keypoint_conf, Side.LEFT)
-        self._right_hand_pointing = Pointing(min_keypoint_conf, Side.RIGHT)
-        self._shoulder_width = ShoulderWidth(min_keypoint_conf)
-        self._steering = Steering(min_keypoint_conf)
-        self._left_hand_swiping = Swiping(min_keypoint_conf, Side.LEFT)
-        self._right_hand_swiping = Swiping(min_keypoint_conf, Side.RIGHT)
+        self._left_arm_raising = ArmRaisingBatch(min_keypoint_conf, Side.LEFT)
+        self._right_arm_raising = ArmRaisingBatch(min_keypoint_conf, Side.RIGHT)
+        self._jumping = JumpingBatch(min_keypoint_conf, num_persons)
+        self._leaning = LeaningBatch(min_keypoint_conf)
+        self._left_hand_pointing = PointingBatch(min_keypoint_conf, Side.LEFT, num_persons)
+        self._right_hand_pointing = PointingBatch(min_keypoint_conf, Side.RIGHT, num_persons)
+        self._shoulder_width = ShoulderWidthBatch(min_keypoint_conf, num_persons)
+        self._steering = SteeringBatch(min_keypoint_conf, num_persons)
+        self._left_hand_swiping = SwipingBatch(min_keypoint_conf, Side.LEFT, num_persons)
+        self._right_hand_swiping = SwipingBatch(min_keypoint_conf, Side.RIGHT, num_persons)
+
+        self.person = [Person(self, person_id) for person_id in range(num_persons)]
 
     def parse_keypoints(
         self,
         keypoints: npt.NDArray[np.float64],
         keypoints_scores: npt.NDArray[np.float64],
+        timestamp: float | None = None,
     ) -> None:
+        """Updates the keypoints (N, 17, 2) and keypoint scores (N, 17) of all persons"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
         self.cache = {}
 
-        self.keypoints = Keypoints(keypoints, keypoints_scores)
+        self.keypoints[...] = keypoints
+        self.keypoints_scores[...] = keypoints_scores
+        self.timestamp = timestamp
+
+        for gesture in self._plan:
+            getattr(self, gesture)
+
+    @property
+    def plan(self) -> list[Gesture]:
+        """Gestures that are evaluated for every frame in the order of evaluation"""
+        return self._plan.copy()
 
     @staticmethod
     def _cache(func: Callable[..., T]) -> Callable[..., T]:
-        def wrapper(self: "Person") -> T:
+        def wrapper(self: "PersonBatch") -> T:
             if func in self.cache:
                 result = cast(T, self.cache[func])
             else:
                 result = func(self)
                 self.cache[func] = result
 
+                gesture = cast(Gesture, func.__name__)
+                if gesture not in self._plan:
+                    self._plan = plan_gestures([*self._plan, gesture])
+
             return result
 
         return wrapper
 
     @property
     @_cache
-    def left_arm_raising(self) -> ArmRaisingResult:
-        return self._left_arm_raising.parse_keypoints(self.keypoints)
+    def left_arm_raising(self) -> ArmRaisingBatchResult:
+        return self._left_arm_raising.parse_keypoints(self.keypoints, self.keypoints_scores)
 
     @property
     @_cache
-    def right_arm_raising(self) -> ArmRaisingResult:
-        return self._right_arm_raising.parse_keypoints(self.keypoints)
+    def right_arm_raising(self) -> ArmRaisingBatchResult:
+        return self._right_arm_raising.parse_keypoints(self.keypoints, self.keypoints_scores)
 
     @property
     @_cache
-    def jumping(self) -> JumpingResult:
+    def jumping(self) -> JumpingBatchResult:
         self._jumping.set_shoulder_width(self.shoulder_width.width)
 
-        return self._jumping.parse_keypoints(self.keypoints)
+        return self._jumping.parse_keypoints(self.keypoints, self.keypoints_scores, self.timestamp)
 
-    def set_jumping_sensitivity(self, sensitivity: float) -> None:
-        self._jumping.set_sensitivity(sensitivity)
+    def set_jumping_sensitivity(self, person_id: int, sensitivity: float) -> None:
+        self._jumping.set_sensitivity(person_id, sensitivity)
 
     @property
     @_cache
-    def leaning(self) -> LeaningResult:
-        return self._leaning.parse_keypoints(self.keypoints)
+    def leaning(self) -> LeaningBatchResult:
+        return self._leaning.parse_keypoints(self.keypoints, self.keypoints_scores)
 
     @property
     @_cache
-    def left_hand_pointing(self) -> PointingResult:
+    def left_hand_pointing(self) -> PointingBatchResult:
         self._left_hand_pointing.set_shoulder_width(self.shoulder_width.width)
 
-        return self._left_hand_pointing.parse_keypoints(self.keypoints)
+        return self._left_hand_pointing.parse_keypoints(self.keypoints, self.keypoints_scores, self.timestamp)
 
-    def set_left_hand_pointing_aspect_ratio(self, aspect_radio: tuple[int, int]) -> None:
-        self._left_hand_pointing.set_aspect_ratio(aspect_radio)
+    def set_left_hand_pointing_aspect_ratio(self, person_id: int, aspect_radio: tuple[int, int]) -> None:
+        self._left_hand_pointing.set_aspect_ratio(person_id, aspect_radio)
 
     @property
     @_cache
-    def right_hand_pointing(self) -> PointingResult:
+    def right_hand_pointing(self) -> PointingBatchResult:
         self._right_hand_pointing.set_shoulder_width(self.shoulder_width.width)
 
-        return self._right_hand_pointing.parse_keypoints(self.keypoints)
+        return self._right_hand_pointing.parse_keypoints(self.keypoints, self.keypoints_scores, self.timestamp)
 
-    def set_right_hand_pointing_aspect_ratio(self, aspect_radio: tuple[int, int]) -> None:
-        self._right_hand_pointing.set_aspect_ratio(aspect_radio)
+    def set_right_hand_pointing_aspect_ratio(self, person_id: int, aspect_radio: tuple[int, int]) -> None:
+        self._right_hand_pointing.set_aspect_ratio(person_id, aspect_radio)
 
     @property
     @_cache
-    def shoulder_width(self) -> ShoulderWidthResult:
-        return self._shoulder_width.parse_keypoints(self.keypoints)
+    def shoulder_width(self) -> ShoulderWidthBatchResult:
+        return self._shoulder_width.parse_keypoints(self.keypoints, self.keypoints_scores, self.timestamp)
 
     @property
     @_cache
-    def steering(self) -> SteeringResult:
+    def steering(self) -> SteeringBatchResult:
         self._steering.set_shoulder_width(self.shoulder_width.width)
 
-        return self._steering.parse_keypoints(self.keypoints)
+        return self._steering.parse_keypoints(self.keypoints, self.keypoints_scores)
 
     @property
     @_cache
-    def left_hand_swiping(self) -> SwipingResult:
+    def left_hand_swiping(self) -> SwipingBatchResult:
         self._left_hand_swiping.set_shoulder_width(self.shoulder_width.width)
 
-        return self._left_hand_swiping.parse_keypoints(self.keypoints)
+        return self._left_hand_swiping.parse_keypoints(self.keypoints, self.keypoints_scores, self.timestamp)
 
-    def set_left_hand_swiping_sensitivity(self, sensitivity: float) -> None:
-        self._left_hand_swiping.set_sensitivity(sensitivity)
+    def set_left_hand_swiping_sensitivity(self, person_id: int, sensitivity: float) -> None:
+        self._left_hand_swiping.set_sensitivity(person_id, sensitivity)
 
     @property
     @_cache
-    def right_hand_swiping(self) -> SwipingResult:
+    def right_hand_swiping(self) -> SwipingBatchResult:
         self._right_hand_swiping.set_shoulder_width(self.shoulder_width.width)
 
-        return self._right_hand_swiping.parse_keypoints(self.keypoints)
+        return self._right_hand_swiping.parse_keypoints(self.keypoints, self.keypoints_scores, self.timestamp)
+
+    def set_right_hand_swiping_sensitivity(self, person_id: int, sensitivity: float) -> None:
+        self._right_hand_swiping.set_sensitivity(person_id, sensitivity)
+
+
+class Person:
+    """Keypoints and gestures of a single person, which are views into a `PersonBatch`"""
+
+    def __init__(self, batch: PersonBatch, person_id: int) -> None:
+        self._batch = batch
+        self._person_id = person_id
+
+        self.keypoints = Keypoints(batch.keypoints[person_id], batch.keypoints_scores[person_id])
+
+    @property
+    def timestamp(self) -> float:
+        return self._batch.timestamp
+
+    @property
+    def left_arm_raising(self) -> ArmRaisingResult:
+        result = self._batch.left_arm_raising
+        return ArmRaisingResult(bool(result.detected[self._person_id]))
+
+    @property
+    def right_arm_raising(self) -> ArmRaisingResult:
+        result = self._batch.right_arm_raising
+        return ArmRaisingResult(bool(result.detected[self._person_id]))
+
+    @property
+    def jumping(self) -> JumpingResult:
+        result = self._batch.jumping
+        return JumpingResult(bool(result.detected[self._person_id]))
+
+    def set_jumping_sensitivity(self, sensitivity: float) -> None:
+        self._batch.set_jumping_sensitivity(self._person_id, sensitivity)
+
+    @property
+    def leaning(self) -> LeaningResult:
+        result = self._batch.leaning
+        return LeaningResult(bool(result.detected[self._person_id]), float(result.angle[self._person_id]))
+
+    @property
+    def left_hand_pointing(self) -> PointingResult:
+        result = self._batch.left_hand_pointing
+        return PointingResult(bool(result.detected[self._person_id]), result.xy[self._person_id], bool(result.selecting[self._person_id]))
+
+    def set_left_hand_pointing_aspect_ratio(self, aspect_radio: tuple[int, int]) -> None:
+        self._batch.set_left_hand_pointing_aspect_ratio(self._person_id, aspect_radio)
+
+    @property
+    def right_hand_pointing(self) -> PointingResult:
+        result = self._batch.right_hand_pointing
+        return PointingResult(bool(result.detected[self._person_id]), result.xy[self._person_id], bool(result.selecting[self._person_id]))
+
+    def set_right_hand_pointing_aspect_ratio(self, aspect_radio: tuple[int, int]) -> None:
+        self._batch.set_right_hand_pointing_aspect_ratio(self._person_id, aspect_radio)
+
+    @property
+    def shoulder_width(self) -> ShoulderWidthResult:
+        result = self._batch.shoulder_width
+        return ShoulderWidthResult(bool(result.detected[self._person_id]), float(result.width[self._person_id]))
+
+    @property
+    def steering(self) -> SteeringResult:
+        result = self._batch.steering
+        return SteeringResult(bool(result.detected[self._person_id]), float(result.angle[self._person_id]))
+
+    @property
+    def left_hand_swiping(self) -> SwipingResult:
+        result = self._batch.left_hand_swiping
+        return SwipingResult(
+            bool(result.left[self._person_id]),
+            bool(result.right[self._person_id]),
+            bool(result.up[self._person_id]),
+            bool(result.down[self._person_id]),
+        )
+
+    def set_left_hand_swiping_sensitivity(self, sensitivity: float) -> None:
+        self._batch.set_left_hand_swiping_sensitivity(self._person_id, sensitivity)
+
+    @property
+    def right_hand_swiping(self) -> SwipingResult:
+        result = self._batch.right_hand_swiping
+        return SwipingResult(
+            bool(result.left[self._person_id]),
+            bool(result.right[self._person_id]),
+            bool(result.up[self._person_id]),
+            bool(result.down[self._person_id]),
+        )
 
     def set_right_hand_swiping_sensitivity(self, sensitivity: float) -> None:
-        self._right_hand_swiping.set_sensitivity(sensitivity)
+        self._batch.set_right_hand_swiping_sensitivity(self._person_id, sensitivity)
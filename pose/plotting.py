@@ -14,11 +14,13 @@
 # not, see <https://www.gnu.org/licenses/>.
 
 import cv2
+import numpy as np
 from ultralytics.utils.plotting import Annotator
 
 from cv2.typing import MatLike
 
 from pose.model import PoseFrameResult
+from pose.tracking import JoinGesture
 
 
 PLAYER_COLORS = [
@@ -29,6 +31,14 @@ PLAYER_COLORS = [
 ]
 
 
+JOIN_INSTRUCTIONS: dict[JoinGesture, str] = {
+    "right_arm_raising": "raise right arm to join",
+    "left_arm_raising": "raise left arm to join",
+    "any_arm_raising": "raise an arm to join",
+    "both_arms_raising": "raise both arms to join",
+}
+
+
 def get_player_color(player_id: int) -> tuple[int, int, int]:
     return PLAYER_COLORS[player_id % len(PLAYER_COLORS)]
 
@@ -40,25 +50,29 @@ def _annotate_persons(frame: MatLike, pose_result: PoseFrameResult, min_keypoint
         else {}
     )
 
-    annotator = Annotator(frame)
-    for bbox, keypoints in zip(pose_result.result.boxes, pose_result.result.keypoints):
-        if bbox.id is None:
-            continue
-
-        track_id = int(bbox.id)
+    detections = pose_result.detections
+    if detections.track_ids is None:
+        return
 
+    annotator = Annotator(frame)
+    for bbox, track_id, keypoints, keypoints_scores in zip(
+        detections.bboxes,
+        detections.track_ids.tolist(),
+        detections.keypoints,
+        detections.keypoints_scores,
+    ):
         if track_id in player_ids:
-            annotator.kpts(keypoints.data[0], conf_thres=min_keypoint_conf)
+            annotator.kpts(np.concatenate([keypoints, keypoints_scores[:, None]], axis=1), conf_thres=min_keypoint_conf)
             annotator.box_label(
-                bbox.xyxy.squeeze(),
+                bbox,
                 f"Player {player_ids[track_id] + 1}",
                 get_player_color(player_ids[track_id]),
             )
         else:
-            annotator.box_label(bbox.xyxy.squeeze())
+            annotator.box_label(bbox)
 
 
-def _draw_footer(frame: MatLike, pose_result: PoseFrameResult, max_num_players: int) -> None:
+def _draw_footer(frame: MatLike, pose_result: PoseFrameResult, max_num_players: int, join_gesture: JoinGesture) -> None:
     assert max_num_players >= 1
 
     joinable = True
@@ -71,7 +85,7 @@ def _draw_footer(frame: MatLike, pose_result: PoseFrameResult, max_num_players:
             else:
                 status = "assigned"
         elif joinable:
-            status = "raise right arm to join"
+            status = JOIN_INSTRUCTIONS[join_gesture]
             joinable = False
         else:
             status = "not assigned"
@@ -102,9 +116,10 @@ def _draw_footer(frame: MatLike, pose_result: PoseFrameResult, max_num_players:
 
 
 def _add_inference_stats(frame: MatLike, pose_result: PoseFrameResult) -> None:
+    speed = pose_result.detections.speed
     cv2.putText(
         frame,
-        f"{pose_result.result.speed["preprocess"]:.1f}ms preprocess, {pose_result.result.speed["inference"]:.1f}ms inference, {pose_result.result.speed["postprocess"]:.1f}ms postprocess",
+        f"{speed.get("preprocess", 0.0):.1f}ms preprocess, {speed.get("inference", 0.0):.1f}ms inference, {speed.get("postprocess", 0.0):.1f}ms postprocess",
         (8, 16),
         cv2.FONT_HERSHEY_PLAIN,
         0.75,
@@ -112,7 +127,13 @@ def _add_inference_stats(frame: MatLike, pose_result: PoseFrameResult) -> None:
     )
 
 
-def annotate_frame(frame: MatLike, pose_result: PoseFrameResult, min_keypoint_conf: float, max_num_players: int) -> None:
+def annotate_frame(
+    frame: MatLike,
+    pose_result: PoseFrameResult,
+    min_keypoint_conf: float,
+    max_num_players: int,
+    join_gesture: JoinGesture = "right_arm_raising",
+) -> None:
     _annotate_persons(frame, pose_result, min_keypoint_conf)
-    _draw_footer(frame, pose_result, max_num_players)
+    _draw_footer(frame, pose_result, max_num_players, join_gesture)
     _add_inference_stats(frame, pose_result)
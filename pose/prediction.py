@@ -0,0 +1,122 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+import numpy.typing as npt
+
+from pose.extrapolation import LATENCY_SMOOTHING
+
+INITIAL_VELOCITY_VARIANCE = 1.0
+
+
+class KeypointPredictor:
+    """Predicts the keypoints of all persons at once to the time their inputs are emitted to compensate the latency
+
+    Each coordinate of a keypoint is estimated by a separate Kalman filter with a constant velocity model, whose covariance is shared by
+    both coordinates, as they are measured together.
+    Keypoints are only filtered while they are visible and start over with an unknown velocity once they are visible again.
+    The latency from the capture of a frame until its inputs are emitted is smoothed over the last frames
+    and keypoints are not predicted further than `max_time`.
+
+    >>> predictor = KeypointPredictor(1, 0.5, 10.0, 0.001, 0.1)
+    >>> for i in range(10):
+    ...     predictor.update(np.full((1, 17, 2), 0.1 * i), np.ones((1, 17)), 0.1 * i)
+    >>> predictor.record_latency(0.05)
+    >>> keypoints = predictor.predict(np.zeros((1, 17, 2)), 0.9)
+    >>> round(float(keypoints[0, 0, 0]), 3)
+    0.95
+    """
+
+    def __init__(self, num_persons: int, min_keypoint_conf: float, process_noise: float, measurement_noise: float, max_time: float) -> None:
+        self._min_keypoint_conf = min_keypoint_conf
+        self._process_noise = process_noise
+        self._measurement_variance = measurement_noise**2
+        self._max_time = max_time
+
+        self._position = np.zeros((num_persons, 17, 2))
+        self._velocity = np.zeros((num_persons, 17, 2))
+        # Entries of the symmetric covariance matrix of position and velocity
+        self._position_variance = np.zeros((num_persons, 17))
+        self._covariance = np.zeros((num_persons, 17))
+        self._velocity_variance = np.zeros((num_persons, 17))
+        self._initialized = np.zeros((num_persons, 17), dtype=np.bool_)
+        self._timestamp: float | None = None
+
+        self._latency: float | None = None
+
+    @property
+    def latency(self) -> float:
+        """Smoothed latency in seconds from the capture of a frame until its inputs are emitted"""
+        return 0.0 if self._latency is None else self._latency
+
+    def record_latency(self, latency: float) -> None:
+        """Records the latency in seconds from the capture of a frame until its inputs were emitted"""
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += LATENCY_SMOOTHING * (latency - self._latency)
+
+    def reset(self, person_ids: npt.NDArray[np.bool_]) -> None:
+        """Resets the filters of the selected persons, e.g. when their track changes"""
+        self._initialized[person_ids] = False
+
+    def update(self, keypoints: npt.NDArray[np.float64], keypoints_scores: npt.NDArray[np.float64], timestamp: float) -> None:
+        """Updates the filters with the keypoints (N, 17, 2) and keypoint scores (N, 17) of an inferred frame"""
+        time_diff = 0.0 if self._timestamp is None else timestamp - self._timestamp
+        self._timestamp = timestamp
+
+        # Prediction with the velocity and a white noise acceleration
+        self._position += self._velocity * time_diff
+        self._position_variance += time_diff * (2.0 * self._covariance + time_diff * self._velocity_variance)
+        self._position_variance += self._process_noise * time_diff**3 / 3.0
+        self._covariance += time_diff * self._velocity_variance + self._process_noise * time_diff**2 / 2.0
+        self._velocity_variance += self._process_noise * time_diff
+
+        # Correction with the measured keypoints
+        visible = keypoints_scores > self._min_keypoint_conf
+        corrected = visible & self._initialized
+        innovation_variance = self._position_variance + self._measurement_variance
+        position_gain = np.where(corrected, self._position_variance / innovation_variance, 0.0)
+        velocity_gain = np.where(corrected, self._covariance / innovation_variance, 0.0)
+        innovation = keypoints - self._position
+        self._position += position_gain[..., None] * innovation
+        self._velocity += velocity_gain[..., None] * innovation
+        self._velocity_variance -= velocity_gain * self._covariance
+        self._position_variance *= 1.0 - position_gain
+        self._covariance *= 1.0 - position_gain
+
+        # Keypoints that became visible start at their measured position with an unknown velocity
+        started = visible & ~self._initialized
+        self._position[started] = keypoints[started]
+        self._velocity[started] = 0.0
+        self._position_variance[started] = self._measurement_variance
+        self._covariance[started] = 0.0
+        self._velocity_variance[started] = INITIAL_VELOCITY_VARIANCE
+
+        self._initialized = visible
+
+    def predict(self, keypoints: npt.NDArray[np.float64], timestamp: float) -> npt.NDArray[np.float64]:
+        """Returns the keypoints (N, 17, 2) predicted to the expected emission time of the frame captured at the timestamp
+
+        Keypoints that are not filtered are taken from the given keypoints (N, 17, 2).
+        """
+        if self._timestamp is None:
+            return keypoints
+
+        time_diff = timestamp + min(self.latency, self._max_time) - self._timestamp
+        prediction = self._position + self._velocity * time_diff
+
+        return np.where(self._initialized[..., None], prediction, keypoints)
@@ -0,0 +1,241 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+from pathlib import Path
+import tempfile
+
+import numpy as np
+from onnxruntime.quantization import CalibrationDataReader, CalibrationMethod, QuantFormat, QuantType, quantize_static
+from onnxruntime.quantization.shape_inference import quant_pre_process
+
+from cv2.typing import MatLike
+import numpy.typing as npt
+
+from pose.backend.base import PoseDetections
+from pose.backend.onnxruntime_backend import INT8_SUFFIX, OnnxRuntimeBackend, export_onnx_model
+from pose.backend.processing import COCO_KEYPOINT_SIGMAS, box_iou, letterbox
+from pose.camera import CameraConfig, open_frame_source
+
+MIN_MATCH_IOU = 0.5
+ONNX_INPUT_NAME = "images"
+
+
+def read_frames(config: CameraConfig, max_frames: int) -> list[MatLike]:
+    """Reads up to `max_frames` frames that are evenly distributed over a recording"""
+    assert config.file is not None, "a recorded video file or image folder has to be given"
+    assert max_frames >= 1
+
+    frames: list[MatLike] = []
+    stride = 1
+    index = 0
+
+    source = open_frame_source(config.model_copy(update={"playback": "fast"}))
+    try:
+        while source.is_opened():
+            ret, frame = source.read()
+            if not ret:
+                break
+
+            if index % stride == 0:
+                frames.append(frame)
+
+                # Only every other frame is kept when there are too many, so long recordings fit into memory
+                if len(frames) >= 2 * max_frames:
+                    frames = frames[::2]
+                    stride *= 2
+
+            index += 1
+    finally:
+        source.release()
+
+    return frames[:: -(-len(frames) // max_frames)] if len(frames) > max_frames else frames
+
+
+class FrameCalibrationDataReader(CalibrationDataReader):  # type: ignore[misc]
+    """Provides recorded frames as calibration data for the static quantization of ONNX Runtime"""
+
+    def __init__(self, frames: list[MatLike], input_name: str, image_size: int) -> None:
+        self._frames = iter(frames)
+        self._input_name = input_name
+        self._image_size = image_size
+
+    def get_next(self) -> dict[str, npt.NDArray[np.float32]] | None:
+        frame = next(self._frames, None)
+        if frame is None:
+            return None
+
+        tensor, _, _ = letterbox(frame, self._image_size)
+        return {self._input_name: tensor}
+
+
+def quantize_model(model_path: Path, model: str, image_size: int, frames: list[MatLike]) -> Path:
+    """Quantizes the ONNX model to INT8 using the frames as calibration data and returns the path of the cached INT8 model
+
+    An existing INT8 model is overwritten, so the model is always calibrated on the given frames.
+    Only the convolutions are quantized, so the decoding of the bounding boxes and keypoints in the head stays in FP32.
+    """
+    int8_path = model_path / f"{model}{INT8_SUFFIX}"
+
+    onnx_path = export_onnx_model(model_path, model, image_size)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        preprocessed_path = Path(tmp_dir) / onnx_path.name
+        quant_pre_process(onnx_path, preprocessed_path)
+
+        quantize_static(
+            preprocessed_path,
+            int8_path,
+            FrameCalibrationDataReader(frames, ONNX_INPUT_NAME, image_size),
+            quant_format=QuantFormat.QDQ,
+            op_types_to_quantize=["Conv"],
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            calibrate_method=CalibrationMethod.MinMax,
+        )
+
+    return int8_path
+
+
+def object_keypoint_similarity(
+    keypoints: npt.NDArray[np.float32],
+    reference_keypoints: npt.NDArray[np.float32],
+    reference_visible: npt.NDArray[np.bool_],
+    area: float,
+) -> float:
+    """Computes the object keypoint similarity (OKS) of 17 keypoints (17, 2) to reference keypoints like the COCO evaluation
+
+    Only keypoints that are visible in the reference are compared.
+
+    >>> keypoints = np.zeros((17, 2))
+    >>> object_keypoint_similarity(keypoints, keypoints, np.ones(17, dtype=bool), 100.0)
+    1.0
+    >>> object_keypoint_similarity(keypoints, keypoints, np.zeros(17, dtype=bool), 100.0)
+    nan
+    """
+    if not reference_visible.any():
+        return float("nan")
+
+    squared_distances = np.sum((keypoints - reference_keypoints) ** 2, axis=1)
+    variances = (2 * COCO_KEYPOINT_SIGMAS) ** 2
+    similarities = np.exp(-squared_distances / (2 * max(area, float(np.finfo(np.float32).eps)) * variances))
+
+    return float(similarities[reference_visible].mean())
+
+
+def compare_detections(detections: PoseDetections, reference: PoseDetections, min_keypoint_conf: float) -> tuple[list[float], int]:
+    """Matches detections to reference detections by their bounding boxes and computes the OKS of each matched pair
+
+    :return: OKS of the matched pairs and number of reference detections without match
+    """
+    similarities: list[float] = []
+    unmatched = 0
+    available = np.ones(len(detections), dtype=bool)
+
+    for i in range(len(reference)):
+        iou = box_iou(reference.bboxes[i], detections.bboxes) if len(detections) > 0 else np.empty((0,))
+        iou = np.where(available, iou, 0.0)
+        if len(iou) == 0 or iou.max() < MIN_MATCH_IOU:
+            unmatched += 1
+            continue
+
+        j = int(iou.argmax())
+        available[j] = False
+
+        x1, y1, x2, y2 = reference.bboxes[i]
+        similarity = object_keypoint_similarity(
+            detections.keypoints[j],
+            reference.keypoints[i],
+            reference.keypoints_scores[i] >= min_keypoint_conf,
+            float((x2 - x1) * (y2 - y1)),
+        )
+        if not np.isnan(similarity):
+            similarities.append(similarity)
+
+    return similarities, unmatched
+
+
+@dataclass
+class LatencyStats:
+    mean: float
+    """mean latency per frame in milliseconds"""
+    p95: float
+    """95th percentile of the latency per frame in milliseconds"""
+
+    @classmethod
+    def from_latencies(cls, latencies: list[float]) -> "LatencyStats":
+        return cls(float(np.mean(latencies)), float(np.percentile(latencies, 95)))
+
+
+@dataclass
+class QuantizationReport:
+    num_frames: int
+    """number of evaluated frames"""
+    num_persons: int
+    """number of persons detected by the FP32 model"""
+    missed_persons: int
+    """number of persons detected by the FP32 model that are not detected by the INT8 model"""
+    mean_oks: float
+    """mean OKS of the keypoints of the INT8 model compared to the FP32 model"""
+    fp32_latency: LatencyStats
+    int8_latency: LatencyStats
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [
+                f"Evaluated frames: {self.num_frames}",
+                f"Persons detected by FP32 model: {self.num_persons} (missed by INT8 model: {self.missed_persons})",
+                f"Mean OKS of INT8 model: {self.mean_oks:.3f}",
+                f"FP32 latency: {self.fp32_latency.mean:.1f} ms (p95: {self.fp32_latency.p95:.1f} ms)",
+                f"INT8 latency: {self.int8_latency.mean:.1f} ms (p95: {self.int8_latency.p95:.1f} ms)",
+                f"Speedup: {self.fp32_latency.mean / self.int8_latency.mean:.2f}x",
+            ]
+        )
+
+
+def evaluate_quantization(
+    fp32_backend: OnnxRuntimeBackend,
+    int8_backend: OnnxRuntimeBackend,
+    frames: list[MatLike],
+    min_keypoint_conf: float,
+) -> QuantizationReport:
+    """Compares the keypoints and the latency per frame of the INT8 model with the FP32 model"""
+    similarities: list[float] = []
+    num_persons = 0
+    missed_persons = 0
+    fp32_latencies: list[float] = []
+    int8_latencies: list[float] = []
+
+    for frame in frames:
+        reference = fp32_backend.predict(frame)
+        detections = int8_backend.predict(frame)
+
+        frame_similarities, unmatched = compare_detections(detections, reference, min_keypoint_conf)
+        similarities += frame_similarities
+        num_persons += len(reference)
+        missed_persons += unmatched
+
+        fp32_latencies.append(sum(reference.speed.values()))
+        int8_latencies.append(sum(detections.speed.values()))
+
+    return QuantizationReport(
+        num_frames=len(frames),
+        num_persons=num_persons,
+        missed_persons=missed_persons,
+        mean_oks=float(np.mean(similarities)) if len(similarities) > 0 else float("nan"),
+        fp32_latency=LatencyStats.from_latencies(fp32_latencies),
+        int8_latency=LatencyStats.from_latencies(int8_latencies),
+    )
@@ -0,0 +1,52 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+import numpy.typing as npt
+
+from utils.filter import OneEuroFilter
+
+
+class KeypointSmoother:
+    """Smoothes the keypoints of all persons at once with One Euro filters to remove jitter
+
+    Each keypoint is filtered separately and only while it is visible.
+    Keypoints that are not visible are passed through and their filter starts over once they are visible again.
+    """
+
+    def __init__(self, num_persons: int, min_keypoint_conf: float, min_cutoff: float, beta: float) -> None:
+        self._num_persons = num_persons
+        self._min_keypoint_conf = min_keypoint_conf
+
+        self._filter = OneEuroFilter((num_persons * 17, 2), min_cutoff, beta)
+
+    def reset(self, person_ids: npt.NDArray[np.bool_]) -> None:
+        """Resets the filters of the selected persons, e.g. when their track changes"""
+        self._filter.reset(np.repeat(person_ids, 17))
+
+    def __call__(
+        self,
+        keypoints: npt.NDArray[np.float64],
+        keypoints_scores: npt.NDArray[np.float64],
+        timestamp: float,
+    ) -> npt.NDArray[np.float64]:
+        """Returns the smoothed keypoints (N, 17, 2) for the keypoints (N, 17, 2) and keypoint scores (N, 17)"""
+        visible = (keypoints_scores > self._min_keypoint_conf).reshape(-1)
+
+        self._filter.reset(~visible)
+        smoothed = self._filter(keypoints.reshape(-1, 2), timestamp, visible).reshape(keypoints.shape)
+
+        return np.where(visible.reshape(keypoints_scores.shape + (1,)), smoothed, keypoints)
@@ -0,0 +1,198 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+from ultralytics.engine.results import Boxes
+from ultralytics.trackers.track import TRACKER_MAP
+from ultralytics.utils import IterableSimpleNamespace, yaml_load
+from ultralytics.utils.checks import check_yaml
+
+from cv2.typing import MatLike
+import numpy.typing as npt
+
+from pose.backend.base import PoseDetections, PoseTracker
+from pose.backend.processing import pairwise_box_iou, pairwise_keypoint_similarity
+
+DEFAULT_TRACKER = "botsort.yaml"
+DEFAULT_FRAME_RATE = 30
+
+IOU_WEIGHT = 0.5
+MIN_SIMILARITY = 0.3
+VELOCITY_SMOOTHING = 0.5
+MAX_LOST_FRAMES = 30
+
+
+class UltralyticsTracker(PoseTracker):
+    """Tracks detections with a tracker of Ultralytics (BoT-SORT by default)
+
+    This is the same tracker that is used by `YOLO.track()`, but it is fed with NumPy arrays from backends that do not use
+    the Ultralytics pipeline.
+    """
+
+    def __init__(self, tracker: str = DEFAULT_TRACKER, frame_rate: int = DEFAULT_FRAME_RATE) -> None:
+        config = IterableSimpleNamespace(**yaml_load(check_yaml(tracker)))
+        self._tracker = TRACKER_MAP[config.tracker_type](args=config, frame_rate=frame_rate)
+
+    def update(self, detections: PoseDetections, frame: MatLike) -> PoseDetections:
+        # Like in Ultralytics, the tracker is not updated for frames without detections
+        if len(detections) == 0:
+            return PoseDetections.empty(detections.speed)
+
+        classes = np.zeros((len(detections), 1), dtype=np.float32)
+        boxes = Boxes(np.concatenate([detections.bboxes, detections.scores[:, None], classes], axis=1), frame.shape[:2])
+
+        tracks = self._tracker.update(boxes, frame)
+        if len(tracks) == 0:
+            return PoseDetections.empty(detections.speed)
+
+        # Each track consists of x1, y1, x2, y2, track ID, score, class and the index of the detection
+        indices = tracks[:, -1].astype(np.int64)
+
+        return PoseDetections(
+            bboxes=tracks[:, :4].astype(np.float32),
+            scores=tracks[:, 5].astype(np.float32),
+            keypoints=detections.keypoints[indices],
+            keypoints_scores=detections.keypoints_scores[indices],
+            track_ids=tracks[:, 4].astype(np.int64),
+            speed=detections.speed,
+        )
+
+
+def greedy_assignment(similarities: npt.NDArray[np.float32], min_similarity: float) -> list[tuple[int, int]]:
+    """Assigns rows to columns in the order of decreasing similarity
+
+    For the few persons in front of a camera, this gives the same result as an optimal assignment in almost all cases.
+
+    >>> greedy_assignment(np.array([[0.9, 0.8], [0.85, 0.1], [0.2, 0.2]]), 0.3)
+    [(0, 0)]
+    >>> greedy_assignment(np.array([[0.9, 0.8], [0.85, 0.1]]).T, 0.05)
+    [(0, 0), (1, 1)]
+    """
+    matches: list[tuple[int, int]] = []
+    if similarities.size == 0:
+        return matches
+
+    used_rows = np.zeros(similarities.shape[0], dtype=bool)
+    used_cols = np.zeros(similarities.shape[1], dtype=bool)
+
+    for flat_index in np.argsort(-similarities, axis=None, kind="stable"):
+        row, col = divmod(int(flat_index), similarities.shape[1])
+        if similarities[row, col] < min_similarity:
+            break
+        if used_rows[row] or used_cols[col]:
+            continue
+
+        matches.append((row, col))
+        used_rows[row] = True
+        used_cols[col] = True
+
+    return matches
+
+
+class LightweightTracker(PoseTracker):
+    """Tracks the few persons in front of a camera by the overlap of their bounding boxes and the similarity of their keypoints
+
+    The bounding boxes and keypoints of the tracks are predicted to the next frame with a constant velocity.
+    The detections are then assigned to the tracks by a weighted sum of the IoU and the object keypoint similarity (OKS).
+    Tracks that are not detected anymore are kept for `max_lost_frames` frames, so persons that are hidden for a short time keep
+    their track ID.
+    All tracks are stored in arrays, so the costs of all pairs are computed at once.
+    """
+
+    def __init__(
+        self,
+        min_keypoint_conf: float,
+        iou_weight: float = IOU_WEIGHT,
+        min_similarity: float = MIN_SIMILARITY,
+        max_lost_frames: int = MAX_LOST_FRAMES,
+    ) -> None:
+        self._min_keypoint_conf = min_keypoint_conf
+        self._iou_weight = iou_weight
+        self._min_similarity = min_similarity
+        self._max_lost_frames = max_lost_frames
+
+        self._track_ids = np.empty((0,), dtype=np.int64)
+        self._bboxes = np.empty((0, 4), dtype=np.float32)
+        self._velocities = np.empty((0, 4), dtype=np.float32)
+        self._keypoints = np.empty((0, 17, 2), dtype=np.float32)
+        self._keypoints_visible = np.empty((0, 17), dtype=bool)
+        self._lost_frames = np.empty((0,), dtype=np.int64)
+
+        self._next_track_id = 1
+
+    def update(self, detections: PoseDetections, frame: MatLike) -> PoseDetections:
+        self._predict()
+
+        keypoints_visible = detections.keypoints_scores >= self._min_keypoint_conf
+
+        areas = np.prod(self._bboxes[:, 2:] - self._bboxes[:, :2], axis=1)
+        similarities = self._iou_weight * pairwise_box_iou(self._bboxes, detections.bboxes) + (
+            1.0 - self._iou_weight
+        ) * pairwise_keypoint_similarity(self._keypoints, self._keypoints_visible, areas, detections.keypoints)
+
+        matches = greedy_assignment(similarities, self._min_similarity)
+        track_indices = np.array([track_index for track_index, _ in matches], dtype=np.int64)
+        detection_indices = np.array([detection_index for _, detection_index in matches], dtype=np.int64)
+
+        # Update the matched tracks, whose bounding boxes were predicted once for each frame since they were last detected
+        velocities = (detections.bboxes[detection_indices] - self._bboxes[track_indices]) / (
+            self._lost_frames[track_indices, None] + 1
+        ) + self._velocities[track_indices]
+        self._velocities[track_indices] += VELOCITY_SMOOTHING * (velocities - self._velocities[track_indices])
+        self._bboxes[track_indices] = detections.bboxes[detection_indices]
+        self._keypoints[track_indices] = detections.keypoints[detection_indices]
+        self._keypoints_visible[track_indices] = keypoints_visible[detection_indices]
+        self._lost_frames += 1
+        self._lost_frames[track_indices] = 0
+
+        # Remove tracks that have been lost for too long
+        kept = self._lost_frames <= self._max_lost_frames
+        track_ids = self._track_ids[track_indices]
+        self._track_ids = self._track_ids[kept]
+        self._bboxes = self._bboxes[kept]
+        self._velocities = self._velocities[kept]
+        self._keypoints = self._keypoints[kept]
+        self._keypoints_visible = self._keypoints_visible[kept]
+        self._lost_frames = self._lost_frames[kept]
+
+        # Start new tracks for the unmatched detections
+        new_indices = np.setdiff1d(np.arange(len(detections)), detection_indices)
+        new_track_ids = np.arange(self._next_track_id, self._next_track_id + len(new_indices), dtype=np.int64)
+        self._next_track_id += len(new_indices)
+
+        self._track_ids = np.concatenate([self._track_ids, new_track_ids])
+        self._bboxes = np.concatenate([self._bboxes, detections.bboxes[new_indices]])
+        self._velocities = np.concatenate([self._velocities, np.zeros((len(new_indices), 4), dtype=np.float32)])
+        self._keypoints = np.concatenate([self._keypoints, detections.keypoints[new_indices]])
+        self._keypoints_visible = np.concatenate([self._keypoints_visible, keypoints_visible[new_indices]])
+        self._lost_frames = np.concatenate([self._lost_frames, np.zeros((len(new_indices),), dtype=np.int64)])
+
+        indices = np.concatenate([detection_indices, new_indices])
+
+        return PoseDetections(
+            bboxes=detections.bboxes[indices],
+            scores=detections.scores[indices],
+            keypoints=detections.keypoints[indices],
+            keypoints_scores=detections.keypoints_scores[indices],
+            track_ids=np.concatenate([track_ids, new_track_ids]),
+            speed=detections.speed,
+        )
+
+    def _predict(self) -> None:
+        self._bboxes += self._velocities
+
+        # Keypoints move with the center of the bounding box
+        center_velocities = (self._velocities[:, :2] + self._velocities[:, 2:]) / 2
+        self._keypoints += center_velocities[:, None, :]
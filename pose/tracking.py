@@ -14,20 +14,50 @@
 # not, see <https://www.gnu.org/licenses/>.
 
 import time
+from typing import Literal
 
 import numpy as np
 
 import numpy.typing as npt
 
-from pose.person import Person
+from pose.gesture.arm_raising import detect_arm_raising
+from utils.side import Side
+
+JoinGesture = Literal["right_arm_raising", "left_arm_raising", "any_arm_raising", "both_arms_raising"]
+
+
+def detect_join_gesture(
+    keypoints: npt.NDArray[np.float64],
+    keypoints_scores: npt.NDArray[np.float64],
+    min_keypoint_conf: float,
+    join_gesture: JoinGesture,
+) -> npt.NDArray[np.bool_]:
+    """Detects the join gesture for many persons (N, 17, 2) at once"""
+    if join_gesture == "right_arm_raising":
+        return detect_arm_raising(keypoints, keypoints_scores, min_keypoint_conf, Side.RIGHT)
+    if join_gesture == "left_arm_raising":
+        return detect_arm_raising(keypoints, keypoints_scores, min_keypoint_conf, Side.LEFT)
+
+    right = detect_arm_raising(keypoints, keypoints_scores, min_keypoint_conf, Side.RIGHT)
+    left = detect_arm_raising(keypoints, keypoints_scores, min_keypoint_conf, Side.LEFT)
+    if join_gesture == "any_arm_raising":
+        return right | left
+    return right & left
 
 
 class Tracking:
-    def __init__(self, max_num_persons: int, min_keypoint_conf: float, tracking_timeout: float) -> None:
+    def __init__(
+        self,
+        max_num_persons: int,
+        min_keypoint_conf: float,
+        tracking_timeout: float,
+        join_gesture: JoinGesture = "right_arm_raising",
+    ) -> None:
         assert max_num_persons >= 1
         self._max_num_persons = max_num_persons
         self._min_keypoint_conf = min_keypoint_conf
         self._tracking_timeout = tracking_timeout
+        self._join_gesture: JoinGesture = join_gesture
 
         self._track_last_seen: dict[int, float] = {}
 
@@ -59,20 +89,21 @@ class Tracking:
         keypoints: npt.NDArray[np.float64],
         keypoints_scores: npt.NDArray[np.float64],
     ) -> list[int]:
-        unassigned_track_ids = [track_id for track_id in track_ids if track_id not in self.person_to_track.values()]
+        assigned_track_ids = set(self.person_to_track.values())
+        candidates = [idx for idx, track_id in enumerate(track_ids) if track_id not in assigned_track_ids]
+        if len(candidates) == 0:
+            return []
 
-        for track_id in unassigned_track_ids.copy():
-            idx = track_ids.index(track_id)
+        joining = detect_join_gesture(keypoints[candidates], keypoints_scores[candidates], self._min_keypoint_conf, self._join_gesture)
 
-            person = Person(self._min_keypoint_conf)
-            person.parse_keypoints(keypoints[idx], keypoints_scores[idx])
+        free_person_ids = [person_id for person_id in range(self._max_num_persons) if person_id not in self.person_to_track]
 
-            if person.right_arm_raising.detected:
-                for person_id in range(self._max_num_persons):
-                    if person_id not in self.person_to_track:
-                        self.person_to_track[person_id] = track_id
-                        unassigned_track_ids.remove(track_id)
-                        break
+        unassigned_track_ids: list[int] = []
+        for idx, detected in zip(candidates, joining):
+            if detected and len(free_person_ids) > 0:
+                self.person_to_track[free_person_ids.pop(0)] = track_ids[idx]
+            else:
+                unassigned_track_ids.append(track_ids[idx])
 
         return unassigned_track_ids
 
@@ -0,0 +1,75 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, CliPositionalArg, SettingsConfigDict
+
+from pose.backend.onnxruntime_backend import OnnxRuntimeBackend
+from pose.camera import CameraConfig
+from pose.model import PoseModelConfig
+from pose.quantization import evaluate_quantization, quantize_model, read_frames
+from pose.tracker import UltralyticsTracker
+
+
+class QuantizationConfig(BaseSettings, cli_parse_args=True, cli_hide_none_type=True):
+    model_config = SettingsConfigDict(env_nested_delimiter="__")
+
+    pose: PoseModelConfig = PoseModelConfig()
+
+    calibration_frames: int = Field(
+        default=300,
+        ge=1,
+        description="number of frames of the recording that are used for calibration",
+    )
+    evaluation: Optional[str] = Field(
+        default=None,
+        description="path to a recorded video file or image folder for the evaluation (defaults to the calibration recording)",
+    )
+    evaluation_frames: int = Field(
+        default=300,
+        ge=1,
+        description="number of frames of the recording that are used for the evaluation",
+    )
+
+    calibration: CliPositionalArg[str] = Field(
+        description="path to a recorded video file or image folder for the calibration",
+    )
+
+
+def main() -> None:
+    config = QuantizationConfig()
+    model_path = Path(config.pose.model_path)
+
+    calibration_frames = read_frames(CameraConfig(file=config.calibration), config.calibration_frames)
+    print(f"Calibrating {config.pose.model} with {len(calibration_frames)} frames")
+    int8_path = quantize_model(model_path, config.pose.model, config.pose.image_size, calibration_frames)
+    print(f"Saved INT8 model to {int8_path}")
+
+    evaluation_frames = read_frames(CameraConfig(file=config.evaluation or config.calibration), config.evaluation_frames)
+    fp32_backend = OnnxRuntimeBackend(
+        UltralyticsTracker(), model_path, config.pose.model, config.pose.image_size, config.pose.min_bbox_conf
+    )
+    int8_backend = OnnxRuntimeBackend(
+        UltralyticsTracker(), model_path, config.pose.model, config.pose.image_size, config.pose.min_bbox_conf, int8=True
+    )
+    print(evaluate_quantization(fp32_backend, int8_backend, evaluation_frames, config.pose.min_keypoint_conf))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@
 # not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
+from collections import deque
 
 import cv2
 
@@ -24,10 +25,15 @@ from input_emulation.keyboard import Keyboard
 from input_emulation.keyboard_plugin import KeyboardPlugin
 from input_emulation.mouse import Mouse
 from input_emulation.mouse_plugin import MousePlugin
-from pose.camera import Camera
+from pose.camera import Camera, Frame
+from pose.backend.base import PoseDetections
 from pose.model import PoseModel
+from pose.person import Gesture
 from pose.plotting import annotate_frame
+from script.output import OutputScheduler
+from script.pipeline import Pipeline
 from script.plugin import PluginBase
+from utils.clock import Clock, SystemClock
 
 CV2_WINDOW_TITLE = "PosePIE"
 
@@ -47,11 +53,26 @@ class ScriptBase(ABC):
         Can be used in the `update()` method for a loop like `for player_id in range(self.max_num_players):` to iterate over all players.
         """
 
+        self.gestures: list[Gesture] = []
+        """Gestures that are read in the user script
+
+        Can be set in the `setup()` method in the user script, so these gestures are evaluated for every frame, even if they are only read conditionally.
+        Gestures that are not listed are evaluated for every frame after they have been read for the first time, while other gestures are skipped.
+        """
+
+        self.timestamp: float = 0.0
+        """Capture timestamp of the current frame in seconds
+
+        Should be passed to time-based filters like `Turbo` in the `update()` method, so they use the same time as the pose estimation.
+        """
+
         self._plugins: list[PluginBase] = []
+        self._output: OutputScheduler | None = None
+        self._clock: Clock = SystemClock()
 
         self.setup()
 
-        self.pose = PoseModel(self._config.pose, self.max_num_players)
+        self.pose = PoseModel(self._config.pose, self.max_num_players, self.gestures)
 
     def add_gamepad(self) -> Gamepad:
         """Adds a virtual gamepad for input emulation"""
@@ -65,17 +86,22 @@ class ScriptBase(ABC):
         self._plugins.append(KeyboardPlugin(keyboard))
         return keyboard
 
-    def add_mouse(self, absolute: bool = False) -> Mouse:
+    def add_mouse(self, absolute: bool = False, output_rate: float | None = None) -> Mouse:
         """Adds a virtual mouse for input emulation
 
         The mouse can operate in two modes.
         In relative mode, the mouse can be moved relative to its current position via the `move_relative` member.
         In absolute mode, the mouse can be moved absolute to normalized screen coordinates via the `move_absolute` member.
 
+        By default, the inputs are emitted once per frame.
+        With an output rate, they are emitted on a separate thread at that rate in Hz instead,
+        and the movement is interpolated between the frames, which delays it by up to one frame.
+
         :param absolute: whether absolute mode should be used
+        :param output_rate: rate in Hz at which the inputs are emitted with interpolation (e.g. 500)
         """
         mouse = Mouse(absolute)
-        self._plugins.append(MousePlugin(mouse))
+        self._plugins.append(MousePlugin(mouse, output_rate))
         return mouse
 
     def run(self) -> None:
@@ -85,40 +111,129 @@ class ScriptBase(ABC):
         """
         camera = Camera(self._config.camera)
         print(f"Opened camera with {camera.width}x{camera.height}@{camera.fps} ({camera.format_fourcc})")
+        self._clock = camera.clock
+
+        pipeline: Pipeline | None = None
 
         try:
             for plugin in self._plugins:
                 plugin.create()
 
-            while camera.is_opened():
+            if self._config.output.rate is not None:
+                self._output = OutputScheduler(self._plugins, self._config.output.rate)
+                self._output.start()
+
+            if self._config.pipeline.enabled:
+                pipeline = Pipeline(camera, self.pose, self._config.pipeline)
+                with pipeline:
+                    self._run_pipelined(pipeline)
+            else:
+                self._run_sequential(camera)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # The remaining inputs are emitted before the plugins are destroyed
+            if self._output is not None:
+                self._output.stop()
+
+        for plugin in self._plugins:
+            plugin.destroy()
+
+        if self._output is not None and self._output.latencies:
+            latencies = self._output.latencies
+            print(
+                f"Emitted inputs in {self._output.flushes} flushes with {sum(latencies) / len(latencies) * 1000.0:.2f} ms mean "
+                f"and {max(latencies) * 1000.0:.2f} ms maximum latency"
+            )
+
+        if self._config.camera.threaded:
+            print(f"Dropped {camera.dropped_frames} outdated frames")
+        if pipeline is not None:
+            print(f"Dropped {pipeline.dropped_frames} frames in the pipeline")
+
+        camera.release()
+        self.pose.close()
+        cv2.destroyAllWindows()
+
+    def _run_sequential(self, camera: Camera) -> None:
+        pending_frames: deque[tuple[Frame, bool]] = deque()
+
+        try:
+            running = True
+            while running and camera.is_opened():
                 frame = camera.read()
                 if frame is None:
                     break
 
-                pose_result = self.pose.process_frame(frame)
+                # The next frame is submitted before the oldest one is processed, so it is inferred in the meantime
+                inferred = self.pose.is_inference_due(frame.timestamp)
+                if inferred:
+                    self.pose.submit_frame(frame.image)
+                pending_frames.append((frame, inferred))
 
-                for plugin in self._plugins:
-                    plugin.pre_update()
+                if len(pending_frames) >= self.pose.max_pending_frames:
+                    running = self._process_pending_frame(pending_frames.popleft())
+
+            while running and pending_frames:
+                running = self._process_pending_frame(pending_frames.popleft())
+        finally:
+            for frame, _ in pending_frames:
+                frame.release()
+
+    def _process_pending_frame(self, pending_frame: tuple[Frame, bool]) -> bool:
+        frame, inferred = pending_frame
+
+        return self._process_frame(frame, self.pose.collect_detections() if inferred else None)
+
+    def _run_pipelined(self, pipeline: Pipeline) -> None:
+        while True:
+            item = pipeline.get()
+            if item is None:
+                break
+
+            frame, detections = item
+            if not self._process_frame(frame, detections):
+                break
+
+    def _process_frame(self, frame: Frame, detections: PoseDetections | None) -> bool:
+        """Processes a frame with its detections
+
+        :param detections: detections of the frame or None if the frame was not inferred, so the keypoints are extrapolated
+        :return: whether the program should keep running
+        """
+        with frame:
+            self.timestamp = frame.timestamp
+
+            if detections is not None:
+                pose_result = self.pose.process_detections(detections, frame.image.shape, frame.timestamp)
+            else:
+                pose_result = self.pose.extrapolate(frame.timestamp)
 
-                self.update()
+            for plugin in self._plugins:
+                plugin.pre_update()
 
+            self.update()
+
+            if self._output is not None:
+                # The inputs are emitted at the next flush of the output thread, which adds its latency
+                self._output.submit()
+                self.pose.record_output_latency(self._clock.now() - frame.timestamp + self._output.latency)
+            else:
                 for plugin in self._plugins:
                     plugin.post_update()
 
-                if self._config.show_camera:
-                    annotate_frame(frame, pose_result, self._config.pose.min_keypoint_conf, self.max_num_players)
-                    cv2.imshow(CV2_WINDOW_TITLE, frame)
+                self.pose.record_output_latency(self._clock.now() - frame.timestamp)
 
-                    if cv2.waitKey(1) & 0xFF == ord("q") or not cv2.getWindowProperty(CV2_WINDOW_TITLE, cv2.WND_PROP_VISIBLE):
-                        break
-        except KeyboardInterrupt:
-            pass
+            if self._config.show_camera:
+                annotate_frame(
+                    frame.image, pose_result, self._config.pose.min_keypoint_conf, self.max_num_players, self._config.pose.join_gesture
+                )
+                cv2.imshow(CV2_WINDOW_TITLE, frame.image)
 
-        for plugin in self._plugins:
-            plugin.destroy()
+                if cv2.waitKey(1) & 0xFF == ord("q") or not cv2.getWindowProperty(CV2_WINDOW_TITLE, cv2.WND_PROP_VISIBLE):
+                    return False
 
-        camera.release()
-        cv2.destroyAllWindows()
+        return True
 
     @abstractmethod
     def setup(self) -> None:
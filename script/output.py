@@ -0,0 +1,135 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from collections import deque
+import threading
+import time
+
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+from script.plugin import PluginBase
+
+LATENCY_SMOOTHING = 0.1
+MAX_RECORDED_FLUSHES = 10000
+
+
+class OutputConfig(BaseModel):
+    rate: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description="rate in Hz at which the inputs are emitted on a separate thread (emitted after each frame if not set)",
+    )
+
+
+class OutputScheduler:
+    """Emits the inputs of the plugins on a separate thread at a fixed rate
+
+    After each update of the script, the plugins take snapshots of their inputs, which are handed over to the output thread
+    through a deque without locking, so slow emulated devices do not delay the next frame.
+    At each flush, all snapshots that were submitted since the last flush are emitted in order, so no inputs are lost.
+    The latency from submitting a snapshot until it was emitted is measured for each flush.
+
+    >>> class PrintPlugin(PluginBase):
+    ...     def create(self) -> None: pass
+    ...     def pre_update(self) -> None: pass
+    ...     def post_update(self) -> None: pass
+    ...     def destroy(self) -> None: pass
+    ...     def snapshot(self) -> int: return 1
+    ...     def emit(self, snapshot: int) -> None: print("emitted", snapshot)
+    >>> with OutputScheduler([PrintPlugin()], 100.0) as scheduler:
+    ...     scheduler.submit()
+    ...     time.sleep(0.1)
+    emitted 1
+    >>> scheduler.flushes
+    1
+    """
+
+    def __init__(self, plugins: list[PluginBase], rate: float) -> None:
+        assert rate > 0.0
+
+        self._plugins = plugins
+        self._period = 1.0 / rate
+
+        self._snapshots: deque[tuple[float, list[Any]]] = deque()
+        self._stopped = threading.Event()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+        self.flushes = 0
+        """Number of flushes that emitted at least one snapshot"""
+        self.latencies: deque[float] = deque(maxlen=MAX_RECORDED_FLUSHES)
+        """Latencies in seconds from submitting the oldest snapshot of a flush until it was emitted for the most recent flushes"""
+        self._latency: float | None = None
+
+    @property
+    def latency(self) -> float:
+        """Smoothed latency in seconds from submitting a snapshot until it was emitted"""
+        return 0.0 if self._latency is None else self._latency
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the output thread after the remaining snapshots were emitted"""
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def submit(self) -> None:
+        """Takes snapshots of the inputs of all plugins, which are emitted at the next flush"""
+        if self._error is not None:
+            raise RuntimeError("emitting inputs failed") from self._error
+
+        self._snapshots.append((time.perf_counter(), [plugin.snapshot() for plugin in self._plugins]))
+
+    def _run(self) -> None:
+        try:
+            # Flushes are scheduled relative to the first one, so the rate does not drift
+            next_timestamp = time.perf_counter()
+            while not self._stopped.wait(max(next_timestamp - time.perf_counter(), 0.0)):
+                next_timestamp += self._period
+                self._flush()
+
+            self._flush()
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            self._error = e
+
+    def _flush(self) -> None:
+        if not self._snapshots:
+            return
+
+        submitted = self._snapshots[0][0]
+        while self._snapshots:
+            _, snapshots = self._snapshots.popleft()
+            for plugin, snapshot in zip(self._plugins, snapshots):
+                plugin.emit(snapshot)
+
+        # The latency of the oldest snapshot is the longest one of the flush
+        latency = time.perf_counter() - submitted
+        self.flushes += 1
+        self.latencies.append(latency)
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += LATENCY_SMOOTHING * (latency - self._latency)
+
+    def __enter__(self) -> "OutputScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
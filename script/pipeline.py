@@ -0,0 +1,280 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from collections import deque
+import threading
+
+from typing import Callable, Generic, Literal, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from pose.backend.base import PoseDetections
+from pose.camera import Camera, Frame
+from pose.model import PoseModel
+
+T = TypeVar("T")
+
+BackPressurePolicy = Literal["drop_oldest", "block"]
+
+
+class PipelineConfig(BaseModel):
+    enabled: bool = Field(
+        default=False,
+        description="run capture and inference on separate threads in parallel to the script",
+    )
+    queue_size: int = Field(
+        default=2,
+        ge=1,
+        description="maximum number of frames waiting between two stages",
+    )
+    policy: BackPressurePolicy = Field(
+        default="drop_oldest",
+        description="what to do if a queue is full (drop_oldest: drop the oldest frame, block: wait for the next stage)",
+    )
+
+
+class StageQueue(Generic[T]):
+    """Bounded FIFO queue between two stages of the pipeline
+
+    If the queue is full, either the oldest item is dropped or the producer is blocked until there is space.
+    Items for which `keep` returns True are only dropped for a newer item that is kept as well, while other new items are
+    dropped instead of them.
+    A closed queue does not accept new items, but the remaining items can still be taken.
+
+    >>> queue = StageQueue[int](2, "drop_oldest")
+    >>> queue.put(1), queue.put(2), queue.put(3)
+    (True, True, True)
+    >>> queue.get(), queue.dropped
+    (2, 1)
+    >>> queue.close()
+    >>> queue.put(4), queue.get(), queue.get()
+    (False, 3, None)
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: BackPressurePolicy,
+        on_drop: Optional[Callable[[T], None]] = None,
+        keep: Optional[Callable[[T], bool]] = None,
+    ) -> None:
+        assert maxsize >= 1
+
+        self._maxsize = maxsize
+        self._policy = policy
+        self._on_drop = on_drop
+        self._keep = keep
+
+        self._items: deque[T] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self.dropped = 0
+        """Number of items that were dropped because the queue was full"""
+
+    def put(self, item: T) -> bool:
+        """Appends an item to the queue
+
+        :return: whether the item was added, which is not the case if the queue is closed
+        """
+        dropped_item: list[T] = []
+
+        with self._condition:
+            if self._policy == "block":
+                self._condition.wait_for(lambda: len(self._items) < self._maxsize or self._closed)
+
+            # The items of a closed queue are kept, so they can still be taken
+            if self._closed:
+                return False
+
+            if len(self._items) < self._maxsize:
+                self._items.append(item)
+            else:
+                index = self._find_droppable()
+                if index is None and not self._is_kept(item):
+                    dropped_item.append(item)
+                else:
+                    index = 0 if index is None else index
+                    dropped_item.append(self._items[index])
+                    del self._items[index]
+                    self._items.append(item)
+                self.dropped += 1
+
+            self._condition.notify_all()
+
+        if self._on_drop is not None:
+            for dropped in dropped_item:
+                self._on_drop(dropped)
+
+        return True
+
+    def _is_kept(self, item: T) -> bool:
+        return self._keep is not None and self._keep(item)
+
+    def _find_droppable(self) -> int | None:
+        """Returns the index of the oldest item that is not kept"""
+        for index, item in enumerate(self._items):
+            if not self._is_kept(item):
+                return index
+
+        return None
+
+    def get(self) -> T | None:
+        """Takes the oldest item from the queue and waits for it if necessary
+
+        :return: oldest item or None if the queue is closed and empty
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._items) > 0 or self._closed)
+            if not self._items:
+                return None
+
+            item = self._items.popleft()
+            self._condition.notify_all()
+
+            return item
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def clear(self) -> list[T]:
+        """Removes and returns all remaining items"""
+        with self._condition:
+            items = list(self._items)
+            self._items.clear()
+            self._condition.notify_all()
+
+            return items
+
+
+class Pipeline:
+    """Captures frames and detects the persons in them on separate threads
+
+    Capturing the next frame and inferring the current one run in parallel to the script, which processes the detections of
+    the previous frame.
+    The detections are returned in the order of the frames, so the state of the persons and their gestures is updated in order.
+    Tracking and updating the persons is left to the consumer thread, as the script reads the persons in `update()`.
+    """
+
+    def __init__(self, camera: Camera, pose: PoseModel, config: PipelineConfig) -> None:
+        self._camera = camera
+        self._pose = pose
+
+        self._frames = StageQueue[Frame](config.queue_size, config.policy, on_drop=Frame.release)
+        # Frames with detections are kept over extrapolated frames, so the persons are updated with the latest inference
+        self._detections = StageQueue[tuple[Frame, PoseDetections | None]](
+            config.queue_size, config.policy, on_drop=lambda item: item[0].release(), keep=lambda item: item[1] is not None
+        )
+
+        self._stopped = threading.Event()
+        self._error: BaseException | None = None
+
+        self._threads = [
+            threading.Thread(target=self._run_stage, args=(self._capture, self._frames), daemon=True),
+            threading.Thread(target=self._run_stage, args=(self._infer, self._detections), daemon=True),
+        ]
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames that were dropped because a stage was too slow"""
+        return self._frames.dropped + self._detections.dropped
+
+    def start(self) -> None:
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._frames.close()
+        self._detections.close()
+
+        for thread in self._threads:
+            if thread.is_alive():
+                thread.join()
+
+        for frame in self._frames.clear():
+            frame.release()
+        for frame, _ in self._detections.clear():
+            frame.release()
+
+    def get(self) -> tuple[Frame, PoseDetections | None] | None:
+        """Returns the next frame with its detections
+
+        The frame has to be released after use.
+        Frames that were not inferred due to adaptive inference have no detections.
+
+        :return: frame and detections or None if no frames are left
+        """
+        item = self._detections.get()
+        if item is None and self._error is not None:
+            raise RuntimeError("pipeline stage failed") from self._error
+
+        return item
+
+    def _run_stage(self, stage: Callable[[], None], output: StageQueue[T]) -> None:
+        try:
+            stage()
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            self._error = e
+            self._frames.close()
+        finally:
+            # Closing the output signals the next stage that no more items will follow
+            output.close()
+
+    def _capture(self) -> None:
+        while not self._stopped.is_set() and self._camera.is_opened():
+            frame = self._camera.read()
+            if frame is None:
+                break
+
+            if not self._frames.put(frame):
+                frame.release()
+
+    def _infer(self) -> None:
+        pending: deque[tuple[Frame, bool]] = deque()
+
+        try:
+            while not self._stopped.is_set():
+                frame = self._frames.get()
+                if frame is None:
+                    break
+
+                inferred = self._pose.is_inference_due(frame.timestamp)
+                if inferred:
+                    self._pose.submit_frame(frame.image)
+                pending.append((frame, inferred))
+
+                if len(pending) >= self._pose.max_pending_frames:
+                    self._emit(*pending.popleft())
+
+            while pending and not self._stopped.is_set():
+                self._emit(*pending.popleft())
+        finally:
+            for frame, _ in pending:
+                frame.release()
+
+    def _emit(self, frame: Frame, inferred: bool) -> None:
+        detections = self._pose.collect_detections() if inferred else None
+        if not self._detections.put((frame, detections)):
+            frame.release()
+
+    def __enter__(self) -> "Pipeline":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
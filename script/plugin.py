@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
 #
 # This file is part of PosePIE.
 #
@@ -15,6 +15,8 @@
 
 from abc import ABC, abstractmethod
 
+from typing import Any
+
 
 class PluginBase(ABC):
     @abstractmethod
@@ -29,6 +31,17 @@ class PluginBase(ABC):
     def post_update(self) -> None:
         raise NotImplementedError
 
+    def snapshot(self) -> Any:
+        """Returns the inputs that were set in the update of the script, so they can be emitted later on another thread
+
+        Plugins that do not take snapshots return None and emit their current inputs with `post_update()` instead.
+        """
+        return None
+
+    def emit(self, snapshot: Any) -> None:
+        """Emits the inputs of a snapshot"""
+        self.post_update()
+
     @abstractmethod
     def destroy(self) -> None:
         raise NotImplementedError
@@ -0,0 +1,89 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import time
+
+import numpy as np
+
+import numpy.typing as npt
+
+from pose.person import Person, PersonBatch
+
+NUM_FRAMES = 1000
+GESTURES = [
+    "left_arm_raising",
+    "right_arm_raising",
+    "jumping",
+    "leaning",
+    "left_hand_pointing",
+    "right_hand_pointing",
+    "shoulder_width",
+    "steering",
+    "left_hand_swiping",
+    "right_hand_swiping",
+]
+
+
+def generate_keypoints(num_persons: int, rng: np.random.Generator) -> list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+    """Generates noisy keypoints of persons standing in front of the camera"""
+    keypoints = rng.uniform(0.2, 0.8, (num_persons, 17, 2))
+
+    return [(keypoints + rng.normal(0.0, 0.01, keypoints.shape), rng.uniform(0.85, 1.0, (num_persons, 17))) for _ in range(NUM_FRAMES)]
+
+
+def read_gestures(persons: list[Person]) -> None:
+    for person in persons:
+        for gesture in GESTURES:
+            getattr(person, gesture)
+
+
+def benchmark_batched(frames: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]) -> float:
+    """Evaluates the gestures of all persons at once"""
+    persons = PersonBatch(len(frames[0][0]), 0.8)
+
+    start = time.perf_counter()
+    for i, (keypoints, keypoints_scores) in enumerate(frames):
+        persons.parse_keypoints(keypoints, keypoints_scores, i / 30)
+        read_gestures(persons.person)
+
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def benchmark_per_person(frames: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]) -> float:
+    """Evaluates the gestures of each person separately"""
+    persons = [PersonBatch(1, 0.8) for _ in range(len(frames[0][0]))]
+
+    start = time.perf_counter()
+    for i, (keypoints, keypoints_scores) in enumerate(frames):
+        for person_id, person in enumerate(persons):
+            person.parse_keypoints(keypoints[person_id : person_id + 1], keypoints_scores[person_id : person_id + 1], i / 30)
+            read_gestures(person.person)
+
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+
+    print("persons | per person | batched (us per frame)")
+    for num_persons in [1, 2, 4, 8]:
+        frames = generate_keypoints(num_persons, rng)
+        per_person = benchmark_per_person(frames)
+        batched = benchmark_batched(frames)
+        print(f"{num_persons:7d} | {per_person:10.0f} | {batched:7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import os
+import time
+
+import numpy as np
+
+from cv2.typing import MatLike
+
+from pose.model import PoseModel, PoseModelConfig
+
+NUM_FRAMES = 200
+
+
+def benchmark(num_workers: int, frames: list[MatLike]) -> float:
+    """Returns the throughput in frames per second, after each worker inferred a first frame to load its model"""
+    pose = PoseModel(PoseModelConfig(device="cpu", tracker="lightweight", inference_workers=num_workers))
+    try:
+        for frame in frames[:num_workers]:
+            pose.submit_frame(frame)
+        for frame in frames[:num_workers]:
+            pose.process_detections(pose.collect_detections(), frame.shape)
+
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            if i >= pose.max_pending_frames:
+                pose.process_detections(pose.collect_detections(), frame.shape)
+            pose.submit_frame(frame)
+
+        for _ in range(min(len(frames), pose.max_pending_frames)):
+            pose.process_detections(pose.collect_detections(), frames[-1].shape)
+
+        return len(frames) / (time.perf_counter() - start)
+    finally:
+        pose.close()
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    frames: list[MatLike] = [rng.integers(0, 256, (360, 640, 3), dtype=np.uint8) for _ in range(NUM_FRAMES)]
+
+    print("workers | frames per second")
+    for num_workers in [1, 2, 4, 8, 16, 32]:
+        if num_workers > (os.cpu_count() or 1):
+            break
+
+        print(f"{num_workers:7d} | {benchmark(num_workers, frames):17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import timeit
+
+import numpy as np
+
+from pose.keypoints import Keypoints
+
+NUM_ACCESSES = 100000
+
+
+def main() -> None:
+    keypoints = Keypoints(np.random.default_rng(0).uniform(0.0, 1.0, (17, 2)), np.full(17, 0.9))
+
+    accesses = {
+        "keypoints.left_wrist": lambda: keypoints.left_wrist,
+        "keypoints.left_wrist.xy": lambda: keypoints.left_wrist.xy,
+        "keypoints.left_wrist.y": lambda: keypoints.left_wrist.y,
+        "keypoints.left_wrist.conf": lambda: keypoints.left_wrist.conf,
+    }
+
+    print("access                    | ns per access")
+    for name, access in accesses.items():
+        duration = min(timeit.repeat(access, number=NUM_ACCESSES, repeat=5)) / NUM_ACCESSES * 1e9
+        print(f"{name:25s} | {duration:13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import time
+
+from tests.scripts.tracker_benchmark import generate_detections
+from pose.model import normalize_detections
+
+import numpy as np
+
+FRAME_SHAPE = (720, 1280, 3)
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+
+    print("persons | normalize detections (us per frame)")
+    for num_persons in [1, 2, 4, 8]:
+        frames = generate_detections(num_persons, rng)
+
+        start = time.perf_counter()
+        for detections in frames:
+            normalize_detections(detections, FRAME_SHAPE)
+        duration = (time.perf_counter() - start) / len(frames) * 1e6
+
+        print(f"{num_persons:7d} | {duration:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import time
+
+import numpy as np
+
+from pose.backend.base import PoseDetections, PoseTracker
+from pose.tracker import LightweightTracker, UltralyticsTracker
+
+NUM_FRAMES = 1000
+FRAME = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+
+def generate_detections(num_persons: int, rng: np.random.Generator) -> list[PoseDetections]:
+    """Generates persons walking back and forth in front of the camera with noisy detections"""
+    offsets = np.stack([np.linspace(0.0, 100.0, 17), np.linspace(0.0, 250.0, 17)], axis=1)
+    start = rng.uniform(0.0, 1100.0, num_persons)
+    speed = rng.uniform(1.0, 5.0, num_persons)
+
+    frames = []
+    for i in range(NUM_FRAMES):
+        x = np.abs((start + speed * i) % 2200.0 - 1100.0)
+        y = np.full(num_persons, 300.0)
+        positions = np.stack([x, y], axis=1) + rng.normal(0.0, 2.0, (num_persons, 2))
+
+        frames.append(
+            PoseDetections(
+                bboxes=np.concatenate([positions, positions + [100.0, 250.0]], axis=1).astype(np.float32),
+                scores=np.full(num_persons, 0.9, dtype=np.float32),
+                keypoints=(positions[:, None] + offsets + rng.normal(0.0, 2.0, (num_persons, 17, 2))).astype(np.float32),
+                keypoints_scores=np.full((num_persons, 17), 0.9, dtype=np.float32),
+            )
+        )
+
+    return frames
+
+
+def benchmark(tracker: PoseTracker, frames: list[PoseDetections]) -> float:
+    start = time.perf_counter()
+    for detections in frames:
+        tracker.update(detections, FRAME)
+
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+
+    print("persons | botsort | bytetrack | lightweight (us per frame)")
+    for num_persons in [1, 2, 4, 8]:
+        frames = generate_detections(num_persons, rng)
+        botsort = benchmark(UltralyticsTracker("botsort.yaml"), frames)
+        bytetrack = benchmark(UltralyticsTracker("bytetrack.yaml"), frames)
+        lightweight = benchmark(LightweightTracker(0.5), frames)
+        print(f"{num_persons:7d} | {botsort:7.0f} | {bytetrack:9.0f} | {lightweight:11.0f}")
+
+
+if __name__ == "__main__":
+    main()
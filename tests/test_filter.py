@@ -15,7 +15,7 @@
 
 import numpy as np
 
-from utils.filter import Derivative, Ewma, FallingEdge, RisingEdge, Turbo
+from utils.filter import Derivative, Ewma, FallingEdge, FilterBank, OneEuroFilter, RisingEdge, Turbo
 
 
 class TestEwma:
@@ -144,6 +144,117 @@ class TestDerivative:
                 np.testing.assert_approx_equal(derivative_15fps_value, derivative_60fps_value)
 
 
+class TestFilterBank:
+    def test_matches_ewma(self) -> None:
+        bank = FilterBank((2, 2), np.array([0.5, 0.0]))
+        ewmas = [Ewma(0.5), Ewma(0.0)]
+
+        for i, timestamp in enumerate(np.linspace(0.0, 1.0, 30)):
+            value = np.array([[i, -i], [2 * i, 0.0]], dtype=np.float64)
+
+            values = bank(value, timestamp)
+
+            for channel, ewma in enumerate(ewmas):
+                np.testing.assert_allclose(values[channel], ewma(value[channel], timestamp))
+
+    def test_matches_derivative(self) -> None:
+        bank = FilterBank((2, 2), np.array([0.1, 0.0]), derivative=True)
+        ewmas = [Ewma(0.1), Ewma(0.0)]
+        derivatives = [Derivative(), Derivative()]
+
+        for i, timestamp in enumerate([0.0, 0.1, 0.1, 0.3, 0.3, 0.5]):
+            value = np.array([[i, -i], [0.0, 0.0]], dtype=np.float64)
+
+            values = bank(value, timestamp)
+
+            for channel, (ewma, derivative) in enumerate(zip(ewmas, derivatives)):
+                np.testing.assert_allclose(values[channel], ewma(derivative(value[channel], timestamp), timestamp))
+
+    def test_mixed_channels(self) -> None:
+        bank = FilterBank((2,), derivative=np.array([True, False]))
+
+        bank(np.array([1.0, 1.0]), timestamp=0.0)
+        values = bank(np.array([3.0, 3.0]), timestamp=2.0)
+
+        np.testing.assert_allclose(values, [1.0, 3.0])
+
+    def test_mask(self) -> None:
+        bank = FilterBank((2,), 1.0)
+
+        bank(np.array([1.0, 1.0]), timestamp=0.0)
+        values = bank(np.array([2.0, 2.0]), timestamp=1.0, mask=np.array([False, True]))
+
+        assert values[0] == 1.0
+        assert 1.0 < values[1] < 2.0
+
+    def test_mask_derivative(self) -> None:
+        bank = FilterBank((2,), derivative=True)
+
+        bank(np.array([1.0, 1.0]), timestamp=0.0)
+        bank(np.array([5.0, 2.0]), timestamp=1.0, mask=np.array([False, True]))
+        values = bank(np.array([3.0, 2.0]), timestamp=2.0)
+
+        np.testing.assert_allclose(values, [1.0, 0.0])
+
+    def test_reset(self) -> None:
+        bank = FilterBank((2,), 1.0)
+
+        bank(np.array([1.0, 1.0]), timestamp=0.0)
+        bank.reset(np.array([True, False]))
+        values = bank(np.array([2.0, 2.0]), timestamp=1.0)
+
+        assert values[0] == 2.0
+        assert 1.0 < values[1] < 2.0
+
+    def test_reset_derivative(self) -> None:
+        bank = FilterBank((2,), derivative=True)
+
+        bank(np.array([1.0, 1.0]), timestamp=0.0)
+        bank.reset(np.array([True, False]))
+        values = bank(np.array([2.0, 2.0]), timestamp=1.0)
+
+        np.testing.assert_allclose(values, [0.0, 1.0])
+
+
+class TestOneEuroFilter:
+    def test_constant(self) -> None:
+        one_euro = OneEuroFilter((1, 2), 1.0, 1.0)
+
+        for timestamp in np.linspace(0.0, 1.0, 30):
+            values = one_euro(np.array([[1.0, 2.0]]), timestamp)
+
+        np.testing.assert_allclose(values, [[1.0, 2.0]])
+
+    def test_adaptive_cutoff(self) -> None:
+        slow = OneEuroFilter((1,), 1.0, 0.0)
+        fast = OneEuroFilter((1,), 1.0, 1.0)
+
+        for i, timestamp in enumerate(np.linspace(0.0, 1.0, 30)):
+            value = np.array([float(i)])
+            slow_value = slow(value, timestamp)
+            fast_value = fast(value, timestamp)
+
+        assert slow_value[0] < fast_value[0] < 29.0
+
+    def test_no_time_difference(self) -> None:
+        one_euro = OneEuroFilter((1,), 1.0, 1.0)
+
+        one_euro(np.array([0.0]), timestamp=0.0)
+        values = one_euro(np.array([1.0]), timestamp=0.0)
+
+        np.testing.assert_equal(values, [0.0])
+
+    def test_reset(self) -> None:
+        one_euro = OneEuroFilter((2,), 1.0, 0.0)
+
+        one_euro(np.array([0.0, 0.0]), timestamp=0.0)
+        one_euro.reset(np.array([True, False]))
+        values = one_euro(np.array([1.0, 1.0]), timestamp=0.1)
+
+        assert values[0] == 1.0
+        assert 0.0 < values[1] < 1.0
+
+
 class TestRisingEdge:
     def test_start_with_false(self) -> None:
         rising_edge = RisingEdge()
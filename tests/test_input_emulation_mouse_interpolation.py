@@ -0,0 +1,76 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from input_emulation.mouse_interpolation import MouseInterpolator
+
+FPS = 30
+OUTPUT_RATE = 500
+
+
+class TestMouseInterpolator:
+    def test_absolute(self) -> None:
+        interpolator = MouseInterpolator(absolute=True)
+
+        positions = []
+        for i in range(FPS):
+            interpolator.set_target(i / FPS, 0.0, i / FPS)
+            for j in range(OUTPUT_RATE // FPS):
+                positions.append(interpolator.sample(i / FPS + j / OUTPUT_RATE)[0])
+
+        # The position moves in small steps instead of one step per frame
+        steps = np.diff(positions)
+        assert np.all(steps >= 0.0)
+        assert np.max(steps) < 1.0 / FPS / 4
+
+    def test_absolute_first_target(self) -> None:
+        interpolator = MouseInterpolator(absolute=True)
+        interpolator.set_target(0.5, 0.25, 10.0)
+
+        assert interpolator.sample(10.0) == (0.5, 0.25)
+
+    def test_absolute_max_interval(self) -> None:
+        interpolator = MouseInterpolator(absolute=True, max_interval=0.1)
+        interpolator.set_target(0.0, 0.0, 0.0)
+        interpolator.set_target(1.0, 1.0, 5.0)
+
+        assert interpolator.sample(5.2) == (1.0, 1.0)
+
+    def test_relative_sub_pixel(self) -> None:
+        interpolator = MouseInterpolator(absolute=False)
+
+        total = np.zeros(2)
+        for i in range(FPS):
+            interpolator.set_target(2.3, -0.7, i / FPS)
+            for j in range(OUTPUT_RATE // FPS):
+                movement = interpolator.sample(i / FPS + j / OUTPUT_RATE)
+                assert all(float(value).is_integer() for value in movement)
+                total += movement
+
+        # Fractions of pixels are not lost, but accumulated
+        np.testing.assert_allclose(total, [2.3 * FPS, -0.7 * FPS], atol=1.0)
+
+    def test_relative_carry_over(self) -> None:
+        interpolator = MouseInterpolator(absolute=False, max_interval=1.0)
+        interpolator.set_target(0.0, 0.0, 0.0)
+        interpolator.set_target(10.0, 0.0, 1.0)
+        first = interpolator.sample(1.5)
+
+        # The movement that was not sampled before the next update is not lost
+        interpolator.set_target(0.0, 0.0, 1.6)
+        second = interpolator.sample(2.6)
+
+        assert first[0] + second[0] == 10.0
@@ -0,0 +1,57 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from cv2.typing import MatLike
+
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker
+
+
+class CountingTracker(PoseTracker):
+    """Counts the updates instead of tracking"""
+
+    def __init__(self) -> None:
+        self.updates = 0
+
+    def update(self, detections: PoseDetections, frame: MatLike) -> PoseDetections:
+        self.updates += 1
+        return detections
+
+
+class FrameSizeBackend(PoseBackend):
+    """Returns the width of the frame as inference time to identify results"""
+
+    def predict(self, frame: MatLike) -> PoseDetections:
+        return PoseDetections.empty({"inference": float(frame.shape[1])})
+
+
+class TestPoseBackend:
+    def test_submit_collect(self) -> None:
+        tracker = CountingTracker()
+        backend = FrameSizeBackend(tracker)
+        assert backend.max_pending_frames == 1
+
+        backend.submit(np.zeros((1, 1, 3), dtype=np.uint8))
+        backend.submit(np.zeros((1, 2, 3), dtype=np.uint8))
+        assert backend.collect().speed["inference"] == 1.0
+        assert backend.collect().speed["inference"] == 2.0
+        assert tracker.updates == 2
+
+    def test_empty(self) -> None:
+        detections = PoseDetections.empty()
+        assert len(detections) == 0
+        assert detections.track_ids is not None
+        assert detections.track_ids.shape == (0,)
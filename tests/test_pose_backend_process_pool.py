@@ -0,0 +1,127 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import os
+
+import numpy as np
+import pytest
+import torch
+
+from cv2.typing import MatLike
+
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker
+from pose.backend.process_pool import ProcessPoolBackend
+
+
+class RecordingTracker(PoseTracker):
+    """Records the detections it is updated with instead of tracking"""
+
+    def __init__(self) -> None:
+        self.updates: list[PoseDetections] = []
+
+    def update(self, detections: PoseDetections, frame: MatLike) -> PoseDetections:
+        self.updates.append(detections)
+        return detections
+
+
+class FrameValueBackend(PoseBackend):
+    """Returns the value and width of the frame, the process ID and the number of threads as processing times to identify results"""
+
+    def __init__(self, tracker: PoseTracker, num_threads: int) -> None:
+        super().__init__(tracker)
+        self._num_threads = num_threads
+
+    def predict(self, frame: MatLike) -> PoseDetections:
+        if frame[0, 0, 0] == 255:
+            raise ValueError("invalid frame")
+
+        return PoseDetections.empty(
+            {
+                "value": float(frame[0, 0, 0]),
+                "width": float(frame.shape[1]),
+                "pid": float(os.getpid()),
+                "threads": float(self._num_threads),
+                "torch_threads": float(torch.get_num_threads()),
+            }
+        )
+
+
+def create_backend(num_threads: int) -> PoseBackend:
+    return FrameValueBackend(RecordingTracker(), num_threads)
+
+
+def create_frame(value: int, width: int = 4) -> MatLike:
+    return np.full((2, width, 3), value, dtype=np.uint8)
+
+
+class TestProcessPoolBackend:
+    def test_submit_collect(self) -> None:
+        tracker = RecordingTracker()
+        backend = ProcessPoolBackend(tracker, create_backend, 3)
+        try:
+            assert backend.max_pending_frames == 3
+
+            values = []
+            pids = set()
+            for value in range(10):
+                if value >= backend.max_pending_frames:
+                    detections = backend.collect()
+                    values.append(detections.speed["value"])
+                    pids.add(detections.speed["pid"])
+                backend.submit(create_frame(value))
+
+            for _ in range(backend.max_pending_frames):
+                values.append(backend.collect().speed["value"])
+
+            # Results are returned in the order of the frames and tracked in the main process
+            assert values == list(range(10))
+            assert [detections.speed["value"] for detections in tracker.updates] == values
+            assert len(pids) == 3
+            assert os.getpid() not in pids
+        finally:
+            backend.close()
+
+    def test_frame_size_change(self) -> None:
+        backend = ProcessPoolBackend(RecordingTracker(), create_backend, 1)
+        try:
+            assert backend.predict(create_frame(1, 4)).speed["width"] == 4.0
+            detections = backend.predict(create_frame(2, 8))
+            assert detections.speed["value"] == 2.0
+            assert detections.speed["width"] == 8.0
+            assert backend.predict(create_frame(3, 2)).speed["width"] == 2.0
+        finally:
+            backend.close()
+
+    def test_num_threads(self) -> None:
+        backend = ProcessPoolBackend(RecordingTracker(), create_backend, 2)
+        try:
+            # The threads of the cores are shared between the workers
+            num_threads = float(max(1, (os.cpu_count() or 1) // 2))
+            detections = backend.predict(create_frame(1))
+            assert detections.speed["threads"] == num_threads
+            assert detections.speed["torch_threads"] == num_threads
+        finally:
+            backend.close()
+
+    def test_worker_error(self) -> None:
+        backend = ProcessPoolBackend(RecordingTracker(), create_backend, 1)
+        try:
+            with pytest.raises(RuntimeError, match="invalid frame"):
+                backend.predict(create_frame(255))
+
+            # The worker keeps running after an error
+            assert backend.predict(create_frame(1)).speed["value"] == 1.0
+        finally:
+            backend.close()
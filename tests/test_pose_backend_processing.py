@@ -0,0 +1,92 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import numpy.typing as npt
+from pose.backend.processing import decode_predictions, letterbox
+
+
+def make_predictions(rows: list[tuple[float, float, float, float, float]]) -> npt.NDArray[np.float32]:
+    predictions = np.zeros((1, 56, len(rows)), dtype=np.float32)
+    for i, (x, y, width, height, conf) in enumerate(rows):
+        predictions[0, :5, i] = [x, y, width, height, conf]
+        predictions[0, 5::3, i] = x
+        predictions[0, 6::3, i] = y
+        predictions[0, 7::3, i] = conf
+    return predictions
+
+
+class TestLetterbox:
+    def test_landscape(self) -> None:
+        frame = np.full((360, 640, 3), 255, dtype=np.uint8)
+        tensor, scale, padding = letterbox(frame, 640)
+        assert tensor.shape == (1, 3, 640, 640)
+        assert tensor.dtype == np.float32
+        assert scale == 1.0
+        assert padding == (0, 140)
+        np.testing.assert_allclose(tensor[0, :, 0, 0], 114 / 255, rtol=1e-6)
+        np.testing.assert_allclose(tensor[0, :, 140, 0], 1.0)
+        np.testing.assert_allclose(tensor[0, :, 499, 639], 1.0)
+        np.testing.assert_allclose(tensor[0, :, 500, 0], 114 / 255, rtol=1e-6)
+
+    def test_rgb(self) -> None:
+        frame = np.zeros((640, 640, 3), dtype=np.uint8)
+        frame[..., 0] = 255
+        tensor, _, _ = letterbox(frame, 640)
+        np.testing.assert_equal(tensor[0, :, 0, 0], [0.0, 0.0, 1.0])
+
+    def test_scale(self) -> None:
+        tensor, scale, padding = letterbox(np.zeros((720, 1280, 3), dtype=np.uint8), 640)
+        assert tensor.shape == (1, 3, 640, 640)
+        assert scale == 0.5
+        assert padding == (0, 140)
+
+
+class TestDecodePredictions:
+    def test_decode(self) -> None:
+        predictions = make_predictions([(320.0, 320.0, 100.0, 200.0, 0.9)])
+        detections = decode_predictions(predictions, (720, 1280, 3), 0.5, (0, 140), 0.5)
+        assert len(detections) == 1
+        np.testing.assert_allclose(detections.bboxes, [[540.0, 160.0, 740.0, 560.0]])
+        np.testing.assert_allclose(detections.scores, [0.9])
+        assert detections.keypoints.shape == (1, 17, 2)
+        np.testing.assert_allclose(detections.keypoints[0, 0], [640.0, 360.0])
+        np.testing.assert_allclose(detections.keypoints_scores, np.full((1, 17), 0.9))
+        assert detections.track_ids is None
+
+    def test_min_bbox_conf(self) -> None:
+        predictions = make_predictions([(320.0, 320.0, 100.0, 200.0, 0.9), (100.0, 320.0, 100.0, 200.0, 0.3)])
+        detections = decode_predictions(predictions, (640, 640, 3), 1.0, (0, 0), 0.5)
+        np.testing.assert_allclose(detections.scores, [0.9])
+
+    def test_non_max_suppression(self) -> None:
+        predictions = make_predictions(
+            [(320.0, 320.0, 100.0, 200.0, 0.8), (322.0, 320.0, 100.0, 200.0, 0.9), (100.0, 320.0, 100.0, 200.0, 0.7)]
+        )
+        detections = decode_predictions(predictions, (640, 640, 3), 1.0, (0, 0), 0.5)
+        np.testing.assert_allclose(detections.scores, [0.9, 0.7])
+        np.testing.assert_allclose(detections.bboxes[:, 0], [272.0, 50.0])
+
+    def test_clip(self) -> None:
+        predictions = make_predictions([(10.0, 630.0, 100.0, 100.0, 0.9)])
+        detections = decode_predictions(predictions, (640, 640, 3), 1.0, (0, 0), 0.5)
+        np.testing.assert_allclose(detections.bboxes, [[0.0, 580.0, 60.0, 640.0]])
+
+    def test_empty(self) -> None:
+        detections = decode_predictions(np.zeros((1, 56, 10), dtype=np.float32), (640, 640, 3), 1.0, (0, 0), 0.5)
+        assert len(detections) == 0
+        assert detections.bboxes.shape == (0, 4)
+        assert detections.keypoints.shape == (0, 17, 2)
+        assert detections.keypoints_scores.shape == (0, 17)
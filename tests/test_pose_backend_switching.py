@@ -0,0 +1,116 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from cv2.typing import MatLike
+
+from pose.backend.base import PoseBackend, PoseDetections, PoseTracker
+from pose.backend.switching import LATENCY_EXPIRY_WINDOWS, ModelSwitchingBackend
+
+MODELS = ["n", "s", "m"]
+WINDOW_SIZE = 20
+
+
+class SharedTracker(PoseTracker):
+    def __init__(self) -> None:
+        self.updated_by: list[float] = []
+
+    def update(self, detections: PoseDetections, frame: MatLike) -> PoseDetections:
+        self.updated_by.append(detections.speed["model"])
+        return detections
+
+
+class NamedBackend(PoseBackend):
+    def __init__(self, tracker: PoseTracker, name: str) -> None:
+        super().__init__(tracker)
+        self._name = name
+
+    def predict(self, frame: MatLike) -> PoseDetections:
+        detections = PoseDetections.empty()
+        detections.speed["model"] = float(MODELS.index(self._name))
+        return detections
+
+
+def create_backend(initial_model: str = "m") -> tuple[ModelSwitchingBackend, SharedTracker]:
+    tracker = SharedTracker()
+    backends: list[PoseBackend] = [NamedBackend(tracker, model) for model in MODELS]
+    return ModelSwitchingBackend(tracker, MODELS, backends, initial_model, 50.0, WINDOW_SIZE, 0.5), tracker
+
+
+def record(backend: ModelSwitchingBackend, latency: float, num_frames: int = WINDOW_SIZE) -> None:
+    for _ in range(num_frames):
+        backend._record_latency(latency)  # pylint: disable=protected-access
+
+
+class TestModelSwitchingBackend:
+    def test_shared_tracker(self) -> None:
+        backend, tracker = create_backend("m")
+        frame = np.zeros((1, 1, 3), dtype=np.uint8)
+        backend.track(frame)
+        record(backend, 100.0)
+        backend.track(frame)
+        assert backend.model == "s"
+        assert tracker.updated_by == [2.0, 1.0]
+
+    def test_downscale(self) -> None:
+        backend, _ = create_backend("m")
+        record(backend, 60.0, WINDOW_SIZE - 1)
+        assert backend.model == "m"
+        record(backend, 60.0, 1)
+        assert backend.model == "s"
+        record(backend, 60.0)
+        assert backend.model == "n"
+        record(backend, 60.0)
+        assert backend.model == "n"
+
+    def test_p95(self) -> None:
+        backend, _ = create_backend("m")
+        record(backend, 40.0, WINDOW_SIZE - 1)
+        record(backend, 200.0, 1)
+        assert backend.model == "m"
+
+    def test_upscale(self) -> None:
+        backend, _ = create_backend("n")
+        record(backend, 20.0)
+        assert backend.model == "s"
+        record(backend, 20.0)
+        assert backend.model == "m"
+
+    def test_hysteresis(self) -> None:
+        backend, _ = create_backend("n")
+        record(backend, 30.0)
+        assert backend.model == "n"
+
+    def test_no_upscale_to_slow_model(self) -> None:
+        backend, _ = create_backend("s")
+        record(backend, 20.0)
+        assert backend.model == "m"
+        record(backend, 80.0)
+        assert backend.model == "s"
+        record(backend, 20.0)
+        assert backend.model == "s"
+
+    def test_upscale_after_load_spike(self) -> None:
+        backend, _ = create_backend("m")
+        record(backend, 80.0)
+        assert backend.model == "s"
+
+        # The latency of the larger model during the load spike expires, so it is tried again once the load is over
+        for _ in range(LATENCY_EXPIRY_WINDOWS - 1):
+            record(backend, 20.0)
+        assert backend.model == "s"
+        record(backend, 20.0)
+        assert backend.model == "m"
@@ -0,0 +1,198 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+import time
+
+import cv2
+import numpy as np
+
+from cv2.typing import MatLike
+
+from pose.camera import Camera, CameraConfig, FramePool
+
+SHAPE = (4, 6, 3)
+NUM_FRAMES = 10
+
+
+def decode(image: MatLike | None) -> tuple[bool, MatLike]:
+    if image is None or image.shape != SHAPE:
+        image = np.empty(SHAPE, dtype=np.uint8)
+    image[...] = 1
+    return True, image
+
+
+def write_video(path: Path) -> Path:
+    file_path = path / "video.avi"
+    writer = cv2.VideoWriter(str(file_path), cv2.VideoWriter.fourcc(*"MJPG"), 30, (64, 48))
+    for i in range(NUM_FRAMES):
+        writer.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+    writer.release()
+
+    return file_path
+
+
+def write_images(path: Path) -> Path:
+    for i in range(NUM_FRAMES):
+        cv2.imwrite(str(path / f"{i:04d}.png"), np.full((48, 64, 3), i * 20, dtype=np.uint8))
+
+    return path
+
+
+def read_all(camera: Camera) -> list[MatLike]:
+    images = []
+    while camera.is_opened():
+        frame = camera.read()
+        if frame is None:
+            break
+
+        with frame:
+            images.append(frame.image.copy())
+
+    camera.release()
+
+    return images
+
+
+def decode_fail(image: MatLike | None) -> tuple[bool, MatLike]:
+    return False, np.empty(0)
+
+
+class TestFramePool:
+    def test_reuse(self) -> None:
+        pool = FramePool(2, SHAPE)
+
+        frame1 = pool.lease(decode)
+        assert frame1 is not None
+        frame1.release()
+
+        frame2 = pool.lease(decode)
+        assert frame2 is not None
+        assert frame2.image is not frame1.image
+        frame2.release()
+
+        frame3 = pool.lease(decode)
+        assert frame3 is not None
+        assert frame3.image is frame1.image
+        np.testing.assert_equal(frame3.image, np.ones(SHAPE))
+
+    def test_retain(self) -> None:
+        pool = FramePool(1, SHAPE)
+
+        frame1 = pool.lease(decode)
+        assert frame1 is not None
+        frame1.retain()
+        frame1.release()
+
+        frame2 = pool.lease(decode)
+        assert frame2 is not None
+        assert frame2.image is not frame1.image
+        assert pool.overflows == 1
+
+        frame1.release()
+
+        frame3 = pool.lease(decode)
+        assert frame3 is not None
+        assert frame3.image is frame1.image
+        assert pool.overflows == 1
+
+    def test_context_manager(self) -> None:
+        pool = FramePool(1, SHAPE)
+
+        with pool.lease(decode) as frame1:  # type: ignore[union-attr]
+            pass
+
+        frame2 = pool.lease(decode)
+        assert frame2 is not None
+        assert frame2.image is frame1.image
+        assert pool.overflows == 0
+
+    def test_shape_mismatch(self) -> None:
+        pool = FramePool(1, (1, 1, 3))
+
+        frame1 = pool.lease(decode)
+        assert frame1 is not None
+        assert frame1.image.shape == SHAPE
+        frame1.release()
+
+        frame2 = pool.lease(decode)
+        assert frame2 is not None
+        assert frame2.image is frame1.image
+
+    def test_decode_failed(self) -> None:
+        pool = FramePool(1, SHAPE)
+
+        assert pool.lease(decode_fail) is None
+
+        frame = pool.lease(decode)
+        assert frame is not None
+        assert pool.overflows == 0
+
+
+class TestCamera:
+    def test_video_file(self, tmp_path: Path) -> None:
+        camera = Camera(CameraConfig(file=str(write_video(tmp_path)), playback="fast"))
+
+        assert camera.width == 64
+        assert camera.height == 48
+        assert camera.fps == 30
+
+        images = read_all(camera)
+
+        assert len(images) == NUM_FRAMES
+        assert images[0].shape == (48, 64, 3)
+
+    def test_timestamps(self, tmp_path: Path) -> None:
+        camera = Camera(CameraConfig(file=str(write_images(tmp_path)), playback="fixed", fps=100))
+
+        timestamps = []
+        while (frame := camera.read()) is not None:
+            with frame:
+                timestamps.append(frame.timestamp)
+        camera.release()
+
+        np.testing.assert_allclose(timestamps, np.arange(NUM_FRAMES) / 100)
+
+    def test_image_sequence(self, tmp_path: Path) -> None:
+        camera = Camera(CameraConfig(file=str(write_images(tmp_path)), playback="fast"))
+
+        assert camera.width == 64
+        assert camera.height == 48
+        assert camera.format_fourcc == "PNG "
+
+        images = read_all(camera)
+
+        assert len(images) == NUM_FRAMES
+        np.testing.assert_equal([image[0, 0, 0] for image in images], [i * 20 for i in range(NUM_FRAMES)])
+
+    def test_fixed_playback(self, tmp_path: Path) -> None:
+        camera = Camera(CameraConfig(file=str(write_images(tmp_path)), playback="fixed", fps=200))
+
+        assert camera.fps == 200
+
+        start = time.perf_counter()
+        images = read_all(camera)
+        duration = time.perf_counter() - start
+
+        assert len(images) == NUM_FRAMES
+        assert duration >= (NUM_FRAMES - 1) / 200
+
+    def test_threaded(self, tmp_path: Path) -> None:
+        camera = Camera(CameraConfig(file=str(write_video(tmp_path)), playback="realtime", threaded=True))
+
+        images = read_all(camera)
+
+        assert len(images) >= 1
+        assert len(images) + camera.dropped_frames == NUM_FRAMES
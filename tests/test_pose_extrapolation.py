@@ -0,0 +1,96 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import numpy.typing as npt
+
+from pose.extrapolation import InferenceScheduler, KeypointExtrapolator
+
+
+def keypoints(value: float) -> npt.NDArray[np.float64]:
+    return np.full((17, 2), value)
+
+
+class TestInferenceScheduler:
+    def test_infer_until_latency_known(self) -> None:
+        scheduler = InferenceScheduler(0.5)
+        assert all(scheduler.is_due(timestamp) for timestamp in [0.0, 0.01, 0.02])
+
+    def test_budget(self) -> None:
+        scheduler = InferenceScheduler(0.25)
+        scheduler.record_latency(0.125)
+        inferred = [timestamp for timestamp in np.arange(0, 16) * 0.125 if scheduler.is_due(float(timestamp))]
+        assert inferred == [0.0, 0.5, 1.0, 1.5]
+
+    def test_full_budget(self) -> None:
+        scheduler = InferenceScheduler(1.0)
+        scheduler.record_latency(0.125)
+        assert all(scheduler.is_due(float(timestamp)) for timestamp in np.arange(1, 10) * 0.125)
+
+
+class TestKeypointExtrapolator:
+    def test_no_observations(self) -> None:
+        extrapolator = KeypointExtrapolator(0.5, "velocity", 0.9, 1.0)
+        xy, conf = extrapolator.predict(0.0)
+        np.testing.assert_equal(xy, keypoints(0.0))
+        np.testing.assert_equal(conf, np.zeros((17,)))
+
+    def test_single_observation(self) -> None:
+        extrapolator = KeypointExtrapolator(0.5, "velocity", 0.9, 1.0)
+        extrapolator.update(keypoints(1.0), np.ones((17,)), 0.0)
+        xy, conf = extrapolator.predict(0.5)
+        np.testing.assert_equal(xy, keypoints(1.0))
+        np.testing.assert_allclose(conf, np.full((17,), 0.9))
+
+    def test_velocity(self) -> None:
+        extrapolator = KeypointExtrapolator(0.5, "velocity", 0.9, 1.0)
+        for t in [0.0, 0.1, 0.2]:
+            extrapolator.update(keypoints(t**2), np.ones((17,)), t)
+        xy, _ = extrapolator.predict(0.3)
+        np.testing.assert_allclose(xy, keypoints(0.07))
+
+    def test_acceleration(self) -> None:
+        extrapolator = KeypointExtrapolator(0.5, "acceleration", 0.9, 1.0)
+        for t in [0.0, 0.1, 0.2]:
+            extrapolator.update(keypoints(t**2), np.ones((17,)), t)
+        xy, _ = extrapolator.predict(0.3)
+        np.testing.assert_allclose(xy, keypoints(0.09))
+
+    def test_invisible(self) -> None:
+        extrapolator = KeypointExtrapolator(0.5, "velocity", 0.9, 1.0)
+        conf = np.ones((17,))
+        conf[0] = 0.0
+        extrapolator.update(keypoints(0.0), conf, 0.0)
+        extrapolator.update(keypoints(1.0), np.ones((17,)), 1.0)
+        xy, _ = extrapolator.predict(2.0)
+        np.testing.assert_equal(xy[0], [1.0, 1.0])
+        np.testing.assert_equal(xy[1], [2.0, 2.0])
+
+    def test_max_time(self) -> None:
+        extrapolator = KeypointExtrapolator(0.5, "velocity", 0.9, 0.1)
+        extrapolator.update(keypoints(0.0), np.ones((17,)), 0.0)
+        extrapolator.update(keypoints(1.0), np.ones((17,)), 1.0)
+        xy, conf = extrapolator.predict(1.2)
+        np.testing.assert_equal(xy, keypoints(1.0))
+        np.testing.assert_equal(conf, np.zeros((17,)))
+
+    def test_reset(self) -> None:
+        extrapolator = KeypointExtrapolator(0.5, "velocity", 0.9, 1.0)
+        extrapolator.update(keypoints(0.0), np.ones((17,)), 0.0)
+        extrapolator.update(keypoints(1.0), np.ones((17,)), 1.0)
+        extrapolator.reset()
+        extrapolator.update(keypoints(5.0), np.ones((17,)), 1.5)
+        xy, _ = extrapolator.predict(2.0)
+        np.testing.assert_equal(xy, keypoints(5.0))
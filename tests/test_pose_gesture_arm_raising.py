@@ -15,7 +15,7 @@
 
 import numpy as np
 
-from pose.gesture.arm_raising import ArmRaising
+from pose.gesture.arm_raising import ArmRaising, detect_arm_raising
 from tests.utils.pose import Pose
 from utils.side import Side
 
@@ -80,3 +80,22 @@ class TestRightArm:
         result = arm_raising.parse_keypoints(pose.keypoints)
 
         assert result.detected is False
+
+
+class TestVectorized:
+    def test_matches_gesture(self) -> None:
+        poses = [Pose() for _ in range(4)]
+        poses[1].left_wrist = np.array([0.7, 0.00, 1.0])
+        poses[2].right_wrist = np.array([0.3, 0.00, 1.0])
+        poses[3].right_wrist = np.array([0.3, 0.00, 0.5])
+
+        keypoints = np.array([pose.keypoints.xy for pose in poses])
+        keypoints_scores = np.array([pose.keypoints.conf for pose in poses])
+
+        for side in Side:
+            arm_raising = ArmRaising(MIN_KEYPOINT_CONF, side)
+            expected = [arm_raising.parse_keypoints(pose.keypoints).detected for pose in poses]
+
+            detected = detect_arm_raising(keypoints, keypoints_scores, MIN_KEYPOINT_CONF, side)
+
+            assert detected.tolist() == expected
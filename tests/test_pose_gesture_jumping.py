@@ -47,6 +47,30 @@ class TestJumping:
 
         assert result.detected is True
 
+    def test_timestamps(self) -> None:
+        pose = Pose()
+        jumping = Jumping(MIN_KEYPOINT_CONF)
+        jumping.set_shoulder_width(0.4)
+
+        for i, y in enumerate(np.linspace(0.7, 0.2, 10)):
+            pose.left_hip = np.array([0.6, y, 1.0])
+            pose.right_hip = np.array([0.4, y, 1.0])
+            result = jumping.parse_keypoints(pose.keypoints, timestamp=i / 30)
+
+        assert result.detected is True
+
+    def test_not_detected_slow_movement(self) -> None:
+        pose = Pose()
+        jumping = Jumping(MIN_KEYPOINT_CONF)
+        jumping.set_shoulder_width(0.4)
+
+        for i, y in enumerate(np.linspace(0.7, 0.2, 10)):
+            pose.left_hip = np.array([0.6, y, 1.0])
+            pose.right_hip = np.array([0.4, y, 1.0])
+            result = jumping.parse_keypoints(pose.keypoints, timestamp=float(i))
+
+        assert result.detected is False
+
     def test_not_detected_no_movement(self) -> None:
         pose = Pose()
         jumping = Jumping(MIN_KEYPOINT_CONF)
@@ -133,3 +133,25 @@ class TestKeypoints:
 
         with pytest.raises(AssertionError):
             _ = Keypoints(np.zeros((17, 2)), np.zeros((18,)))
+
+    def test_views(self) -> None:
+        xy = np.zeros((17, 2))
+        conf = np.zeros((17,))
+        keypoints = Keypoints(xy, conf)
+
+        left_wrist = keypoints.left_wrist
+        xy[9] = [0.1, 0.2]
+        conf[9] = 0.9
+
+        assert keypoints.left_wrist is left_wrist
+        assert left_wrist.x == 0.1
+        assert left_wrist.y == 0.2
+        assert left_wrist.conf == 0.9
+
+    def test_default(self) -> None:
+        keypoints1 = Keypoints()
+        keypoints2 = Keypoints()
+
+        keypoints1.xy[0] = [1.0, 1.0]
+
+        np.testing.assert_equal(keypoints2.xy, np.zeros((17, 2)))
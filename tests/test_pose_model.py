@@ -13,8 +13,21 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
+import pickle
+
 import numpy as np
-from pose.model import correct_aspect_ratio, filter_keypoints_at_edge
+import pytest
+
+from pose.backend.base import PoseDetections
+from pose.model import (
+    PoseFrameResult,
+    PoseModel,
+    PoseModelConfig,
+    PosePlayerStats,
+    PoseStats,
+    correct_aspect_ratio,
+    filter_keypoints_at_edge,
+)
 
 
 class TestCorrectAspectRatio:
@@ -44,3 +57,29 @@ class TestFilterKeypointsAtEdge:
             np.array([[[0.5], [0.5], [0.5], [0.5], [0.5]]]),
         )
         np.testing.assert_equal(keypoints_scores, [[[0.5], [0.0], [0.0], [0.0], [0.0]]])
+
+
+class TestPoseFrameResult:
+    def test_pickle(self) -> None:
+        detections = PoseDetections.empty({"inference": 1.0})
+        pose_result = PoseFrameResult(detections, PoseStats([1], [PosePlayerStats(2, True, None)]))
+
+        # Only arrays and plain values are stored, so the result is small
+        data = pickle.dumps(pose_result)
+        assert len(data) < 2048
+
+        restored = pickle.loads(data)
+        assert restored.stats == pose_result.stats
+        assert restored.detections.speed == {"inference": 1.0}
+        np.testing.assert_equal(restored.detections.keypoints, detections.keypoints)
+
+
+class TestPoseModel:
+    def test_extrapolate_without_inference(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # No model is loaded, as no frame is inferred
+        monkeypatch.setattr(PoseModel, "_create_backend", lambda self: None)
+        pose = PoseModel(PoseModelConfig(tracker="lightweight"), max_num_persons=2)
+
+        pose_result = pose.extrapolate(1.0)
+        assert len(pose_result.detections) == 0
+        assert pose_result.stats.player_stats == [PosePlayerStats(None, False, None), PosePlayerStats(None, False, None)]
@@ -0,0 +1,125 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+from pose.gesture.jumping import Jumping
+from pose.gesture.pointing import Pointing
+from pose.gesture.shoulder_width import ShoulderWidth
+from pose.gesture.swiping import Swiping
+from pose.person import PersonBatch
+from tests.utils.pose import Pose
+from utils.side import Side
+
+MIN_KEYPOINT_CONF = 0.8
+
+
+def parse_poses(persons: PersonBatch, poses: list[Pose], timestamp: float) -> None:
+    persons.parse_keypoints(
+        np.array([pose.keypoints.xy for pose in poses]),
+        np.array([pose.keypoints.conf for pose in poses]),
+        timestamp,
+    )
+
+
+class TestPersonBatch:
+    def test_keypoints(self) -> None:
+        pose = Pose()
+        persons = PersonBatch(2, MIN_KEYPOINT_CONF)
+
+        pose.right_wrist = np.array([0.3, 0.00, 1.0])
+        parse_poses(persons, [Pose(), pose], 1.0)
+
+        np.testing.assert_allclose(persons.person[1].keypoints.xy, pose.keypoints.xy)
+        assert persons.person[1].keypoints.right_wrist.y == 0.0
+        assert persons.person[1].timestamp == 1.0
+
+    def test_arm_raising(self) -> None:
+        pose = Pose()
+        persons = PersonBatch(3, MIN_KEYPOINT_CONF)
+
+        pose.left_wrist = np.array([0.7, 0.00, 1.0])
+        parse_poses(persons, [Pose(), pose, Pose()], 1.0)
+
+        assert [person.left_arm_raising.detected for person in persons.person] == [False, True, False]
+        assert [person.right_arm_raising.detected for person in persons.person] == [False, False, False]
+
+    def test_matches_gestures(self) -> None:
+        poses = [Pose() for _ in range(3)]
+        persons = PersonBatch(len(poses), MIN_KEYPOINT_CONF)
+        persons.person[2].set_right_hand_swiping_sensitivity(0.3)
+
+        shoulder_widths = [ShoulderWidth(MIN_KEYPOINT_CONF) for _ in poses]
+        jumpings = [Jumping(MIN_KEYPOINT_CONF) for _ in poses]
+        pointings = [Pointing(MIN_KEYPOINT_CONF, Side.RIGHT) for _ in poses]
+        swipings = [Swiping(MIN_KEYPOINT_CONF, Side.RIGHT) for _ in poses]
+        swipings[2].set_sensitivity(0.3)
+
+        for i, timestamp in enumerate(np.linspace(0.0, 1.0, 30)):
+            poses[0].left_hip[1] = poses[0].right_hip[1] = 0.5 - 0.01 * i
+            poses[1].right_wrist[0] = 0.1 + 0.02 * i
+            poses[2].right_wrist[:2] = [0.3 + 0.01 * i, 0.4 - 0.01 * i]
+            poses[2].right_wrist[2] = 1.0 if i % 7 != 0 else 0.0
+            parse_poses(persons, poses, timestamp)
+
+            for person, pose, shoulder_width, jumping, pointing, swiping in zip(
+                persons.person, poses, shoulder_widths, jumpings, pointings, swipings
+            ):
+                width = shoulder_width.parse_keypoints(pose.keypoints, timestamp).width
+                jumping.set_shoulder_width(width)
+                pointing.set_shoulder_width(width)
+                swiping.set_shoulder_width(width)
+
+                assert person.shoulder_width.width == width
+                assert person.jumping == jumping.parse_keypoints(pose.keypoints, timestamp)
+                expected_pointing = pointing.parse_keypoints(pose.keypoints, timestamp)
+                assert person.right_hand_pointing.detected == expected_pointing.detected
+                assert person.right_hand_pointing.selecting == expected_pointing.selecting
+                np.testing.assert_allclose(person.right_hand_pointing.xy, expected_pointing.xy)
+                assert person.right_hand_swiping == swiping.parse_keypoints(pose.keypoints, timestamp)
+
+    def test_cache(self) -> None:
+        persons = PersonBatch(2, MIN_KEYPOINT_CONF)
+
+        parse_poses(persons, [Pose(), Pose()], 1.0)
+
+        assert persons.steering is persons.steering
+        result = persons.steering
+
+        parse_poses(persons, [Pose(), Pose()], 2.0)
+
+        assert persons.steering is not result
+
+    def test_plan(self) -> None:
+        persons = PersonBatch(1, MIN_KEYPOINT_CONF, ["steering"])
+
+        assert persons.plan == ["shoulder_width", "steering"]
+
+        parse_poses(persons, [Pose()], 1.0)
+
+        assert [func.__name__ for func in persons.cache] == ["shoulder_width", "steering"]
+
+    def test_plan_discovery(self) -> None:
+        persons = PersonBatch(1, MIN_KEYPOINT_CONF)
+
+        parse_poses(persons, [Pose()], 1.0)
+        _ = persons.person[0].jumping
+
+        assert persons.plan == ["shoulder_width", "jumping"]
+
+    def test_plan_unknown_gesture(self) -> None:
+        with pytest.raises(ValueError):
+            PersonBatch(1, MIN_KEYPOINT_CONF, ["waving"])  # type: ignore[list-item]
@@ -13,9 +13,16 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
+from typing import Any, get_args
+
+import cv2
 import numpy as np
+import pytest
 
-from pose.plotting import get_player_color
+from pose.backend.base import PoseDetections
+from pose.model import PoseFrameResult, PosePlayerStats, PoseStats
+from pose.plotting import JOIN_INSTRUCTIONS, annotate_frame, get_player_color
+from pose.tracking import JoinGesture
 
 
 class TestPlayerColor:
@@ -28,3 +35,34 @@ class TestPlayerColor:
         np.testing.assert_equal(get_player_color(5), (0, 0, 200))
         np.testing.assert_equal(get_player_color(6), (0, 200, 200))
         np.testing.assert_equal(get_player_color(7), (0, 200, 0))
+
+
+class TestAnnotateFrame:
+    @pytest.mark.parametrize("join_gesture", get_args(JoinGesture))
+    def test_footer(self, join_gesture: JoinGesture, monkeypatch: pytest.MonkeyPatch) -> None:
+        texts: list[str] = []
+        put_text = cv2.putText
+
+        def record_text(frame: Any, text: str, *args: Any, **kwargs: Any) -> Any:
+            texts.append(text)
+            return put_text(frame, text, *args, **kwargs)
+
+        monkeypatch.setattr(cv2, "putText", record_text)
+
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+        pose_result = PoseFrameResult(
+            PoseDetections.empty(),
+            PoseStats([], [PosePlayerStats(None, False, None), PosePlayerStats(None, False, None)]),
+        )
+
+        annotate_frame(frame, pose_result, 0.8, 2, join_gesture)
+
+        np.testing.assert_equal(frame[-1, 0], get_player_color(0))
+        np.testing.assert_equal(frame[-1, -1], get_player_color(1))
+
+        # Only the first free slot shows the instruction of the configured join gesture
+        assert JOIN_INSTRUCTIONS[join_gesture] in texts
+        assert "not assigned" in texts
+
+    def test_join_instructions(self) -> None:
+        assert set(JOIN_INSTRUCTIONS) == set(get_args(JoinGesture))
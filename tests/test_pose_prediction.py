@@ -0,0 +1,116 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from pose.prediction import KeypointPredictor
+
+MIN_KEYPOINT_CONF = 0.8
+FPS = 30
+LATENCY = 0.08
+
+
+class TestKeypointPredictor:
+    def test_no_latency(self) -> None:
+        predictor = KeypointPredictor(1, MIN_KEYPOINT_CONF, 10.0, 0.005, 0.15)
+        keypoints_scores = np.ones((1, 17))
+
+        for i in range(FPS):
+            keypoints = np.full((1, 17, 2), 0.5)
+            predictor.update(keypoints, keypoints_scores, i / FPS)
+
+        np.testing.assert_allclose(predictor.predict(keypoints, 1.0), keypoints)
+
+    def test_moving_with_noise(self) -> None:
+        rng = np.random.default_rng(0)
+        predictor = KeypointPredictor(2, MIN_KEYPOINT_CONF, 10.0, 0.005, 0.15)
+        predictor.record_latency(LATENCY)
+        keypoints_scores = np.ones((2, 17))
+
+        raw_errors = []
+        predicted_errors = []
+        for i in range(3 * FPS):
+            timestamp = i / FPS
+            keypoints = np.full((2, 17, 2), 0.2 * np.sin(2.0 * np.pi * timestamp)) + rng.normal(0.0, 0.003, (2, 17, 2))
+            predictor.update(keypoints, keypoints_scores, timestamp)
+            predicted = predictor.predict(keypoints, timestamp)
+
+            if i >= FPS:
+                target = 0.2 * np.sin(2.0 * np.pi * (timestamp + LATENCY))
+                raw_errors.append(keypoints - target)
+                predicted_errors.append(predicted - target)
+
+        assert np.sqrt(np.mean(np.square(predicted_errors))) < np.sqrt(np.mean(np.square(raw_errors))) / 2
+
+    def test_latency(self) -> None:
+        predictor = KeypointPredictor(1, MIN_KEYPOINT_CONF, 10.0, 0.005, 0.15)
+        assert predictor.latency == 0.0
+
+        predictor.record_latency(0.1)
+        assert predictor.latency == 0.1
+
+        # The latency is smoothed
+        predictor.record_latency(0.2)
+        assert 0.1 < predictor.latency < 0.2
+
+    def test_max_time(self) -> None:
+        predictor = KeypointPredictor(1, MIN_KEYPOINT_CONF, 10.0, 0.001, 0.05)
+        predictor.record_latency(1.0)
+        keypoints_scores = np.ones((1, 17))
+
+        for i in range(FPS):
+            keypoints = np.full((1, 17, 2), i / FPS)
+            predictor.update(keypoints, keypoints_scores, i / FPS)
+
+        np.testing.assert_allclose(predictor.predict(keypoints, (FPS - 1) / FPS), keypoints + 0.05, atol=1e-3)
+
+    def test_invisible(self) -> None:
+        predictor = KeypointPredictor(1, MIN_KEYPOINT_CONF, 10.0, 0.001, 0.15)
+        predictor.record_latency(LATENCY)
+        keypoints_scores = np.ones((1, 17))
+
+        for i in range(FPS):
+            predictor.update(np.full((1, 17, 2), i / FPS), keypoints_scores, i / FPS)
+
+        keypoints_scores[0, 0] = 0.0
+        keypoints = np.full((1, 17, 2), 1.0)
+        predictor.update(keypoints, keypoints_scores, 1.0)
+        predicted = predictor.predict(keypoints, 1.0)
+
+        np.testing.assert_equal(predicted[0, 0], [1.0, 1.0])
+        assert np.all(predicted[0, 1:] > 1.0)
+
+        # The keypoint starts over with an unknown velocity when it is visible again
+        keypoints_scores[0, 0] = 1.0
+        keypoints = np.full((1, 17, 2), 1.1)
+        predictor.update(keypoints, keypoints_scores, 1.1)
+
+        np.testing.assert_equal(predictor.predict(keypoints, 1.1)[0, 0], [1.1, 1.1])
+
+    def test_reset(self) -> None:
+        predictor = KeypointPredictor(2, MIN_KEYPOINT_CONF, 10.0, 0.001, 0.15)
+        predictor.record_latency(LATENCY)
+        keypoints_scores = np.ones((2, 17))
+
+        for i in range(FPS):
+            predictor.update(np.full((2, 17, 2), i / FPS), keypoints_scores, i / FPS)
+
+        predictor.reset(np.array([True, False]))
+        keypoints = np.full((2, 17, 2), 1.0)
+        predictor.update(keypoints, keypoints_scores, 1.0)
+        predicted = predictor.predict(keypoints, 1.0)
+
+        np.testing.assert_equal(predicted[0], np.ones((17, 2)))
+        assert np.all(predicted[1] > 1.0)
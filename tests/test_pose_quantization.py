@@ -0,0 +1,111 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+from typing import Any
+
+import cv2
+import numpy as np
+import pytest
+
+from cv2.typing import MatLike
+
+from pose.backend.base import PoseDetections
+from pose.camera import CameraConfig
+
+pytest.importorskip("onnxruntime")
+
+import pose.quantization  # noqa: E402 # pylint: disable=wrong-import-position
+from pose.quantization import compare_detections, quantize_model, read_frames  # noqa: E402 # pylint: disable=wrong-import-position
+
+NUM_FRAMES = 10
+
+
+def make_detections(bboxes: list[list[float]], offset: float = 0.0) -> PoseDetections:
+    keypoints = np.array([np.tile(np.array(bbox[:2]) + offset, (17, 1)) for bbox in bboxes], dtype=np.float32).reshape(-1, 17, 2)
+    return PoseDetections(
+        bboxes=np.array(bboxes, dtype=np.float32).reshape(-1, 4),
+        scores=np.ones(len(bboxes), dtype=np.float32),
+        keypoints=keypoints,
+        keypoints_scores=np.ones((len(bboxes), 17), dtype=np.float32),
+    )
+
+
+class TestQuantizeModel:
+    def test_requantize(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        calibrated: list[int] = []
+
+        def quantize_static(model_input: Path, model_output: Path, reader: Any, **kwargs: Any) -> None:
+            num_frames = 0
+            while reader.get_next() is not None:
+                num_frames += 1
+            calibrated.append(num_frames)
+            model_output.write_bytes(b"int8")
+
+        monkeypatch.setattr(pose.quantization, "export_onnx_model", lambda model_path, model, image_size: model_path / f"{model}.onnx")
+        monkeypatch.setattr(pose.quantization, "quant_pre_process", lambda *args: None)
+        monkeypatch.setattr(pose.quantization, "quantize_static", quantize_static)
+
+        frames: list[MatLike] = [np.zeros((48, 64, 3), dtype=np.uint8)] * 3
+        assert quantize_model(tmp_path, "model", 64, frames[:2]).exists()
+
+        # An existing INT8 model is calibrated again with the new frames
+        assert quantize_model(tmp_path, "model", 64, frames) == tmp_path / "model_int8.onnx"
+        assert calibrated == [2, 3]
+
+
+class TestReadFrames:
+    def test_read_all(self, tmp_path: Path) -> None:
+        for i in range(NUM_FRAMES):
+            cv2.imwrite(str(tmp_path / f"{i:04d}.png"), np.full((48, 64, 3), i * 20, dtype=np.uint8))
+
+        frames = read_frames(CameraConfig(file=str(tmp_path)), 20)
+        assert [int(frame[0, 0, 0]) for frame in frames] == [i * 20 for i in range(NUM_FRAMES)]
+
+    def test_evenly_distributed(self, tmp_path: Path) -> None:
+        for i in range(NUM_FRAMES):
+            cv2.imwrite(str(tmp_path / f"{i:04d}.png"), np.full((48, 64, 3), i * 20, dtype=np.uint8))
+
+        frames = read_frames(CameraConfig(file=str(tmp_path)), 3)
+        assert [int(frame[0, 0, 0]) for frame in frames] == [0, 80, 160]
+
+
+class TestCompareDetections:
+    def test_identical(self) -> None:
+        reference = make_detections([[0.0, 0.0, 10.0, 20.0], [50.0, 0.0, 60.0, 20.0]])
+        similarities, unmatched = compare_detections(reference, reference, 0.5)
+        assert similarities == [1.0, 1.0]
+        assert unmatched == 0
+
+    def test_offset(self) -> None:
+        reference = make_detections([[0.0, 0.0, 10.0, 20.0]])
+        detections = make_detections([[0.0, 0.0, 10.0, 20.0]], offset=1.0)
+        similarities, unmatched = compare_detections(detections, reference, 0.5)
+        assert 0.0 < similarities[0] < 1.0
+        assert unmatched == 0
+
+    def test_missed(self) -> None:
+        reference = make_detections([[0.0, 0.0, 10.0, 20.0], [50.0, 0.0, 60.0, 20.0]])
+        detections = make_detections([[50.0, 0.0, 60.0, 20.0]])
+        similarities, unmatched = compare_detections(detections, reference, 0.5)
+        assert similarities == [1.0]
+        assert unmatched == 1
+
+    def test_no_detections(self) -> None:
+        reference = make_detections([[0.0, 0.0, 10.0, 20.0]])
+        similarities, unmatched = compare_detections(PoseDetections.empty(), reference, 0.5)
+        assert not similarities
+        assert unmatched == 1
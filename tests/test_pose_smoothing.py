@@ -0,0 +1,77 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from pose.smoothing import KeypointSmoother
+
+MIN_KEYPOINT_CONF = 0.8
+FPS = 30
+
+
+class TestKeypointSmoother:
+    def test_jitter(self) -> None:
+        rng = np.random.default_rng(0)
+        smoother = KeypointSmoother(2, MIN_KEYPOINT_CONF, 1.0, 10.0)
+        keypoints_scores = np.ones((2, 17))
+
+        raw = []
+        smoothed = []
+        for i in range(FPS):
+            keypoints = np.full((2, 17, 2), 0.5) + rng.normal(0.0, 0.01, (2, 17, 2))
+            raw.append(keypoints)
+            smoothed.append(smoother(keypoints, keypoints_scores, i / FPS))
+
+        assert np.std(smoothed[FPS // 2 :]) < np.std(raw[FPS // 2 :]) / 2
+
+    def test_fast_movement(self) -> None:
+        smoother = KeypointSmoother(1, MIN_KEYPOINT_CONF, 1.0, 10.0)
+        keypoints_scores = np.ones((1, 17))
+
+        for i in range(FPS):
+            keypoints = np.full((1, 17, 2), 2.0 * i / FPS)
+            smoothed = smoother(keypoints, keypoints_scores, i / FPS)
+
+        # Lags behind by less than two frames at two units per second
+        assert np.all(keypoints - smoothed < 2 * 2.0 / FPS)
+
+    def test_invisible(self) -> None:
+        smoother = KeypointSmoother(1, MIN_KEYPOINT_CONF, 1.0, 0.0)
+        keypoints_scores = np.ones((1, 17))
+
+        smoother(np.zeros((1, 17, 2)), keypoints_scores, 0.0)
+
+        keypoints_scores[0, 0] = 0.0
+        smoothed = smoother(np.ones((1, 17, 2)), keypoints_scores, 0.1)
+
+        np.testing.assert_equal(smoothed[0, 0], [1.0, 1.0])
+        assert np.all(smoothed[0, 1:] < 1.0)
+
+        # The keypoint starts over when it is visible again
+        keypoints_scores[0, 0] = 1.0
+        smoothed = smoother(np.full((1, 17, 2), 2.0), keypoints_scores, 0.2)
+
+        np.testing.assert_equal(smoothed[0, 0], [2.0, 2.0])
+
+    def test_reset(self) -> None:
+        smoother = KeypointSmoother(2, MIN_KEYPOINT_CONF, 1.0, 0.0)
+        keypoints_scores = np.ones((2, 17))
+
+        smoother(np.zeros((2, 17, 2)), keypoints_scores, 0.0)
+        smoother.reset(np.array([True, False]))
+        smoothed = smoother(np.ones((2, 17, 2)), keypoints_scores, 0.1)
+
+        np.testing.assert_equal(smoothed[0], np.ones((17, 2)))
+        assert np.all(smoothed[1] < 1.0)
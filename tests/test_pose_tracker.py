@@ -0,0 +1,98 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from pose.backend.base import PoseDetections
+from pose.tracker import LightweightTracker, UltralyticsTracker
+
+FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+
+
+def make_detections(positions: list[tuple[float, float]]) -> PoseDetections:
+    """Creates persons of 100x200 pixels whose keypoints are spread over the bounding box"""
+    offsets = np.stack([np.linspace(0.0, 100.0, 17), np.linspace(0.0, 200.0, 17)], axis=1)
+    return PoseDetections(
+        bboxes=np.array([[x, y, x + 100.0, y + 200.0] for x, y in positions], dtype=np.float32).reshape(-1, 4),
+        scores=np.full((len(positions),), 0.9, dtype=np.float32),
+        keypoints=np.array([offsets + [x, y] for x, y in positions], dtype=np.float32).reshape(-1, 17, 2),
+        keypoints_scores=np.full((len(positions), 17), 0.9, dtype=np.float32),
+    )
+
+
+def track_ids(tracks: PoseDetections) -> dict[int, int]:
+    """Maps the x position of each tracked person to its track ID"""
+    assert tracks.track_ids is not None
+    return {int(bbox[0]): int(track_id) for bbox, track_id in zip(tracks.bboxes, tracks.track_ids)}
+
+
+class TestLightweightTracker:
+    def test_new_tracks(self) -> None:
+        tracker = LightweightTracker(0.5)
+        tracks = tracker.update(make_detections([(0.0, 0.0), (200.0, 0.0)]), FRAME)
+        assert track_ids(tracks) == {0: 1, 200: 2}
+        assert tracks.track_ids is not None
+        assert tracks.track_ids.dtype == np.int64
+
+    def test_moving(self) -> None:
+        tracker = LightweightTracker(0.5)
+        for i in range(20):
+            tracks = tracker.update(make_detections([(200.0 - i * 10.0, 0.0), (i * 10.0, 0.0)]), FRAME)
+            assert track_ids(tracks) == {int(200.0 - i * 10.0): 1, i * 10: 2}
+
+    def test_detection_order(self) -> None:
+        tracker = LightweightTracker(0.5)
+        tracker.update(make_detections([(0.0, 0.0), (200.0, 0.0)]), FRAME)
+        tracks = tracker.update(make_detections([(205.0, 0.0), (5.0, 0.0)]), FRAME)
+        assert track_ids(tracks) == {5: 1, 205: 2}
+
+    def test_lost(self) -> None:
+        tracker = LightweightTracker(0.5, max_lost_frames=5)
+        tracker.update(make_detections([(0.0, 0.0), (200.0, 0.0)]), FRAME)
+        for _ in range(5):
+            tracker.update(make_detections([(0.0, 0.0)]), FRAME)
+        tracks = tracker.update(make_detections([(0.0, 0.0), (200.0, 0.0)]), FRAME)
+        assert track_ids(tracks) == {0: 1, 200: 2}
+
+    def test_removed(self) -> None:
+        tracker = LightweightTracker(0.5, max_lost_frames=5)
+        tracker.update(make_detections([(0.0, 0.0), (200.0, 0.0)]), FRAME)
+        for _ in range(6):
+            tracker.update(make_detections([(0.0, 0.0)]), FRAME)
+        tracks = tracker.update(make_detections([(0.0, 0.0), (200.0, 0.0)]), FRAME)
+        assert track_ids(tracks) == {0: 1, 200: 3}
+
+    def test_lost_while_moving(self) -> None:
+        tracker = LightweightTracker(0.5)
+        for i in range(5):
+            tracker.update(make_detections([(i * 20.0, 0.0)]), FRAME)
+        for _ in range(5):
+            tracker.update(make_detections([]), FRAME)
+        tracks = tracker.update(make_detections([(200.0, 0.0)]), FRAME)
+        assert track_ids(tracks) == {200: 1}
+
+    def test_empty(self) -> None:
+        tracks = LightweightTracker(0.5).update(make_detections([]), FRAME)
+        assert len(tracks) == 0
+        assert tracks.track_ids is not None
+
+
+class TestUltralyticsTracker:
+    def test_moving(self) -> None:
+        tracker = UltralyticsTracker()
+        for i in range(9):
+            tracks = tracker.update(make_detections([(200.0 - i * 10.0, 0.0), (i * 10.0, 0.0)]), FRAME)
+            # The bounding boxes are smoothed by a Kalman filter, so only their order is compared
+            assert [track_id for _, track_id in sorted(track_ids(tracks).items())] == [2, 1]
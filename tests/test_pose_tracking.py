@@ -206,3 +206,38 @@ class TestTracking:
 
         pose3.right_elbow = np.array([0.2, 0.3, 1.0])
         pose3.right_wrist = np.array([0.1, 0.3, 1.0])
+
+    def test_left_arm_join_gesture(self) -> None:
+        pose1 = Pose()
+        pose2 = Pose()
+        tracking = Tracking(4, MIN_KEYPOINT_CONF, 4.0, "left_arm_raising")
+
+        pose1.right_wrist = np.array([0.3, 0.00, 1.0])
+        pose2.left_wrist = np.array([0.7, 0.00, 1.0])
+
+        track_ids = [1, 2]
+        tracking.retire_tracks(track_ids, timestamp=1.0)
+        unassigned_track_ids = tracking.assign_tracks(
+            track_ids,
+            np.array([pose1.keypoints.xy, pose2.keypoints.xy]),
+            np.array([pose1.keypoints.conf, pose2.keypoints.conf]),
+        )
+        assert unassigned_track_ids == [1]
+        assert tracking.person_to_track == {0: 2}
+
+    def test_no_free_person(self) -> None:
+        poses = [Pose() for _ in range(3)]
+        tracking = Tracking(2, MIN_KEYPOINT_CONF, 4.0)
+
+        for pose in poses:
+            pose.right_wrist = np.array([0.3, 0.00, 1.0])
+
+        track_ids = [5, 3, 7]
+        tracking.retire_tracks(track_ids, timestamp=1.0)
+        unassigned_track_ids = tracking.assign_tracks(
+            track_ids,
+            np.array([pose.keypoints.xy for pose in poses]),
+            np.array([pose.keypoints.conf for pose in poses]),
+        )
+        assert unassigned_track_ids == [7]
+        assert tracking.person_to_track == {0: 5, 1: 3}
@@ -0,0 +1,128 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import time
+
+import pytest
+
+from script.output import OutputScheduler
+from script.plugin import PluginBase
+
+
+class CounterPlugin(PluginBase):
+    """Counts up in every update and records the emitted counts with the emitting thread"""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.count = 0
+        self.emitted: list[int] = []
+        self._fail = fail
+
+    def create(self) -> None:
+        pass
+
+    def pre_update(self) -> None:
+        pass
+
+    def post_update(self) -> None:
+        self.emit(self.snapshot())
+
+    def snapshot(self) -> int:
+        return self.count
+
+    def emit(self, snapshot: int) -> None:
+        if self._fail:
+            raise ValueError("device failed")
+
+        self.emitted.append(snapshot)
+
+    def destroy(self) -> None:
+        pass
+
+
+class UpdateCounterPlugin(PluginBase):
+    """Only implements the abstract methods, so it emits its inputs with `post_update()`"""
+
+    def __init__(self) -> None:
+        self.updates = 0
+
+    def create(self) -> None:
+        pass
+
+    def pre_update(self) -> None:
+        pass
+
+    def post_update(self) -> None:
+        self.updates += 1
+
+    def destroy(self) -> None:
+        pass
+
+
+class TestOutputScheduler:
+    def test_order(self) -> None:
+        plugins = [CounterPlugin(), CounterPlugin()]
+        with OutputScheduler(list(plugins), 1000.0) as scheduler:
+            for i in range(100):
+                for plugin in plugins:
+                    plugin.count = i
+                scheduler.submit()
+
+        # All snapshots are emitted in order, including the ones that are pending when stopping
+        for plugin in plugins:
+            assert plugin.emitted == list(range(100))
+        assert 1 <= scheduler.flushes <= 100
+        assert len(scheduler.latencies) == scheduler.flushes
+
+    def test_snapshot(self) -> None:
+        plugin = CounterPlugin()
+        scheduler = OutputScheduler([plugin], 1000.0)
+        scheduler.submit()
+        plugin.count = 1
+
+        # The snapshot is taken when submitting, not when emitting
+        scheduler.start()
+        scheduler.stop()
+        assert plugin.emitted == [0]
+
+    def test_rate(self) -> None:
+        plugin = CounterPlugin()
+        with OutputScheduler([plugin], 20.0) as scheduler:
+            start = time.perf_counter()
+            while time.perf_counter() - start < 0.5:
+                scheduler.submit()
+                time.sleep(0.001)
+
+        # The snapshots are emitted at the rate of the scheduler instead of the rate they are submitted at
+        assert scheduler.flushes <= 15
+        assert max(scheduler.latencies) >= 0.02
+        assert 0.0 < scheduler.latency < 0.1
+
+    def test_error(self) -> None:
+        with OutputScheduler([CounterPlugin(fail=True)], 1000.0) as scheduler:
+            scheduler.submit()
+            time.sleep(0.05)
+
+            with pytest.raises(RuntimeError, match="emitting inputs failed"):
+                scheduler.submit()
+
+    def test_default_emit(self) -> None:
+        plugin = UpdateCounterPlugin()
+        with OutputScheduler([plugin], 1000.0) as scheduler:
+            for _ in range(3):
+                scheduler.submit()
+
+        # Plugins without snapshots emit their current inputs once per submitted snapshot
+        assert plugin.snapshot() is None
+        assert plugin.updates == 3
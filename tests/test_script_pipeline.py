@@ -0,0 +1,181 @@
+# Copyright (c) 2024, 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+import threading
+import time
+
+from typing import cast
+
+import numpy as np
+
+from pose.backend.base import PoseDetections
+from pose.camera import Camera, Frame
+from pose.model import PoseModel
+from script.pipeline import Pipeline, PipelineConfig, StageQueue
+
+NUM_FRAMES = 40
+INFERENCE_INTERVAL = 4
+
+
+class TestStageQueue:
+    def test_order(self) -> None:
+        queue = StageQueue[int](4, "block")
+        for i in range(4):
+            assert queue.put(i)
+        assert [queue.get() for _ in range(4)] == [0, 1, 2, 3]
+
+    def test_drop_oldest(self) -> None:
+        dropped: list[int] = []
+        queue = StageQueue[int](2, "drop_oldest", on_drop=dropped.append)
+        for i in range(5):
+            assert queue.put(i)
+        assert dropped == [0, 1, 2]
+        assert queue.dropped == 3
+        assert [queue.get(), queue.get()] == [3, 4]
+
+    def test_block(self) -> None:
+        queue = StageQueue[int](1, "block")
+        assert queue.put(0)
+
+        thread = threading.Thread(target=queue.put, args=(1,))
+        thread.start()
+        time.sleep(0.05)
+        assert thread.is_alive()
+
+        assert queue.get() == 0
+        thread.join(timeout=1.0)
+        assert not thread.is_alive()
+        assert queue.get() == 1
+        assert queue.dropped == 0
+
+    def test_close(self) -> None:
+        queue = StageQueue[int](1, "block")
+        assert queue.put(0)
+
+        thread = threading.Thread(target=queue.put, args=(1,))
+        thread.start()
+        queue.close()
+        thread.join(timeout=1.0)
+        assert not thread.is_alive()
+
+        assert queue.get() == 0
+        assert queue.get() is None
+        assert not queue.put(2)
+
+    def test_put_closed_drop_oldest(self) -> None:
+        dropped: list[int] = []
+        queue = StageQueue[int](2, "drop_oldest", on_drop=dropped.append)
+        assert queue.put(0)
+        assert queue.put(1)
+        queue.close()
+
+        # Putting to a full closed queue does not drop the items that are still waiting
+        assert not queue.put(2)
+        assert dropped == []
+        assert queue.dropped == 0
+        assert [queue.get(), queue.get(), queue.get()] == [0, 1, None]
+
+    def test_keep(self) -> None:
+        dropped: list[int] = []
+        queue = StageQueue[int](2, "drop_oldest", on_drop=dropped.append, keep=lambda item: item % 2 == 0)
+        for i in [0, 1, 3, 5, 2, 4]:
+            assert queue.put(i)
+
+        # Odd items are dropped first, then new odd items, and kept items only for newer kept items
+        assert dropped == [1, 3, 5, 0]
+        assert queue.dropped == 4
+        assert [queue.get(), queue.get()] == [2, 4]
+
+    def test_get_waits(self) -> None:
+        queue = StageQueue[int](1, "block")
+        results: list[int | None] = []
+
+        thread = threading.Thread(target=lambda: results.append(queue.get()))
+        thread.start()
+        time.sleep(0.05)
+        queue.put(7)
+        thread.join(timeout=1.0)
+        assert results == [7]
+
+
+class FakeCamera:
+    """Returns frames whose timestamps are their indices and counts how often they are released"""
+
+    def __init__(self) -> None:
+        self.released = [0] * NUM_FRAMES
+        self._next_index = 0
+
+    def is_opened(self) -> bool:
+        return self._next_index < NUM_FRAMES
+
+    def read(self) -> Frame:
+        time.sleep(0.001)
+        index = self._next_index
+        self._next_index += 1
+
+        frame = Frame(np.zeros((2, 2, 3), dtype=np.uint8), float(index))
+        frame.release = lambda: self._release(index)  # type: ignore[method-assign]
+        return frame
+
+    def _release(self, index: int) -> None:
+        self.released[index] += 1
+
+
+class FakePoseModel:
+    """Infers the first frame and then every few frames like adaptive inference and returns the timestamp of the frame as
+    processing time"""
+
+    max_pending_frames = 1
+
+    def __init__(self) -> None:
+        self._last_timestamp: float | None = None
+
+    def is_inference_due(self, timestamp: float) -> bool:
+        if self._last_timestamp is not None and timestamp - self._last_timestamp < INFERENCE_INTERVAL:
+            return False
+
+        self._last_timestamp = timestamp
+        return True
+
+    def submit_frame(self, frame: object) -> None:
+        pass
+
+    def collect_detections(self) -> PoseDetections:
+        assert self._last_timestamp is not None
+        return PoseDetections.empty({"timestamp": self._last_timestamp})
+
+
+class TestPipeline:
+    def test_slow_consumer_adaptive_inference(self) -> None:
+        camera = FakeCamera()
+        items: list[tuple[float, PoseDetections | None]] = []
+
+        with Pipeline(cast(Camera, camera), cast(PoseModel, FakePoseModel()), PipelineConfig(queue_size=2)) as pipeline:
+            # The consumer only starts after all frames were captured and inferred, so the queues overflow
+            time.sleep(0.2)
+            while (item := pipeline.get()) is not None:
+                frame, detections = item
+                items.append((frame.timestamp, detections))
+                frame.release()
+
+        # Frames with detections are kept over extrapolated frames, so the consumer gets the latest inference first
+        assert pipeline.dropped_frames > 0
+        assert len(items) == 2
+        for timestamp, detections in items:
+            assert detections is not None
+            assert detections.speed["timestamp"] == timestamp
+
+        # Every frame is released exactly once, also the dropped ones
+        assert camera.released == [1] * NUM_FRAMES
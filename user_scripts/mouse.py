@@ -19,6 +19,7 @@ from script.base import ScriptBase
 class Mouse(ScriptBase):
     def setup(self) -> None:
         self.max_num_players = 1
+        self.gestures = ["right_hand_pointing"]
 
         self.mouse = self.add_mouse(absolute=True)
 
@@ -19,6 +19,7 @@ from script.base import ScriptBase
 class Navigation(ScriptBase):
     def setup(self) -> None:
         self.max_num_players = 1
+        self.gestures = ["right_hand_swiping"]
 
         self.keyboard = self.add_keyboard()
 
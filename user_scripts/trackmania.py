@@ -21,6 +21,7 @@ from script.base import ScriptBase
 class Trackmania(ScriptBase):
     def setup(self) -> None:
         self.max_num_players = 1
+        self.gestures = ["steering", "right_arm_raising"]
 
         self.gamepad = [self.add_gamepad() for _ in range(self.max_num_players)]
 
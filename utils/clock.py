@@ -0,0 +1,65 @@
+# Copyright (c) 2025 Daniel Stolpmann <dstolpmann@tegtmeier-inkubator.de>
+#
+# This file is part of PosePIE.
+#
+# PosePIE is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# PosePIE is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with PosePIE. If
+# not, see <https://www.gnu.org/licenses/>.
+
+from abc import ABC, abstractmethod
+import time
+
+
+class Clock(ABC):
+    """Source of timestamps in seconds
+
+    Frames are timestamped by the clock of their source when they are captured.
+    These timestamps are passed to all time-based filters, so their result does not depend on the processing time.
+    """
+
+    @abstractmethod
+    def now(self) -> float:
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """Clock that returns the time of the monotonic performance counter of the system"""
+
+    def now(self) -> float:
+        return time.perf_counter()
+
+
+class VirtualClock(Clock):
+    """Clock that only advances when it is told so
+
+    It is used for playing back recordings, so timestamps match the recording and not the playback speed.
+
+    >>> clock = VirtualClock()
+    >>> clock.now()
+    0.0
+    >>> clock.advance(0.5)
+    >>> clock.now()
+    0.5
+    >>> clock.set(2.0)
+    >>> clock.now()
+    2.0
+    """
+
+    def __init__(self, timestamp: float = 0.0) -> None:
+        self._timestamp = timestamp
+
+    def now(self) -> float:
+        return self._timestamp
+
+    def set(self, timestamp: float) -> None:
+        self._timestamp = timestamp
+
+    def advance(self, duration: float) -> None:
+        self._timestamp += duration
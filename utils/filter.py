@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License along with PosePIE. If
 # not, see <https://www.gnu.org/licenses/>.
 
+import math
 import time
 
 from typing import overload
@@ -21,6 +22,9 @@ import numpy as np
 
 import numpy.typing as npt
 
+# Time differences up to this tolerance are treated as zero, like np.isclose(time_diff, 0.0) does
+SIMULTANEOUS_TIME_TOLERANCE = 1e-8
+
 
 class Derivative:
     """Derivative filter
@@ -51,7 +55,15 @@ class Derivative:
         if timestamp is None:
             timestamp = time.perf_counter()
 
-        if self._old_value is not None and self._old_timestamp is not None:
+        diff: npt.NDArray[np.float64] | float
+        if isinstance(value, float) and isinstance(self._old_value, float) and self._old_timestamp is not None:
+            # Fast path for single values, which avoids the overhead of NumPy
+            time_diff = timestamp - self._old_timestamp
+            if abs(time_diff) > SIMULTANEOUS_TIME_TOLERANCE:
+                diff = (value - self._old_value) / time_diff
+            else:
+                diff = np.inf if value != self._old_value else 0.0
+        elif self._old_value is not None and self._old_timestamp is not None:
             time_diff = timestamp - self._old_timestamp
             diff = (
                 (value - self._old_value) / (timestamp - self._old_timestamp)
@@ -112,7 +124,8 @@ class Ewma:
         if self._old_timestamp is not None:
             time_diff = timestamp - self._old_timestamp
 
-            alpha = float(1.0 - np.exp(-time_diff / self._time_constant)) if self._time_constant > 0.0 else 1.0
+            # math.exp is much faster than np.exp for single values
+            alpha = 1.0 - math.exp(-time_diff / self._time_constant) if self._time_constant > 0.0 else 1.0
             self._value = alpha * value + (1 - alpha) * self._value
 
         self._old_timestamp = timestamp
@@ -120,6 +133,203 @@ class Ewma:
         return self._value
 
 
+class FilterBank:
+    """Bank of filters for many independent channels
+
+    Each channel smoothes its value with an EWMA filter like `Ewma`, or its time derivative like `Ewma` after `Derivative`.
+    The state of all channels is stored in contiguous arrays, so all channels are updated at once.
+    Only the channels selected by the mask are updated, while the others keep their state and return their last output.
+
+    :param shape: shape of the filtered value, where the first axis are the channels
+    :param time_constants: time constant of the EWMA filter for all or each channel, where 0 disables the smoothing
+    :param derivative: whether all or each channel filters the time derivative of the value
+
+    >>> bank = FilterBank((2,), time_constants = np.array([1.0, 0.0]), derivative = np.array([False, True]))
+    >>> bank(np.array([0.0, 0.0]), timestamp = 0.0).tolist()
+    [0.0, 0.0]
+    >>> bank(np.array([1.0, 1.0]), timestamp = 1.0).tolist()
+    [0.6321205588285577, 1.0]
+    >>> bank(np.array([2.0, 2.0]), timestamp = 2.0, mask = np.array([True, False])).tolist()
+    [1.4967852755919449, 1.0]
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        time_constants: npt.NDArray[np.float64] | float = 0.0,
+        derivative: npt.NDArray[np.bool_] | bool = False,
+    ) -> None:
+        self._channel_shape = (shape[0],) + (1,) * (len(shape) - 1)
+
+        time_constants = np.broadcast_to(time_constants, (shape[0],))
+        self._unsmoothed = time_constants <= 0.0
+        self._rates = np.divide(1.0, time_constants, out=np.zeros(shape[0]), where=~self._unsmoothed)
+
+        self._derivative = np.broadcast_to(derivative, (shape[0],)).reshape(self._channel_shape)
+        self._any_derivative = bool(self._derivative.any())
+        self._all_derivative = bool(self._derivative.all())
+
+        self._old_timestamp = np.full(shape[0], np.nan)
+        self._old_value = np.zeros(shape)
+        self._value = np.zeros(shape)
+
+    def reset(self, mask: npt.NDArray[np.bool_] | None = None) -> None:
+        """Resets the channels, but keeps their last output until they are updated again"""
+        if mask is None:
+            self._old_timestamp[:] = np.nan
+        else:
+            self._old_timestamp[mask] = np.nan
+
+    def __call__(
+        self,
+        value: npt.NDArray[np.float64],
+        timestamp: float | None = None,
+        mask: npt.NDArray[np.bool_] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        time_diff = timestamp - self._old_timestamp
+        running = ~np.isnan(time_diff)
+
+        if self._any_derivative:
+            value = self._differentiate(value, time_diff, running, mask)
+
+        # Channels that are not smoothed or were reset take the new value, even if their last output is not finite
+        replaced = (~running | self._unsmoothed).reshape(self._channel_shape)
+        alpha = (1.0 - np.exp(-time_diff * self._rates)).reshape(self._channel_shape)
+        value = np.where(replaced, value, alpha * value + (1 - alpha) * self._value)
+
+        if mask is None:
+            self._old_timestamp[:] = timestamp
+        else:
+            self._old_timestamp[mask] = timestamp
+            np.copyto(value, self._value, where=~mask.reshape(self._channel_shape))
+
+        # A new array is returned every time, so the caller can keep it
+        self._value = value
+
+        return value
+
+    def _differentiate(
+        self,
+        value: npt.NDArray[np.float64],
+        time_diff: npt.NDArray[np.float64],
+        running: npt.NDArray[np.bool_],
+        mask: npt.NDArray[np.bool_] | None,
+    ) -> npt.NDArray[np.float64]:
+        simultaneous = running & (np.abs(time_diff) <= SIMULTANEOUS_TIME_TOLERANCE)
+
+        diff: npt.NDArray[np.float64] = (value - self._old_value) / np.where(running & ~simultaneous, time_diff, 1.0).reshape(
+            self._channel_shape
+        )
+        diff[~running] = 0.0
+        if simultaneous.any():
+            changed = np.any(diff[simultaneous].reshape(np.count_nonzero(simultaneous), -1) != 0.0, axis=1)
+            diff[simultaneous] = np.where(changed, np.inf, 0.0).reshape((-1,) + self._channel_shape[1:])
+
+        if mask is None:
+            self._old_value[...] = value
+        else:
+            np.copyto(self._old_value, value, where=mask.reshape(self._channel_shape))
+
+        if self._all_derivative:
+            return diff
+        return np.where(self._derivative, diff, value)
+
+
+class OneEuroFilter:
+    """One Euro filter for many independent channels
+
+    Adaptive low pass filter, whose cutoff frequency increases with the speed of the value.
+    Slow movements are smoothed strongly to remove jitter, while fast movements are followed with little lag.
+    The speed of a channel is the norm of its velocity over the remaining axes.
+    Only the channels selected by the mask are updated, while the others keep their state and return their last output.
+    See: Casiez et al., "1€ Filter: A Simple Speed-based Low-pass Filter for Noisy Input in Interactive Systems", CHI 2012.
+
+    :param shape: shape of the filtered value, where the first axis are the channels
+    :param min_cutoff: cutoff frequency in Hz when the value does not change
+    :param beta: increase of the cutoff frequency in Hz per unit of speed
+    :param derivative_cutoff: cutoff frequency in Hz for smoothing the velocity
+
+    >>> one_euro = OneEuroFilter((2,), min_cutoff = 1.0, beta = 0.0)
+    >>> one_euro(np.array([0.0, 0.0]), timestamp = 0.0).tolist()
+    [0.0, 0.0]
+    >>> one_euro(np.array([1.0, 1.0]), timestamp = 0.1, mask = np.array([True, False])).tolist()
+    [0.3858695450950375, 0.0]
+    """
+
+    def __init__(self, shape: tuple[int, ...], min_cutoff: float = 1.0, beta: float = 0.0, derivative_cutoff: float = 1.0) -> None:
+        assert min_cutoff > 0.0
+        assert beta >= 0.0
+        assert derivative_cutoff > 0.0
+
+        self._min_cutoff = min_cutoff
+        self._beta = beta
+        self._derivative_cutoff = derivative_cutoff
+        self._channel_shape = (shape[0],) + (1,) * (len(shape) - 1)
+
+        self._old_timestamp = np.full(shape[0], np.nan)
+        self._value = np.zeros(shape)
+        self._velocity = np.zeros(shape)
+
+    def reset(self, mask: npt.NDArray[np.bool_] | None = None) -> None:
+        """Resets the channels, but keeps their last output until they are updated again"""
+        if mask is None:
+            self._old_timestamp[:] = np.nan
+        else:
+            self._old_timestamp[mask] = np.nan
+
+    def __call__(
+        self,
+        value: npt.NDArray[np.float64],
+        timestamp: float | None = None,
+        mask: npt.NDArray[np.bool_] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        time_diff = timestamp - self._old_timestamp
+        running = ~np.isnan(time_diff)
+        # Channels without a previous value take the new value, while simultaneous values are ignored
+        replaced = ~running
+        updated = running & (time_diff > SIMULTANEOUS_TIME_TOLERANCE)
+        if mask is not None:
+            replaced &= mask
+            updated &= mask
+
+        time_diff = np.where(updated, time_diff, 1.0).reshape(self._channel_shape)
+
+        velocity_alpha = self._get_alpha(time_diff, self._derivative_cutoff)
+        velocity = velocity_alpha * (value - self._value) / time_diff + (1 - velocity_alpha) * self._velocity
+
+        speed = np.sqrt(np.sum(velocity.reshape(len(velocity), -1) ** 2, axis=1)).reshape(self._channel_shape)
+        alpha = self._get_alpha(time_diff, self._min_cutoff + self._beta * speed)
+        smoothed = alpha * value + (1 - alpha) * self._value
+
+        smoothed = np.where(updated.reshape(self._channel_shape), smoothed, self._value)
+        smoothed = np.where(replaced.reshape(self._channel_shape), value, smoothed)
+        np.copyto(
+            self._velocity,
+            np.where(replaced.reshape(self._channel_shape), 0.0, velocity),
+            where=(updated | replaced).reshape(self._channel_shape),
+        )
+
+        self._old_timestamp[updated | replaced] = timestamp
+
+        # A new array is returned every time, so the caller can keep it
+        self._value = smoothed
+
+        return smoothed
+
+    @staticmethod
+    def _get_alpha(time_diff: npt.NDArray[np.float64], cutoff: npt.NDArray[np.float64] | float) -> npt.NDArray[np.float64]:
+        """Returns the smoothing factor of an exponential filter with the cutoff frequency"""
+        time_constant = 1.0 / (2 * np.pi * cutoff)
+        alpha: npt.NDArray[np.float64] = 1.0 / (1.0 + time_constant / time_diff)
+        return alpha
+
+
 class RisingEdge:
     """Rising edge filter
 